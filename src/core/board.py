@@ -1,14 +1,28 @@
-from random import randint
-from typing import List
+from random import Random
+from typing import Iterable, List, Optional, Set, Tuple
+
+import numpy as np
 
 from src.core.cell import Cell
+from src.core.grid import Grid
+from src.core.neighbours import NeighbourTable
+from src.core.observation import Observation
 
 
 class Board:
-    def __init__(self, width: int, height: int) -> None:
+    """
+    Minesweeper board backed by a packed Grid.
+    Squares are addressed either by (x, y) coordinates or by their flat index y * width + x,
+    Cell objects are only created on demand as views on the grid.
+    The seed drives the board's own random draws, so they can be replayed.
+    """
+
+    def __init__(self, width: int, height: int, seed: Optional[int] = None) -> None:
         self.__width = width
         self.__height = height
-        self.__cells: List[List[Cell]] = [[Cell() for _ in range(width)] for _ in range(height)]
+        self.__grid = Grid(width * height)
+        self.__rng = Random(seed)
+        self.__observation: Optional[Observation] = None
 
     def __repr__(self) -> str:
         return f"Board(width={self.__width}, height={self.__height})"
@@ -20,7 +34,7 @@ class Board:
             return False
         if self.__height != other.height:
             return False
-        if self.__cells != other.cells:
+        if self.__grid != other.grid:
             return False
         return True
 
@@ -35,26 +49,128 @@ class Board:
     def height(self) -> int:
         return self.__height
 
+    @property
+    def size(self) -> int:
+        """Number of squares on the board."""
+        return self.__grid.size
+
+    @property
+    def grid(self) -> Grid:
+        return self.__grid
+
+    @property
+    def neighbours(self) -> NeighbourTable:
+        """Flat indices of the neighbours of each square, see src.core.neighbours."""
+        return self.observation.neighbours
+
+    @property
+    def observation(self) -> Observation:
+        """The board as players may see it, without the mines. Always the same live view."""
+        if self.__observation is None:
+            self.__observation = Observation(self.__grid, self.__width, self.__height)
+        return self.__observation
+
+    @property
+    def rng(self) -> Random:
+        """Random generator of the board's own draws."""
+        return self.__rng
+
     @property
     def cells(self) -> List[List[Cell]]:
-        return self.__cells
+        """Rows of Cell views, built on demand. Prefer get_cell or the grid for large boards."""
+        return [
+            [Cell(grid=self.__grid, index=y * self.__width + x) for x in range(self.__width)]
+            for y in range(self.__height)
+        ]
+
+    def index(self, x: int, y: int) -> int:
+        """Return the flat index of the square at coordinates (x, y)."""
+        return self.observation.index(x, y)
+
+    def position(self, index: int) -> Tuple[int, int]:
+        """Return the (x, y) coordinates of the square at a flat index."""
+        return self.observation.position(index)
+
+    def place_mines(self, indices: Iterable[int]) -> None:
+        """
+        Put mines on the squares at the given flat indices, clearing any previous layout,
+        then compute every adjacent mine count with a single 3x3 box sum over the mine array.
+        """
+        mines = np.frombuffer(self.__grid.mines, dtype=np.uint8)
+        mines[:] = 0
+        if not isinstance(indices, np.ndarray):
+            indices = np.fromiter(indices, dtype=np.intp)
+        mines[indices] = 1
+        layout = mines.reshape(self.__height, self.__width)
+
+        padded = np.pad(layout, 1)
+        counts = np.zeros_like(layout)
+        for dy in range(3):
+            for dx in range(3):
+                counts += padded[dy : dy + self.__height, dx : dx + self.__width]
+        counts[layout == 1] = 0
+
+        adjacent = np.frombuffer(self.__grid.adjacent, dtype=np.uint8)
+        adjacent[:] = counts.reshape(-1)
+        self.__grid.recount()
+
+    def reveal(self, x: int, y: int) -> Set[Tuple[int, int]]:
+        """
+        Reveal the square at (x, y) and, when it has no adjacent mine, cascade through the
+        surrounding empty region. Flagged squares stop the cascade.
+        The fill advances one breadth first wave at a time, gathering the neighbours of a whole
+        wave from the neighbour table at once, so large open areas cost a few NumPy calls per wave.
+        Returns the coordinates of every newly revealed square.
+        """
+        grid = self.__grid
+        start = self.index(x, y)
+        if grid.is_revealed(start):
+            return set()
+
+        grid.reveal(start)
+        if grid.get_adjacent_mines(start) != 0:
+            return {(x, y)}
+
+        # squares reached by the cascade border an empty square, so they are never mines
+        rows = self.neighbours.rows
+        revealed = np.frombuffer(grid.revealed, dtype=np.uint8)
+        flagged = np.frombuffer(grid.flagged, dtype=np.uint8)
+        adjacent = np.frombuffer(grid.adjacent, dtype=np.uint8)
+        newly_revealed = {(x, y)}
+        wave = np.array([start], dtype=np.int32)
+        while len(wave):
+            reached = rows[wave].reshape(-1)
+            reached = reached[reached >= 0]
+            reached = np.unique(reached[(revealed[reached] | flagged[reached]) == 0])
+            grid.reveal_many(reached)
+            y_values, x_values = np.divmod(reached, self.__width)
+            newly_revealed.update(zip(x_values.tolist(), y_values.tolist()))
+            wave = reached[adjacent[reached] == 0]
+        return newly_revealed
+
+    def copy(self) -> "Board":
+        """An independent copy of the board, its grid and its random state, for look-ahead."""
+        board = Board(self.__width, self.__height)
+        board.grid.restore(self.__grid)
+        board.rng.setstate(self.__rng.getstate())
+        return board
 
     def get_cell(self, x: int, y: int) -> Cell:
-        if 0 <= x < self.__width and 0 <= y < self.__height:
-            return self.__cells[y][x]
-        raise ValueError(
-            f"Invalid coordinates ({x}, {y}) for the board of size {self.__width}x{self.__height}."
-        )
+        return Cell(grid=self.__grid, index=self.index(x, y))
 
     def get_random_cell(self) -> Cell:
-        x = randint(0, self.__width - 1)
-        y = randint(0, self.__height - 1)
+        x = self.__rng.randint(0, self.__width - 1)
+        y = self.__rng.randint(0, self.__height - 1)
         return self.get_cell(x, y)
 
     def get_revealed_count(self) -> int:
         """Count the number of revealed cells."""
-        return sum(cell.is_revealed() for row in self.__cells for cell in row)
+        return self.__grid.get_revealed_count()
 
     def get_flagged_count(self) -> int:
         """Count the number of flagged cells."""
-        return sum(cell.is_flagged() for row in self.__cells for cell in row)
+        return self.__grid.get_flagged_count()
+
+    def get_mine_count(self) -> int:
+        """Count the number of mines."""
+        return self.__grid.get_mine_count()
@@ -1,43 +1,64 @@
+from typing import Optional
+
+from src.core.grid import Grid
+
+
 class Cell:
-    def __init__(self, adjacent_mines: int = 0) -> None:
-        self.__revealed = False
-        self.__flagged = False
-        self.__adjacent_mines = adjacent_mines
+    """
+    Lightweight view on one square of a Grid.
+    A Cell created on its own gets a private single square grid, so it can still be used standalone.
+    """
+
+    __slots__ = ("__grid", "__index")
+
+    def __init__(
+        self, adjacent_mines: int = 0, grid: Optional[Grid] = None, index: int = 0
+    ) -> None:
+        if grid is None:
+            grid = Grid(1)
+            grid.set_adjacent_mines(0, adjacent_mines)
+        self.__grid = grid
+        self.__index = index
 
     def __repr__(self) -> str:
-        return f"Cell(adjacent_mines={self.__adjacent_mines})"
+        return f"Cell(adjacent_mines={self.adjacent_mines})"
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Cell):
             return False
-        if self.__adjacent_mines != other.adjacent_mines:
+        if self.adjacent_mines != other.adjacent_mines:
             return False
         return True
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
+    @property
+    def index(self) -> int:
+        """Flat index of the square in its grid."""
+        return self.__index
+
     @property
     def adjacent_mines(self) -> int:
-        return self.__adjacent_mines
+        return self.__grid.get_adjacent_mines(self.__index)
 
     @adjacent_mines.setter
     def adjacent_mines(self, count: int) -> None:
         if not isinstance(count, int) or count not in [-1] + list(range(9)):
             raise ValueError("adjacent_mines must be an integer between 0 and 8.")
-        self.__adjacent_mines = count
+        self.__grid.set_adjacent_mines(self.__index, count)
 
     def is_mine(self) -> bool:
-        return self.__adjacent_mines == -1
+        return self.__grid.is_mine(self.__index)
 
     def is_flagged(self) -> bool:
-        return self.__flagged
+        return self.__grid.is_flagged(self.__index)
 
     def is_revealed(self) -> bool:
-        return self.__revealed
+        return self.__grid.is_revealed(self.__index)
 
     def reveal(self) -> None:
-        self.__revealed = True
+        self.__grid.reveal(self.__index)
 
     def toggle_flag(self) -> None:
-        self.__flagged = not self.__flagged
+        self.__grid.toggle_flag(self.__index)
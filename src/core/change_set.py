@@ -0,0 +1,58 @@
+from typing import Iterable, Set, Tuple
+
+
+class ChangeSet:
+    """Everything a move, or a batch of moves, changed on the board."""
+
+    def __init__(self) -> None:
+        self.__revealed: Set[Tuple[int, int]] = set()
+        self.__flagged: Set[Tuple[int, int]] = set()
+        self.__applied_moves = 0
+        self.__game_over = False
+        self.__game_won = False
+
+    def __repr__(self) -> str:
+        return (
+            f"ChangeSet(revealed={len(self.__revealed)}, flagged={len(self.__flagged)}, "
+            f"applied_moves={self.__applied_moves})"
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.__revealed or self.__flagged or self.__game_over)
+
+    @property
+    def revealed(self) -> Set[Tuple[int, int]]:
+        """Coordinates of the newly revealed cells, cascades included."""
+        return self.__revealed
+
+    @property
+    def flagged(self) -> Set[Tuple[int, int]]:
+        """Coordinates of the cells whose flag was toggled an odd number of times."""
+        return self.__flagged
+
+    @property
+    def applied_moves(self) -> int:
+        """Number of moves that were valid and applied."""
+        return self.__applied_moves
+
+    @property
+    def game_over(self) -> bool:
+        """Whether these changes ended the game."""
+        return self.__game_over
+
+    @property
+    def game_won(self) -> bool:
+        return self.__game_won
+
+    def add_revealed(self, cells: Iterable[Tuple[int, int]]) -> None:
+        self.__revealed.update(cells)
+
+    def toggle_flag(self, cell: Tuple[int, int]) -> None:
+        self.__flagged ^= {cell}
+
+    def count_move(self) -> None:
+        self.__applied_moves += 1
+
+    def end_game(self, won: bool) -> None:
+        self.__game_over = True
+        self.__game_won = won
@@ -0,0 +1,53 @@
+"""
+Dense NumPy encodings of what a player sees, for learning-based players.
+Each square is one-hot encoded over CHANNELS planes: unknown, flag, then the revealed numbers
+0 to 8. A revealed mine, only seen once the game is lost, is all zeros.
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+from src.core.observation import STATE_FLAGGED, STATE_UNKNOWN, Observation
+
+# the observation state encoded by each channel
+CHANNEL_STATES = np.array([STATE_UNKNOWN, STATE_FLAGGED, *range(9)], dtype=np.uint8)
+CHANNELS = len(CHANNEL_STATES)
+
+
+def one_hot_states(
+    states: np.ndarray, out: Optional[np.ndarray] = None, dtype: type = np.float32
+) -> np.ndarray:
+    """
+    One-hot encode state arrays of shape (..., height, width) to (..., CHANNELS, height, width)
+    with a single comparison. out, when given, is filled in place to avoid the allocation.
+    """
+    shape = (*states.shape[:-2], CHANNELS, *states.shape[-2:])
+    if out is None:
+        out = np.empty(shape, dtype=dtype)
+    elif out.shape != shape:
+        raise ValueError(f"Expected an output of shape {shape}, got {out.shape}.")
+    np.equal(states[..., None, :, :], CHANNEL_STATES[:, None, None], out=out, casting="unsafe")
+    return out
+
+
+def one_hot(
+    observation: Observation, out: Optional[np.ndarray] = None, dtype: type = np.float32
+) -> np.ndarray:
+    """The board as seen by a player, an array of shape (CHANNELS, height, width)."""
+    return one_hot_states(observation.state(), out, dtype)
+
+
+def one_hot_batch(
+    observations: Sequence[Observation], out: Optional[np.ndarray] = None, dtype: type = np.float32
+) -> np.ndarray:
+    """Boards of the same size stacked in an array of shape (games, CHANNELS, height, width)."""
+    if not observations:
+        raise ValueError("No observation to encode.")
+    height, width = observations[0].height, observations[0].width
+    states = np.empty((len(observations), height, width), dtype=np.uint8)
+    for game, observation in enumerate(observations):
+        if (observation.height, observation.width) != (height, width):
+            raise ValueError("Every board of a batch must have the same size.")
+        states[game] = observation.state()
+    return one_hot_states(states, out, dtype)
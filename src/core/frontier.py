@@ -0,0 +1,173 @@
+from collections import deque
+from typing import Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from src.core.neighbours import NeighbourTable, neighbour_table
+from src.core.observation import Observation
+
+UNKNOWN = 0
+REVEALED = 1
+FLAGGED = 2
+
+
+class Frontier:
+    """
+    Incremental view of a board as a player sees it.
+    It remembers the visible state of every square and the set of revealed numbers that still
+    touch unknown squares (the constraint frontier). Each sync only walks the squares changed since
+    the previous one, starting from hints such as the last moves, and falls back to a full diff
+    when the live board counters show that something else changed.
+    """
+
+    def __init__(self) -> None:
+        self.__board: Optional[Observation] = None
+        self.__width = 0
+        self.__neighbours: NeighbourTable = neighbour_table(0, 0)
+        self.__seen = bytearray()
+        self.__revealed_count = 0
+        self.__flagged_count = 0
+        self.__unknown_count = 0
+        self.__numbers: Set[int] = set()
+
+    def __repr__(self) -> str:
+        return f"Frontier(numbers={len(self.__numbers)})"
+
+    @property
+    def board(self) -> Optional[Observation]:
+        """The board followed, the frontier starts over when synced on another one."""
+        return self.__board
+
+    @property
+    def numbers(self) -> Set[int]:
+        """Flat indices of the revealed numbers that still have unknown neighbours."""
+        return self.__numbers
+
+    @property
+    def unknown_count(self) -> int:
+        """Number of squares neither revealed nor flagged."""
+        return self.__unknown_count
+
+    def sync(self, board: Observation, hints: Iterable[int] = ()) -> Set[int]:
+        """
+        Bring the frontier up to date with the board and return the flat indices of the squares
+        whose visible state changed. The hints should be the squares touched by the last moves.
+        """
+        if board is not self.__board:
+            self.__reset(board)
+
+        changed: Set[int] = set()
+        for hint in hints:
+            if hint not in changed and self.__state(hint) != self.__seen[hint]:
+                changed |= self.__collect_from(hint)
+        self.__apply(changed)
+
+        if (
+            self.__revealed_count != board.get_revealed_count()
+            or self.__flagged_count != board.get_flagged_count()
+        ):
+            missed = self.__collect_all()
+            self.__apply(missed)
+            changed |= missed
+
+        self.__update_numbers(changed)
+        return changed
+
+    def neighbours(self, index: int) -> Tuple[int, ...]:
+        return self.__neighbours[index]
+
+    def position(self, index: int) -> Tuple[int, int]:
+        y, x = divmod(index, self.__width)
+        return x, y
+
+    def is_unknown(self, index: int) -> bool:
+        return self.__seen[index] == UNKNOWN
+
+    def is_revealed(self, index: int) -> bool:
+        return self.__seen[index] & REVEALED == REVEALED
+
+    def is_flagged(self, index: int) -> bool:
+        return self.__seen[index] & FLAGGED == FLAGGED
+
+    def unknown_neighbours(self, index: int) -> List[int]:
+        seen = self.__seen
+        return [neighbour for neighbour in self.neighbours(index) if seen[neighbour] == UNKNOWN]
+
+    def remaining_mines(self, index: int) -> int:
+        """Adjacent mine count of a revealed number minus the flags around it."""
+        assert self.__board is not None
+        seen = self.__seen
+        flags = sum(1 for neighbour in self.neighbours(index) if seen[neighbour] & FLAGGED)
+        return self.__board.number(index) - flags
+
+    def touched_numbers(self, changed: Set[int]) -> Set[int]:
+        """Revealed numbers whose constraint may have changed with the given squares."""
+        touched = set()
+        for index in changed:
+            if self.is_revealed(index):
+                touched.add(index)
+            for neighbour in self.neighbours(index):
+                if self.is_revealed(neighbour):
+                    touched.add(neighbour)
+        return touched
+
+    def __reset(self, board: Observation) -> None:
+        self.__board = board
+        self.__width = board.width
+        self.__neighbours = board.neighbours
+        self.__seen = bytearray(board.size)
+        self.__revealed_count = 0
+        self.__flagged_count = 0
+        self.__unknown_count = board.size
+        self.__numbers = set()
+
+    def __state(self, index: int) -> int:
+        assert self.__board is not None
+        board = self.__board
+        return board.revealed[index] * REVEALED | board.flagged[index] * FLAGGED
+
+    def __collect_from(self, start: int) -> Set[int]:
+        """Walk the connected squares that changed around start, a cascade is always connected."""
+        changed = {start}
+        queue = deque([start])
+        while queue:
+            index = queue.popleft()
+            for neighbour in self.neighbours(index):
+                if neighbour not in changed and self.__state(neighbour) != self.__seen[neighbour]:
+                    changed.add(neighbour)
+                    queue.append(neighbour)
+        return changed
+
+    def __collect_all(self) -> Set[int]:
+        assert self.__board is not None
+        board = self.__board
+        state = (
+            np.frombuffer(board.revealed, dtype=np.uint8) * REVEALED
+            | np.frombuffer(board.flagged, dtype=np.uint8) * FLAGGED
+        )
+        seen = np.frombuffer(self.__seen, dtype=np.uint8)
+        return set(np.flatnonzero(state != seen).tolist())
+
+    def __apply(self, changed: Set[int]) -> None:
+        for index in changed:
+            old, new = self.__seen[index], self.__state(index)
+            self.__revealed_count += (new & REVEALED) - (old & REVEALED)
+            self.__flagged_count += ((new & FLAGGED) - (old & FLAGGED)) // FLAGGED
+            self.__unknown_count += (new == UNKNOWN) - (old == UNKNOWN)
+            self.__seen[index] = new
+
+    def __update_numbers(self, changed: Set[int]) -> None:
+        assert self.__board is not None
+        board = self.__board
+        candidates = set(changed)
+        for index in changed:
+            candidates.update(self.neighbours(index))
+        for index in candidates:
+            if (
+                self.is_revealed(index)
+                and board.number(index) >= 0
+                and any(self.is_unknown(neighbour) for neighbour in self.neighbours(index))
+            ):
+                self.__numbers.add(index)
+            else:
+                self.__numbers.discard(index)
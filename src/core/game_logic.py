@@ -1,80 +1,219 @@
+from random import getrandbits
+from typing import BinaryIO, Callable, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
 from src.core.board import Board
-from src.core.player import Player
+from src.core.change_set import ChangeSet
+from src.core.encoding import one_hot
+from src.core.observation import Observation
+from src.core.player import Move, Player
+from src.core.record import RecordWriter, pack_mines
+
+# how the first reveal is kept safe, see GameLogic
+FIRST_CLICK_MODES = ("none", "cell", "opening")
 
 
 class GameLogic:
-    def __init__(self, width: int, height: int, mine_count: int, player: Player) -> None:
-        """Initialize the game logic with a board of given dimensions and mine count."""
-        self.__board = Board(width, height)
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        mine_count: int,
+        player: Player,
+        seed: Optional[int] = None,
+        mines: Optional[Iterable[int]] = None,
+        first_click: str = "none",
+    ) -> None:
+        """
+        Initialize the game logic with a board of given dimensions and mine count.
+        The same seed always generates the same board, without one a seed is drawn at random.
+        A given layout of mines, as flat indices, is used instead of the generated one.
+        first_click makes the first reveal safe: "cell" keeps the revealed square free of mines,
+        "opening" its whole 3x3 neighbourhood too, so the first reveal always opens an area.
+        The mines are then only placed by the first reveal, the board holds none until it.
+        """
+        if first_click not in FIRST_CLICK_MODES:
+            raise ValueError(f"Unknown first click mode {first_click!r}.")
+        if seed is None:
+            seed = getrandbits(64)
+        self.__seed = seed
+        self.__board = Board(width, height, seed=seed)
         self.__mine_count = mine_count
-        self.__place_mines()
-        self.__init_adjacent_mine_counts()
+        self.__seeded_layout = mines is None and first_click == "none"
+        self.__first_click: Optional[str] = None
+        if mines is None:
+            if mine_count > width * height:
+                raise ValueError("Mine count exceeds the number of cells on the board.")
+            if first_click == "none":
+                self.__place_mines()
+            else:
+                self.__first_click = first_click
+        else:
+            self.__board.place_mines(mines)
+            if self.__board.get_mine_count() != mine_count:
+                raise ValueError("The layout does not hold mine_count distinct mines.")
         self.__player = player
         self.__game_over = False
         self.__game_won = False
+        self.__last_changes = ChangeSet()
+        self.__recorder: Optional[RecordWriter] = None
+        self.__subscribers: List[Callable[[ChangeSet], None]] = []
+
+    def __place_mines(self, excluded: Sequence[int] = ()) -> None:
+        """
+        Place mines on distinct random squares, sampled without replacement in one draw,
+        away from the excluded squares.
+        """
+        size = self.__board.size
+        generator = np.random.default_rng(self.__seed)
+        squares = np.delete(np.arange(size), excluded) if excluded else size
+        self.__board.place_mines(generator.choice(squares, self.__mine_count, replace=False))
 
-    def __place_mines(self) -> None:
-        """Randomly place mines on the board."""
-        count = 0
-        if self.__mine_count > self.__board.width * self.__board.height:
-            raise ValueError("Mine count exceeds the number of cells on the board.")
-        while count < self.__mine_count:
-            cell = self.__board.get_random_cell()
-            if not cell.is_mine():
-                cell.adjacent_mines = -1
-                count += 1
-
-    def __init_adjacent_mine_counts(self) -> None:
-        """Initialize the adjacent mine counts for each cell."""
-        for y in range(self.__board.height):
-            for x in range(self.__board.width):
-                cell = self.__board.get_cell(x, y)
-                if not cell.is_mine():
-                    count = 0
-                    for dy in [-1, 0, 1]:
-                        for dx in [-1, 0, 1]:
-                            if dx == 0 and dy == 0:
-                                continue
-                            neighbor = self.__board.get_cell(x + dx, y + dy)
-                            if neighbor and neighbor.is_mine():
-                                count += 1
-                    cell.adjacent_mines = count
+    def __place_first_mines(self, index: int) -> None:
+        """
+        Place the mines of a lazy board away from the first revealed square, and away from its
+        neighbours in opening mode, as far as the mine count leaves room for.
+        """
+        board = self.__board
+        excluded: Sequence[int] = (index,)
+        if self.__first_click == "opening":
+            excluded = sorted((index, *board.neighbours[index]))
+        if self.__mine_count > board.size - len(excluded):
+            excluded = (index,) if self.__mine_count < board.size else ()
+        self.__first_click = None
+        self.__place_mines(excluded)
+        if self.__recorder is not None:
+            self.__recorder.write_layout(mines=pack_mines(board.grid.mines))
 
     def make_move(self, x: int, y: int, action: str = "reveal") -> bool:
         """Make a move with the specified action at coordinates (x, y)."""
+        changes = ChangeSet()
+        applied = self.__apply(x, y, action, changes)
+        self.__last_changes = changes
+        self.__publish(changes)
+        return applied
+
+    def make_moves(self, moves: Iterable[Move]) -> ChangeSet:
+        """
+        Apply a batch of moves in one call and return their combined changes.
+        Invalid moves, out of the board or with an unknown action, are skipped, and the moves
+        after the end of the game are ignored.
+        """
+        changes = ChangeSet()
+        for x, y, action in moves:
+            if self.__game_over:
+                break
+            self.__apply(x, y, action, changes)
+        self.__last_changes = changes
+        self.__publish(changes)
+        return changes
+
+    def subscribe(self, callback: Callable[[ChangeSet], None]) -> None:
+        """
+        Call callback with the ChangeSet of every make_move or make_moves call that changed the
+        board or ended the game, so consumers can follow the game without scanning the board.
+        Rolling back to a checkpoint is not published.
+        """
+        self.__subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[ChangeSet], None]) -> None:
+        self.__subscribers.remove(callback)
+
+    def __publish(self, changes: ChangeSet) -> None:
+        if changes:
+            for callback in list(self.__subscribers):
+                callback(changes)
+
+    def __apply(self, x: int, y: int, action: str, changes: ChangeSet) -> bool:
         if self.__game_over:
             return False
 
-        cell = self.__board.get_cell(x, y)
-
-        if cell is None:
+        board = self.__board
+        if not (0 <= x < board.width and 0 <= y < board.height):
             return False
+        cell = board.get_cell(x, y)
 
         if action == "reveal":
-            cell.reveal()
+            if self.__first_click is not None:
+                self.__place_first_mines(self.__board.index(x, y))
+            changes.add_revealed(self.__board.reveal(x, y))
             if cell.is_mine():
                 self.__game_over = True
                 self.__game_won = False
+                changes.end_game(won=False)
             elif self.__check_win_condition():
                 self.__game_over = True
                 self.__game_won = True
+                changes.end_game(won=True)
         elif action == "flag":
             if not cell.is_revealed():
                 cell.toggle_flag()
+                changes.toggle_flag((x, y))
             else:
                 return False
         else:
             return False
 
+        changes.count_move()
+        if self.__recorder is not None:
+            self.__recorder.write_move(self.__board.index(x, y), action)
+            if self.__game_over:
+                self.stop_recording()
         return True
 
+    def start_recording(self, stream: BinaryIO, store_seed: bool = False) -> RecordWriter:
+        """
+        Record the game to a binary stream, see src.core.record: the layout now, then every
+        applied move as it is played. The record is closed when the game ends.
+        store_seed stores the seed instead of the layout, only valid for a board generated at
+        creation. The layout of a lazy board is written once the first reveal has placed it.
+        """
+        if store_seed and not self.__seeded_layout:
+            raise ValueError("The layout of this game was not generated from its seed.")
+        self.release_checkpoints()
+        self.stop_recording()
+        board = self.__board
+        self.__recorder = RecordWriter(
+            stream,
+            board.width,
+            board.height,
+            self.__mine_count,
+            mines=None if store_seed or self.__first_click else pack_mines(board.grid.mines),
+            seed=self.__seed if store_seed else None,
+        )
+        return self.__recorder
+
+    def stop_recording(self) -> None:
+        """Close the current record, if any."""
+        if self.__recorder is not None:
+            self.__recorder.close()
+            self.__recorder = None
+
+    def checkpoint(self) -> Tuple[int, bool, bool]:
+        """
+        Return a token to restore the game to its current state with rollback, so moves can be
+        tried out and undone without copying the board. Not available while recording.
+        Mines placed by a first reveal stay in place when it is rolled back.
+        """
+        if self.__recorder is not None:
+            raise ValueError("Moves cannot be rolled back while the game is recorded.")
+        return self.__board.grid.checkpoint(), self.__game_over, self.__game_won
+
+    def rollback(self, token: Tuple[int, bool, bool]) -> None:
+        """Undo every move since the checkpoint that returned token."""
+        grid_token, self.__game_over, self.__game_won = token
+        self.__board.grid.rollback(grid_token)
+        self.__last_changes = ChangeSet()
+
+    def release_checkpoints(self) -> None:
+        """Forget every checkpoint and stop journaling the moves."""
+        self.__board.grid.release()
+
     def __check_win_condition(self) -> bool:
         """Check if the player has won the game."""
-        for row in self.__board.cells:
-            for cell in row:
-                if not cell.is_mine() and not cell.is_revealed():
-                    return False
-        return True
+        grid = self.__board.grid
+        return grid.get_revealed_safe_count() == grid.size - grid.get_mine_count()
 
     def is_game_over(self) -> bool:
         """Check if the game is over."""
@@ -84,11 +223,40 @@ class GameLogic:
         """Check if the game has been won."""
         return self.__game_won
 
+    @property
+    def seed(self) -> int:
+        """Seed the board was generated from."""
+        return self.__seed
+
+    @property
+    def mines_placed(self) -> bool:
+        """False until the first reveal of a game whose mines are placed by it."""
+        return self.__first_click is None
+
+    @property
+    def last_revealed(self) -> Set[Tuple[int, int]]:
+        """Coordinates of the cells revealed by the last move, including any cascade."""
+        return self.__last_changes.revealed
+
+    @property
+    def last_changes(self) -> ChangeSet:
+        """Changes of the last make_move or make_moves call."""
+        return self.__last_changes
+
     @property
     def board(self) -> Board:
         """Get the current state of the board."""
         return self.__board
 
+    @property
+    def observation(self) -> Observation:
+        """The view of the board handed to the player, see Board.observation."""
+        return self.__board.observation
+
+    def encode(self, dtype: type = np.float32) -> np.ndarray:
+        """The visible board one-hot encoded, of shape (CHANNELS, height, width), see encoding."""
+        return one_hot(self.__board.observation, dtype=dtype)
+
     @property
     def player(self) -> Player:
         """Get the current player."""
@@ -0,0 +1,192 @@
+from typing import List, Optional
+
+import numpy as np
+
+
+class Grid:
+    """
+    Packed storage for the state of every square of a board.
+    Each state lives in its own bytearray indexed by the flat position of the square,
+    so a square costs four bytes instead of a whole Python object.
+    Mines, revealed safe squares and flags are also counted live on every change,
+    so none of the counts needs a scan.
+    Reveals and flags can be journaled from a checkpoint and rolled back, so a search can branch
+    on the same grid without copying it.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.__size = size
+        self.__mines = bytearray(size)
+        self.__adjacent = bytearray(size)
+        self.__revealed = bytearray(size)
+        self.__flagged = bytearray(size)
+        self.__mine_count = 0
+        self.__revealed_count = 0
+        self.__revealed_safe_count = 0
+        self.__flagged_count = 0
+        self.__journal: Optional[List[int]] = None
+
+    def __repr__(self) -> str:
+        return f"Grid(size={self.__size})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return False
+        if self.__mines != other.mines:
+            return False
+        if self.__adjacent != other.adjacent:
+            return False
+        return True
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    @property
+    def mines(self) -> bytearray:
+        """
+        One byte per square, 1 when the square holds a mine.
+        The raw arrays may be written in bulk, call recount afterwards to resync the counters.
+        """
+        return self.__mines
+
+    @property
+    def adjacent(self) -> bytearray:
+        """One byte per square, the number of mines around it (meaningless on mines)."""
+        return self.__adjacent
+
+    @property
+    def revealed(self) -> bytearray:
+        """One byte per square, 1 when the square has been revealed."""
+        return self.__revealed
+
+    @property
+    def flagged(self) -> bytearray:
+        """One byte per square, 1 when the square is flagged."""
+        return self.__flagged
+
+    def get_adjacent_mines(self, index: int) -> int:
+        """Return the adjacent mine count of a square, -1 for a mine."""
+        if self.__mines[index]:
+            return -1
+        return self.__adjacent[index]
+
+    def set_adjacent_mines(self, index: int, count: int) -> None:
+        """Set the adjacent mine count of a square, -1 turns it into a mine."""
+        mine = 1 if count == -1 else 0
+        if mine != self.__mines[index]:
+            self.__mine_count += 1 if mine else -1
+            if self.__revealed[index]:
+                self.__revealed_safe_count -= 1 if mine else -1
+        self.__mines[index] = mine
+        self.__adjacent[index] = 0 if mine else count
+
+    def is_mine(self, index: int) -> bool:
+        return self.__mines[index] == 1
+
+    def is_revealed(self, index: int) -> bool:
+        return self.__revealed[index] == 1
+
+    def is_flagged(self, index: int) -> bool:
+        return self.__flagged[index] == 1
+
+    def reveal(self, index: int) -> None:
+        if self.__revealed[index]:
+            return
+        self.__revealed[index] = 1
+        self.__revealed_count += 1
+        if not self.__mines[index]:
+            self.__revealed_safe_count += 1
+        if self.__journal is not None:
+            self.__journal.append(index)
+
+    def reveal_many(self, indices: np.ndarray) -> None:
+        """Reveal the squares at distinct flat indices, none of them revealed yet, in one go."""
+        np.frombuffer(self.__revealed, dtype=np.uint8)[indices] = 1
+        mines = int(np.frombuffer(self.__mines, dtype=np.uint8)[indices].sum())
+        self.__revealed_count += len(indices)
+        self.__revealed_safe_count += len(indices) - mines
+        if self.__journal is not None:
+            self.__journal.extend(indices.tolist())
+
+    def toggle_flag(self, index: int) -> None:
+        self.__flagged[index] ^= 1
+        self.__flagged_count += 1 if self.__flagged[index] else -1
+        if self.__journal is not None:
+            # flags are journaled as the complement of their index
+            self.__journal.append(~index)
+
+    def checkpoint(self) -> int:
+        """
+        Start journaling reveals and flags, if not already, and return a token to roll back to.
+        Bulk writes to the raw arrays are not journaled.
+        """
+        if self.__journal is None:
+            self.__journal = []
+        return len(self.__journal)
+
+    def rollback(self, token: int) -> None:
+        """Undo every reveal and flag since the checkpoint that returned token."""
+        journal = self.__journal
+        if journal is None or token > len(journal):
+            raise ValueError(f"No checkpoint {token} to roll back to.")
+        while len(journal) > token:
+            entry = journal.pop()
+            if entry >= 0:
+                self.__revealed[entry] = 0
+                self.__revealed_count -= 1
+                if not self.__mines[entry]:
+                    self.__revealed_safe_count -= 1
+            else:
+                self.__flagged[~entry] ^= 1
+                self.__flagged_count += 1 if self.__flagged[~entry] else -1
+
+    def release(self) -> None:
+        """Stop journaling and forget every checkpoint."""
+        self.__journal = None
+
+    def restore(self, other: "Grid") -> None:
+        """Overwrite this grid with the state of another of the same size, dropping the journal."""
+        if other.size != self.__size:
+            raise ValueError("Cannot restore a grid of a different size.")
+        self.__mines[:] = other.mines
+        self.__adjacent[:] = other.adjacent
+        self.__revealed[:] = other.revealed
+        self.__flagged[:] = other.flagged
+        self.__mine_count = other.get_mine_count()
+        self.__revealed_count = other.get_revealed_count()
+        self.__revealed_safe_count = other.get_revealed_safe_count()
+        self.__flagged_count = other.get_flagged_count()
+        self.__journal = None
+
+    def copy(self) -> "Grid":
+        """An independent snapshot of the grid, without the journal."""
+        grid = Grid(self.__size)
+        grid.restore(self)
+        return grid
+
+    def recount(self) -> None:
+        """Recompute every counter from the raw arrays."""
+        self.__mine_count = self.__mines.count(1)
+        self.__revealed_count = self.__revealed.count(1)
+        self.__flagged_count = self.__flagged.count(1)
+        revealed_mines = int.from_bytes(self.__mines, "little") & int.from_bytes(
+            self.__revealed, "little"
+        )
+        self.__revealed_safe_count = self.__revealed_count - bin(revealed_mines).count("1")
+
+    def get_mine_count(self) -> int:
+        return self.__mine_count
+
+    def get_revealed_count(self) -> int:
+        return self.__revealed_count
+
+    def get_revealed_safe_count(self) -> int:
+        """Count the revealed squares that are not mines."""
+        return self.__revealed_safe_count
+
+    def get_flagged_count(self) -> int:
+        return self.__flagged_count
@@ -0,0 +1,263 @@
+"""
+Boards that can be won without ever guessing, for benchmarks where luck should not count.
+
+A candidate layout keeps the 3x3 area around the start square free, so the first reveal opens
+the board, and is kept only when the deterministic rules of solver.deduce, plus the global mine
+count, clear the whole board from there. Candidates are rejected as soon as the rules get stuck.
+Candidates are checked across a process pool, and the verified layouts can be kept in a pool
+file of game records, each holding the layout and its opening reveal, to start games at once.
+
+Usage: python -m src.core.no_guess --width 30 --height 16 --mines 99 --count 100 pool.dmnr
+"""
+
+import argparse
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Deque, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.board import Board
+from src.core.frontier import Frontier
+from src.core.game_logic import GameLogic
+from src.core.neighbours import neighbour_table
+from src.core.player import Player
+from src.core.record import GameRecord, encode_move, pack_mines, read_records, write_record
+from src.core.solver import build_constraints, deduce
+
+# a start square and the flat indices of the mines
+Layout = Tuple[int, np.ndarray]
+
+
+def is_solvable(width: int, height: int, mines: Iterable[int], start: int) -> bool:
+    """Whether the board is cleared from the start square by certain moves only."""
+    board = Board(width, height)
+    board.place_mines(mines)
+    grid = board.grid
+    if grid.is_mine(start):
+        return False
+    safe_count = board.size - grid.get_mine_count()
+    frontier = Frontier()
+    touched = [board.index(x, y) for x, y in board.reveal(*board.position(start))]
+    while grid.get_revealed_safe_count() < safe_count:
+        frontier.sync(board.observation, touched)
+        safe, mined = deduce(build_constraints(frontier))
+        if not safe and not mined:
+            if grid.get_mine_count() != grid.get_flagged_count():
+                return False
+            # every mine is flagged, whatever is still unknown is safe
+            safe = {index for index in range(board.size) if frontier.is_unknown(index)}
+        touched = []
+        for index in mined:
+            grid.toggle_flag(index)
+            touched.append(index)
+        for index in safe:
+            touched.extend(board.index(x, y) for x, y in board.reveal(*board.position(index)))
+    return True
+
+
+def opening_squares(width: int, height: int, start: int) -> List[int]:
+    """The start square and its neighbours, kept free of mines."""
+    return sorted((start, *neighbour_table(width, height)[start]))
+
+
+def find_layout(
+    width: int,
+    height: int,
+    mine_count: int,
+    start: int,
+    seed: np.random.SeedSequence,
+    attempts: int,
+) -> Optional[np.ndarray]:
+    """Draw up to attempts candidate layouts and return the first solvable one, if any."""
+    generator = np.random.default_rng(seed)
+    squares = np.delete(np.arange(width * height), opening_squares(width, height, start))
+    for _ in range(attempts):
+        mines = np.sort(generator.choice(squares, mine_count, replace=False))
+        if is_solvable(width, height, mines, start):
+            return mines
+    return None
+
+
+def generate_layouts(
+    width: int,
+    height: int,
+    mine_count: int,
+    count: int,
+    start: Optional[int] = None,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    attempts: int = 64,
+    max_candidates: int = 1_000_000,
+) -> List[Layout]:
+    """
+    Find count no-guess layouts opening on start, the center square by default. Each task of the
+    process pool tries attempts candidates from its own seed, derived from seed, and the layouts
+    are kept in seed order, so the result does not depend on the number of workers.
+    Fewer layouts are returned when max_candidates candidates were not enough.
+    """
+    if start is None:
+        start = (height // 2) * width + width // 2
+    if mine_count > width * height - len(opening_squares(width, height, start)):
+        raise ValueError("Mine count leaves no room for the opening.")
+    workers = workers or os.cpu_count() or 1
+    sequence = np.random.SeedSequence(seed)
+    layouts: List[Layout] = []
+    candidates = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while len(layouts) < count and candidates < max_candidates:
+            tasks = max(workers, count - len(layouts))
+            results = executor.map(
+                find_layout,
+                [width] * tasks,
+                [height] * tasks,
+                [mine_count] * tasks,
+                [start] * tasks,
+                sequence.spawn(tasks),
+                [attempts] * tasks,
+            )
+            layouts.extend((start, mines) for mines in results if mines is not None)
+            candidates += tasks * attempts
+    return layouts[:count]
+
+
+class LayoutPool:
+    """
+    Verified no-guess layouts of one board size, handed out one game at a time.
+    A pool is saved as game records whose only move is the opening reveal, see src.core.record,
+    so loading it back costs no generation at all.
+    """
+
+    def __init__(
+        self, width: int, height: int, mine_count: int, layouts: Iterable[Layout] = ()
+    ) -> None:
+        self.__width = width
+        self.__height = height
+        self.__mine_count = mine_count
+        self.__layouts: Deque[Layout] = deque()
+        self.extend(layouts)
+
+    def __repr__(self) -> str:
+        return (
+            f"LayoutPool(width={self.__width}, height={self.__height}, "
+            f"mine_count={self.__mine_count}, layouts={len(self.__layouts)})"
+        )
+
+    def __len__(self) -> int:
+        return len(self.__layouts)
+
+    @property
+    def width(self) -> int:
+        return self.__width
+
+    @property
+    def height(self) -> int:
+        return self.__height
+
+    @property
+    def mine_count(self) -> int:
+        return self.__mine_count
+
+    def extend(self, layouts: Iterable[Layout]) -> None:
+        for start, mines in layouts:
+            if len(mines) != self.__mine_count:
+                raise ValueError("The layout does not hold the pool's mine count.")
+            self.__layouts.append((start, np.asarray(mines)))
+
+    def fill(self, count: int, seed: int = 0, workers: Optional[int] = None) -> None:
+        """Generate layouts until the pool holds count of them."""
+        missing = count - len(self.__layouts)
+        if missing > 0:
+            self.extend(
+                generate_layouts(
+                    self.__width,
+                    self.__height,
+                    self.__mine_count,
+                    missing,
+                    seed=seed,
+                    workers=workers,
+                )
+            )
+
+    def pop(self) -> Layout:
+        """Take the next layout out of the pool."""
+        if not self.__layouts:
+            raise IndexError("The layout pool is empty.")
+        return self.__layouts.popleft()
+
+    def new_game(self, player: Player) -> GameLogic:
+        """A game on the next layout of the pool, its opening already revealed."""
+        start, mines = self.pop()
+        game_logic = GameLogic(self.__width, self.__height, self.__mine_count, player, mines=mines)
+        game_logic.make_move(*game_logic.board.position(start))
+        return game_logic
+
+    def records(self) -> List[GameRecord]:
+        size = self.__width * self.__height
+        records = []
+        for start, mines in self.__layouts:
+            layout = np.zeros(size, dtype=np.uint8)
+            layout[mines] = 1
+            records.append(
+                GameRecord(
+                    self.__width,
+                    self.__height,
+                    self.__mine_count,
+                    pack_mines(layout.tobytes()),
+                    None,
+                    [encode_move(start, "reveal")],
+                )
+            )
+        return records
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as stream:
+            for record in self.records():
+                write_record(stream, record)
+
+
+def load_pool(path: str) -> LayoutPool:
+    """Read back a pool saved by LayoutPool.save."""
+    with open(path, "rb") as stream:
+        records = list(read_records(stream))
+    if not records:
+        raise ValueError(f"No layout in {path}.")
+    width, height, mine_count = records[0].width, records[0].height, records[0].mine_count
+    layouts = []
+    for record in records:
+        if (record.width, record.height, record.mine_count) != (width, height, mine_count):
+            raise ValueError("Every layout of a pool must have the same size and mine count.")
+        start, _ = record.decoded_moves()[0]
+        layouts.append((start, record.mine_indices()))
+    return LayoutPool(width, height, mine_count, layouts)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a pool of no-guess Minesweeper boards.")
+    parser.add_argument("output", help="pool file, new layouts are appended to an existing one")
+    parser.add_argument("--width", type=int, default=30)
+    parser.add_argument("--height", type=int, default=16)
+    parser.add_argument("--mines", type=int, default=99)
+    parser.add_argument("--count", type=int, default=100, help="layouts to generate")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="defaults to the CPU count")
+    args = parser.parse_args(argv)
+
+    pool = LayoutPool(
+        args.width,
+        args.height,
+        args.mines,
+        generate_layouts(
+            args.width, args.height, args.mines, args.count, seed=args.seed, workers=args.workers
+        ),
+    )
+    with open(args.output, "ab") as stream:
+        for record in pool.records():
+            write_record(stream, record)
+    print(f"{len(pool)} no-guess layouts written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,114 @@
+from typing import Tuple
+
+import numpy as np
+
+from src.core.grid import Grid
+from src.core.neighbours import NeighbourTable, neighbour_table
+
+# compact states of the squares: the adjacent mine count of a revealed number, then
+STATE_UNKNOWN = 9
+STATE_FLAGGED = 10
+# only seen once the game is lost
+STATE_MINE = 11
+
+
+class Observation:
+    """
+    Read-only view of a board as a player is allowed to see it: the revealed numbers, the flags
+    and the unknown squares, never the mines. It reads the board's storage directly, so it never
+    goes stale and costs nothing per move, and the raw arrays it exposes are read-only memoryviews
+    over the same bytes.
+    """
+
+    def __init__(self, grid: Grid, width: int, height: int) -> None:
+        self.__grid = grid
+        self.__width = width
+        self.__height = height
+        self.__neighbours = neighbour_table(width, height)
+        self.__revealed = memoryview(grid.revealed).toreadonly()
+        self.__flagged = memoryview(grid.flagged).toreadonly()
+
+    def __repr__(self) -> str:
+        return f"Observation(width={self.__width}, height={self.__height})"
+
+    @property
+    def width(self) -> int:
+        return self.__width
+
+    @property
+    def height(self) -> int:
+        return self.__height
+
+    @property
+    def size(self) -> int:
+        return self.__width * self.__height
+
+    @property
+    def neighbours(self) -> NeighbourTable:
+        """Flat indices of the neighbours of each square."""
+        return self.__neighbours
+
+    @property
+    def revealed(self) -> memoryview:
+        """One byte per square, 1 when the square has been revealed."""
+        return self.__revealed
+
+    @property
+    def flagged(self) -> memoryview:
+        """One byte per square, 1 when the square is flagged."""
+        return self.__flagged
+
+    def index(self, x: int, y: int) -> int:
+        """Return the flat index of the square at coordinates (x, y)."""
+        if 0 <= x < self.__width and 0 <= y < self.__height:
+            return y * self.__width + x
+        raise ValueError(
+            f"Invalid coordinates ({x}, {y}) for the board of size {self.__width}x{self.__height}."
+        )
+
+    def position(self, index: int) -> Tuple[int, int]:
+        """Return the (x, y) coordinates of the square at a flat index."""
+        y, x = divmod(index, self.__width)
+        return x, y
+
+    def is_revealed(self, index: int) -> bool:
+        return self.__revealed[index] == 1
+
+    def is_flagged(self, index: int) -> bool:
+        return self.__flagged[index] == 1
+
+    def is_unknown(self, index: int) -> bool:
+        return not self.__revealed[index] and not self.__flagged[index]
+
+    def number(self, index: int) -> int:
+        """The adjacent mine count of a revealed square, -1 for a revealed mine."""
+        if not self.__revealed[index]:
+            raise ValueError(f"The square {index} is not revealed.")
+        return self.__grid.get_adjacent_mines(index)
+
+    def get_mine_count(self) -> int:
+        """Number of mines on the board, the player knows it from the start."""
+        return self.__grid.get_mine_count()
+
+    def get_revealed_count(self) -> int:
+        return self.__grid.get_revealed_count()
+
+    def get_flagged_count(self) -> int:
+        return self.__grid.get_flagged_count()
+
+    def state(self) -> np.ndarray:
+        """
+        Every square as one byte, in a (height, width) array: the number of a revealed square,
+        STATE_UNKNOWN, STATE_FLAGGED or STATE_MINE.
+        """
+        grid = self.__grid
+        revealed = np.frombuffer(grid.revealed, dtype=np.uint8)
+        hidden = np.where(np.frombuffer(grid.flagged, dtype=np.uint8), STATE_FLAGGED, STATE_UNKNOWN)
+        shown = np.where(
+            np.frombuffer(grid.mines, dtype=np.uint8),
+            STATE_MINE,
+            np.frombuffer(grid.adjacent, dtype=np.uint8),
+        )
+        return (
+            np.where(revealed, shown, hidden).astype(np.uint8).reshape(self.__height, self.__width)
+        )
@@ -1,16 +1,29 @@
 from abc import ABC, abstractmethod
-from random import randint
-from typing import Optional, Tuple
+from collections import deque
+from random import Random
+from typing import Deque, Dict, List, Optional, Set, Tuple
 
-from src.core.board import Board
+import numpy as np
+
+from src.core.frontier import Frontier
+from src.core.observation import Observation
+from src.core.solution_cache import SolutionCache, shared_cache
+from src.core.solver import ConstraintSolver, build_constraints, deduce
+
+# probabilities this close to 0 or 1 are treated as certain
+CERTAINTY = 1e-9
+
+# x, y coordinates and the action, "reveal" or "flag"
+Move = Tuple[int, int, str]
 
 
 class Player(ABC):
     """Abstract base class for a player in the game."""
 
-    def __init__(self, name: str) -> None:
-        """Initialize the player with a name."""
+    def __init__(self, name: str, seed: Optional[int] = None) -> None:
+        """Initialize the player with a name, and a seed for its random choices."""
         self.__name = name
+        self.__rng = Random(seed)
 
     def __repr__(self) -> str:
         return f"Player(name={self.__name})"
@@ -29,141 +42,194 @@ class Player(ABC):
     def name(self) -> str:
         return self.__name
 
+    @property
+    def rng(self) -> Random:
+        """Random generator the player must use, so its games can be replayed from the seed."""
+        return self.__rng
+
     @abstractmethod
-    def make_move(self, board: Board) -> Optional[Tuple[int, int, str]]:
+    def make_move(self, board: Observation) -> Optional[Move]:
         """Make a move with the specified action at coordinates (x, y).
+        The board is the observation of the game, the player never sees the mines.
         returns a tuple containing the x, y coordinates and the action as a string.
         For the user interface to take input from human player we return None."""
 
+    def make_moves(self, board: Observation) -> List[Move]:
+        """Make every move the player is ready to play on this board at once.
+        Defaults to the single move of make_move, an empty list stands for the human player."""
+        move = self.make_move(board)
+        if move is None:
+            return []
+        return [move]
+
 
 class HumanPlayer(Player):
     """Concrete class for a human player."""
 
-    def make_move(self, board: Board) -> Optional[Tuple[int, int, str]]:
+    def make_move(self, board: Observation) -> Optional[Move]:
         return None
 
 
 class RandomPlayer(Player):
     """Concrete class for a random player."""
 
-    def make_move(self, board: Board) -> Optional[Tuple[int, int, str]]:
+    def make_move(self, board: Observation) -> Optional[Move]:
         """Make a random move on the board."""
-        x = randint(0, board.width - 1)
-        y = randint(0, board.height - 1)
+        x = self.rng.randint(0, board.width - 1)
+        y = self.rng.randint(0, board.height - 1)
         action = "reveal"
-        while board.get_cell(x, y).is_revealed():
-            x = randint(0, board.width - 1)
-            y = randint(0, board.height - 1)
+        while board.is_revealed(board.index(x, y)):
+            x = self.rng.randint(0, board.width - 1)
+            y = self.rng.randint(0, board.height - 1)
 
         return x, y, action
 
 
-class ProbaPlayer(Player):
+class FrontierPlayer(Player):
+    """
+    Base class for the players that follow the board through a Frontier.
+    Every turn the frontier is synced from the last moves, then all the cells that the constraints
+    prove safe or mined are returned as one batch, and only when there is none does the player
+    fall back to its own, more expensive, guess.
+    """
+
+    def __init__(self, name: str, seed: Optional[int] = None) -> None:
+        super().__init__(name, seed)
+        self.__frontier = Frontier()
+        self.__queued: Deque[Move] = deque()
+        self.__last_moves: List[int] = []
+
+    @property
+    def frontier(self) -> Frontier:
+        return self.__frontier
+
+    def make_move(self, board: Observation) -> Optional[Move]:
+        """Play the batch one move at a time, the rest of it is kept for the next turns."""
+        self.__sync(board)
+        while self.__queued:
+            move = self.__queued.popleft()
+            index = board.index(move[0], move[1])
+            # an earlier reveal of the batch may have uncovered it already
+            if self.__frontier.is_unknown(index):
+                self.__last_moves = [index]
+                return move
+
+        moves = self.__plan(board)
+        self.__queued.extend(moves[1:])
+        self.__last_moves = [board.index(moves[0][0], moves[0][1])]
+        return moves[0]
+
+    def make_moves(self, board: Observation) -> List[Move]:
+        """Return the whole batch of certain moves, or a single guess when there is none."""
+        self.__sync(board)
+        self.__queued.clear()
+        moves = self.__plan(board)
+        self.__last_moves = [board.index(x, y) for x, y, _ in moves]
+        return moves
+
+    def observe(self, changed: Set[int]) -> None:
+        """Called after each sync with the cells whose visible state changed."""
+
+    def start_game(self) -> None:
+        """Called when the player is handed a new board, to forget what it knew of the last one."""
+
+    @abstractmethod
+    def guess(self, board: Observation) -> Move:
+        """Choose a move when no cell is certainly safe or mined."""
+
+    def __sync(self, board: Observation) -> None:
+        if board is not self.__frontier.board:
+            # the moves deduced on the previous board mean nothing on this one
+            self.__queued.clear()
+            self.__last_moves = []
+            self.start_game()
+        self.observe(self.__frontier.sync(board, self.__last_moves))
+
+    def __plan(self, board: Observation) -> List[Move]:
+        safe, mines = deduce(build_constraints(self.__frontier))
+        moves: List[Move] = [(*board.position(index), "reveal") for index in sorted(safe)]
+        moves.extend((*board.position(index), "flag") for index in sorted(mines))
+        if not moves:
+            moves.append(self.guess(board))
+        return moves
+
+
+class ProbaPlayer(FrontierPlayer):
     """
     A player that makes decisions based on probabilities.
     It will choose a random cell to reveal or flag based on the current state of the board.
+    The probabilities are kept between turns and only recomputed, when a guess is needed, around
+    the cells changed since the previous guess.
     """
 
-    def __init__(self, name: str) -> None:
-        super().__init__(name)
-        self.__memory = [[-1.0 for _ in range(5)] for _ in range(5)]
+    def __init__(self, name: str, seed: Optional[int] = None) -> None:
+        super().__init__(name, seed)
+        self.__probabilities: Dict[int, float] = {}
+        self.__obvious: Set[int] = set()
+        self.__pending: Set[int] = set()
+
+    def observe(self, changed: Set[int]) -> None:
+        self.__pending |= changed
+
+    def start_game(self) -> None:
+        self.__probabilities = {}
+        self.__obvious = set()
+        self.__pending = set()
 
-    def make_move(self, board: Board) -> Optional[Tuple[int, int, str]]:
+    def guess(self, board: Observation) -> Move:
         """
         Make a move based on the current state of the board. keep track of the probabilities of each cell being a mine.
         """
-        if self.__memory:
-            obv_candidate = self.get_obvious_candidate()
-            if obv_candidate:
-                self.__memory[obv_candidate[1]][obv_candidate[0]] = -2  # Mark as revealed
-                return obv_candidate
-
-        # build a probability table of the size of the board, fill with -2 when revealed and -3 when flagged
-        prob_table = [[-1.0 for _ in range(board.width)] for _ in range(board.height)]
-
-        # ATTENTION: optimizing is a key to the performance of this function, as it is called every turn.
-
-        # Precompute directions for neighbor checks
-        directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
-
-        for y in range(board.height):
-            for x in range(board.width):
-                cell = board.get_cell(x, y)
-                if cell.is_revealed():
-                    prob_table[y][x] = -2
-                    # add to the neighboring cells the probability of being a mine
-                    # count first the unrevealed neighbors
-                    unrevealed_neighbors = 0
-                    flagged_neighbors = 0
-                    for dy, dx in directions:
-                        nx, ny = x + dx, y + dy
-                        if 0 <= nx < board.width and 0 <= ny < board.height:
-                            neighbor_cell = board.get_cell(nx, ny)
-                            if neighbor_cell.is_flagged():
-                                flagged_neighbors += 1
-                            elif not neighbor_cell.is_revealed():
-                                unrevealed_neighbors += 1
-                                # put the probability of being a mine to 0.
-                                prob_table[ny][nx] = max(prob_table[ny][nx], 0.0)
-
-                    if unrevealed_neighbors > 0:
-                        # distribute the probability of being a mine to the neighbors
-                        for dy, dx in directions:
-                            nx, ny = x + dx, y + dy
-                            if 0 <= nx < board.width and 0 <= ny < board.height:
-                                neighbor_cell = board.get_cell(nx, ny)
-                                if (
-                                    not neighbor_cell.is_revealed()
-                                    and not neighbor_cell.is_flagged()
-                                ):
-                                    potential_new_prob = (
-                                        cell.adjacent_mines - flagged_neighbors + 0.01
-                                    ) / unrevealed_neighbors
-                                    if prob_table[ny][nx] <= 0:
-                                        prob_table[ny][nx] = potential_new_prob
-                                    # priroritize extrem values, under 0.1 or above 1, for either prob_table or potential_new_prob, else, take the minimum
-                                    elif prob_table[ny][nx] > 1.0 or potential_new_prob > 1.0:
-                                        prob_table[ny][nx] = max(
-                                            prob_table[ny][nx], potential_new_prob
-                                        )
-                                    else:
-                                        prob_table[ny][nx] = min(
-                                            prob_table[ny][nx], potential_new_prob
-                                        )
-                elif cell.is_flagged():
-                    prob_table[y][x] = -3
-
-        self.__memory = prob_table
-
-        # find the coordinates of the cell with the lowest probability of being a mine
-        obv_candidate = self.get_obvious_candidate()
-        if obv_candidate:
-            self.__memory[obv_candidate[1]][obv_candidate[0]] = -2  # Mark as revealed
-            return obv_candidate
-
-        # reveal the safest not mine candidate, random if multiple
-        prob_candidates = [prob for row in prob_table for prob in row if prob >= 0]
-        if prob_candidates:
-            lowest_prob = min(prob for row in prob_table for prob in row if prob >= 0)
-            not_mine_candidates = [
-                (x, y)
-                for y in range(board.height)
-                for x in range(board.width)
-                if prob_table[y][x] == lowest_prob
-            ]
-            x, y = not_mine_candidates[randint(0, len(not_mine_candidates) - 1)]
-            self.__memory[y][x] = -2  # Mark as revealed
+        self.__update_probabilities(self.__pending)
+        self.__pending = set()
+
+        move = self.get_obvious_candidate()
+        if move is not None:
+            return move
+
+        # reveal the safest candidate, random if multiple
+        if self.__probabilities:
+            lowest_prob = min(self.__probabilities.values())
+            not_mine_candidates = sorted(
+                index for index, prob in self.__probabilities.items() if prob == lowest_prob
+            )
+            x, y = board.position(self.rng.choice(not_mine_candidates))
             return x, y, "reveal"
 
-        # if no candidates, return a random cell
         # If no candidates, return a random cell
         while True:
-            x = randint(0, board.width - 1)
-            y = randint(0, board.height - 1)
-            if not (board.get_cell(x, y).is_revealed() or board.get_cell(x, y).is_flagged()):
-                self.__memory[y][x] = -2  # Mark as revealed
+            x = self.rng.randint(0, board.width - 1)
+            y = self.rng.randint(0, board.height - 1)
+            if self.frontier.is_unknown(board.index(x, y)):
                 return x, y, "reveal"
 
+    def __update_probabilities(self, changed: Set[int]) -> None:
+        """Recompute the probability of the unknown cells next to the changed cells only."""
+        frontier = self.frontier
+        affected = set(changed)
+        for number in frontier.touched_numbers(changed):
+            affected.update(frontier.unknown_neighbours(number))
+
+        for index in affected:
+            self.__probabilities.pop(index, None)
+            self.__obvious.discard(index)
+            if not frontier.is_unknown(index):
+                continue
+            estimates = [
+                (frontier.remaining_mines(neighbour) + 0.01)
+                / len(frontier.unknown_neighbours(neighbour))
+                for neighbour in frontier.neighbours(index)
+                if neighbour in frontier.numbers
+            ]
+            if not estimates:
+                continue
+            # priroritize extrem values above 1, else take the minimum
+            highest = max(estimates)
+            prob = highest if highest > 1.0 else min(estimates)
+            self.__probabilities[index] = prob
+            if prob >= 1.0 or prob < 0.1:
+                self.__obvious.add(index)
+
     def display_prob_table(self, prob_table: list) -> None:
         """Display the probability table."""
         # if positive number don't forget to add a space before it for it to be aligned
@@ -171,14 +237,67 @@ class ProbaPlayer(Player):
             print(" ".join("+" * (prob >= 0) + f"{prob:.2f}" for prob in row))
         print()
 
-    def get_obvious_candidate(self) -> Optional[Tuple[int, int, str]]:
-        if not self.__memory:
+    def get_obvious_candidate(self) -> Optional[Move]:
+        """Return the first cell, in reading order, that is almost surely a mine or safe."""
+        if not self.__obvious:
             return None
 
-        for x, row in enumerate(self.__memory):
-            for y, value in enumerate(row):
-                if value >= 1.0:
-                    return y, x, "flag"
-                if 0 < value < 0.1:
-                    return y, x, "reveal"
-        return None
+        index = min(self.__obvious)
+        x, y = self.frontier.position(index)
+        if self.__probabilities[index] >= 1.0:
+            return x, y, "flag"
+        return x, y, "reveal"
+
+
+class SolverPlayer(FrontierPlayer):
+    """
+    A player that computes the exact probability of every frontier cell being a mine.
+    Once the certain moves are exhausted it reveals the cell least likely to be a mine.
+    The solver budget bounds the time spent per move. The component solutions are memoized in
+    the cache, by default the one shared by the whole process, so patterns seen in earlier moves
+    and games are not enumerated again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_component_size: int = 128,
+        max_nodes: int = 200_000,
+        time_limit: float = 0.5,
+        seed: Optional[int] = None,
+        cache: Optional[SolutionCache] = None,
+    ) -> None:
+        super().__init__(name, seed)
+        self.__solver = ConstraintSolver(
+            max_component_size,
+            max_nodes,
+            time_limit,
+            cache if cache is not None else shared_cache(),
+        )
+
+    def guess(self, board: Observation) -> Move:
+        frontier = self.frontier
+        constraints = build_constraints(frontier)
+        frontier_cells = {cell for cells, _ in constraints for cell in cells}
+        mines_left = board.get_mine_count() - board.get_flagged_count()
+        probabilities, interior_probability = self.__solver.solve(
+            constraints, mines_left, frontier.unknown_count - len(frontier_cells), board.width
+        )
+
+        safe = [cell for cell, prob in probabilities.items() if prob <= CERTAINTY]
+        if safe:
+            return (*board.position(min(safe)), "reveal")
+        mines = [cell for cell, prob in probabilities.items() if prob >= 1.0 - CERTAINTY]
+        if mines:
+            return (*board.position(min(mines)), "flag")
+
+        if probabilities:
+            best = min(probabilities, key=lambda cell: (probabilities[cell], cell))
+            if interior_probability is None or probabilities[best] <= interior_probability:
+                return (*board.position(best), "reveal")
+
+        # reveal a random cell away from the frontier, drawn from the unknown squares in one pass
+        revealed = np.frombuffer(board.revealed, dtype=np.uint8)
+        away = (revealed | np.frombuffer(board.flagged, dtype=np.uint8)) == 0
+        away[list(probabilities)] = False
+        return (*board.position(int(self.rng.choice(np.flatnonzero(away)))), "reveal")
@@ -0,0 +1,207 @@
+"""
+Compact binary record of a game, to archive games and replay them offline.
+
+A record is the header
+    magic b"DMNR", format version (1 byte), layout kind (1 byte),
+    width, height and mine count (varints),
+    the mine layout: a bitmap of one bit per square packed in bytes, or the seed (varint),
+followed by the stream of applied moves, one varint each, closed by a 0. A move is encoded as
+1 + 2 * flat index + 1 for a flag, so an expert game fits in about a hundred bytes.
+Records can be written one after the other to the same stream and read back in sequence.
+"""
+
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+MAGIC = b"DMNR"
+VERSION = 1
+
+# the layout is stored as a bitmap of the mines, or as the seed they are generated from
+BITMAP_LAYOUT = 0
+SEED_LAYOUT = 1
+
+END_OF_MOVES = 0
+ACTIONS = ("reveal", "flag")
+
+
+class GameRecord(NamedTuple):
+    width: int
+    height: int
+    mine_count: int
+    # packed bitmap of the mines, None when the layout is stored as a seed
+    mines: Optional[bytes]
+    seed: Optional[int]
+    # encoded moves, see encode_move
+    moves: List[int]
+
+    def mine_indices(self) -> np.ndarray:
+        """Flat indices of the mines of a bitmap layout."""
+        if self.mines is None:
+            raise ValueError("The layout of this record is stored as a seed.")
+        bits = np.unpackbits(
+            np.frombuffer(self.mines, dtype=np.uint8), count=self.width * self.height
+        )
+        return np.flatnonzero(bits)
+
+    def decoded_moves(self) -> List[Tuple[int, str]]:
+        """The moves as (flat index, action) pairs."""
+        return [decode_move(code) for code in self.moves]
+
+
+def encode_move(index: int, action: str) -> int:
+    return 1 + 2 * index + ACTIONS.index(action)
+
+
+def decode_move(code: int) -> Tuple[int, str]:
+    index, action = divmod(code - 1, 2)
+    return index, ACTIONS[action]
+
+
+def pack_mines(mines: Union[bytes, bytearray]) -> bytes:
+    """Pack one byte per square, 1 for a mine, into one bit per square."""
+    return np.packbits(np.frombuffer(mines, dtype=np.uint8)).tobytes()
+
+
+def write_varint(stream: BinaryIO, value: int) -> None:
+    """Write a non-negative integer 7 bits per byte, the high bit set on all bytes but the last."""
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    stream.write(encoded)
+
+
+def read_varint(stream: BinaryIO) -> int:
+    value = 0
+    shift = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            raise ValueError("Truncated game record.")
+        value |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+
+
+class RecordWriter:
+    """
+    Streaming writer of one game record: the header is written as soon as the layout is known
+    and every move as soon as it is played, so a game is recorded without keeping its moves in
+    memory. Without a layout on creation, the header waits for write_layout and the moves
+    played until then are held back to follow it.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        width: int,
+        height: int,
+        mine_count: int,
+        mines: Optional[bytes] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        """mines is the packed bitmap of the layout, the seed is only stored without it."""
+        self.__stream = stream
+        self.__dimensions = (width, height, mine_count)
+        self.__started = False
+        self.__held_moves: List[int] = []
+        self.__closed = False
+        if mines is not None or seed is not None:
+            self.write_layout(mines, seed)
+
+    def write_layout(self, mines: Optional[bytes] = None, seed: Optional[int] = None) -> None:
+        """Write the header with the packed bitmap of the mines, or the seed without it."""
+        if mines is None and seed is None:
+            raise ValueError("A record needs the mine layout or the seed.")
+        if self.__started:
+            raise ValueError("The layout of the record is already written.")
+        stream = self.__stream
+        stream.write(MAGIC)
+        stream.write(bytes((VERSION, BITMAP_LAYOUT if mines is not None else SEED_LAYOUT)))
+        for value in self.__dimensions:
+            write_varint(stream, value)
+        if mines is not None:
+            stream.write(mines)
+        elif seed is not None:
+            write_varint(stream, seed)
+        self.__started = True
+        for code in self.__held_moves:
+            write_varint(stream, code)
+        self.__held_moves.clear()
+
+    @property
+    def closed(self) -> bool:
+        return self.__closed
+
+    def write_move(self, index: int, action: str) -> None:
+        if self.__closed:
+            raise ValueError("The record is closed.")
+        if self.__started:
+            write_varint(self.__stream, encode_move(index, action))
+        else:
+            self.__held_moves.append(encode_move(index, action))
+
+    def close(self) -> None:
+        """
+        End the move stream, the stream itself is left open for the next record.
+        A record closed before its layout was written leaves nothing on the stream.
+        """
+        if not self.__closed:
+            if self.__started:
+                write_varint(self.__stream, END_OF_MOVES)
+            self.__closed = True
+
+
+def write_record(stream: BinaryIO, record: GameRecord) -> None:
+    writer = RecordWriter(
+        stream, record.width, record.height, record.mine_count, record.mines, record.seed
+    )
+    for index, action in record.decoded_moves():
+        writer.write_move(index, action)
+    writer.close()
+
+
+def read_record(stream: BinaryIO) -> Optional[GameRecord]:
+    """Read the next record of the stream, None at the end of the stream."""
+    magic = stream.read(len(MAGIC))
+    if not magic:
+        return None
+    if magic != MAGIC:
+        raise ValueError("Not a game record.")
+    header = stream.read(2)
+    if len(header) != 2:
+        raise ValueError("Truncated game record.")
+    version, layout = header
+    if version != VERSION:
+        raise ValueError(f"Unsupported game record version {version}.")
+    width = read_varint(stream)
+    height = read_varint(stream)
+    mine_count = read_varint(stream)
+    mines: Optional[bytes] = None
+    seed: Optional[int] = None
+    if layout == BITMAP_LAYOUT:
+        bitmap_size = -(-width * height // 8)
+        mines = stream.read(bitmap_size)
+        if len(mines) != bitmap_size:
+            raise ValueError("Truncated game record.")
+    elif layout == SEED_LAYOUT:
+        seed = read_varint(stream)
+    else:
+        raise ValueError(f"Unknown mine layout {layout}.")
+    moves = []
+    code = read_varint(stream)
+    while code != END_OF_MOVES:
+        moves.append(code)
+        code = read_varint(stream)
+    return GameRecord(width, height, mine_count, mines, seed, moves)
+
+
+def read_records(stream: BinaryIO) -> Iterator[GameRecord]:
+    """Every record of the stream, in order."""
+    record = read_record(stream)
+    while record is not None:
+        yield record
+        record = read_record(stream)
@@ -0,0 +1,81 @@
+from typing import Optional
+
+from src.core.change_set import ChangeSet
+from src.core.game_logic import GameLogic
+from src.core.player import HumanPlayer, Player
+from src.core.record import GameRecord
+
+
+class Replay:
+    """
+    Plays a game record back through a GameLogic, one move at a time or straight to any move.
+    Seeking backwards replays the game from its start.
+    """
+
+    def __init__(self, record: GameRecord, player: Optional[Player] = None) -> None:
+        self.__record = record
+        self.__player = player if player is not None else HumanPlayer(name="Replay")
+        self.__moves = record.decoded_moves()
+        self.__game_logic = self.__new_game()
+        self.__position = 0
+
+    def __repr__(self) -> str:
+        return f"Replay(position={self.__position}, moves={len(self.__moves)})"
+
+    @property
+    def record(self) -> GameRecord:
+        return self.__record
+
+    @property
+    def game_logic(self) -> GameLogic:
+        """The game as it is after the moves played so far."""
+        return self.__game_logic
+
+    @property
+    def position(self) -> int:
+        """Number of moves played so far."""
+        return self.__position
+
+    def __len__(self) -> int:
+        return len(self.__moves)
+
+    def __new_game(self) -> GameLogic:
+        record = self.__record
+        if record.mines is None:
+            return GameLogic(
+                record.width, record.height, record.mine_count, self.__player, seed=record.seed
+            )
+        return GameLogic(
+            record.width,
+            record.height,
+            record.mine_count,
+            self.__player,
+            mines=record.mine_indices(),
+        )
+
+    def restart(self) -> None:
+        self.__game_logic = self.__new_game()
+        self.__position = 0
+
+    def step(self) -> Optional[ChangeSet]:
+        """Play the next move and return its changes, None once every move has been played."""
+        if self.__position >= len(self.__moves):
+            return None
+        index, action = self.__moves[self.__position]
+        x, y = self.__game_logic.board.position(index)
+        changes = self.__game_logic.make_moves([(x, y, action)])
+        self.__position += 1
+        return changes
+
+    def seek(self, move: int) -> GameLogic:
+        """Bring the game to the state right after its first move moves and return it."""
+        move = max(0, min(move, len(self.__moves)))
+        if move < self.__position:
+            self.restart()
+        board = self.__game_logic.board
+        self.__game_logic.make_moves(
+            (*board.position(index), action)
+            for index, action in self.__moves[self.__position : move]
+        )
+        self.__position = move
+        return self.__game_logic
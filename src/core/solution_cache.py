@@ -0,0 +1,171 @@
+"""
+Memo of the exact solutions of frontier components, shared across moves and games.
+The solutions of a component only depend on the shape of its constraints, so a component is
+keyed by its cells as (row, column) points, brought to a canonical form among the 8 rotations
+and reflections of the board and shifted to the origin. The same local pattern anywhere on any
+board of any size is then solved once.
+"""
+
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.core.solver import ComponentSolution, Constraint
+
+Point = Tuple[int, int]
+# the constraints of a component over canonical points, sorted
+ShapeKey = Tuple[Tuple[Tuple[Point, ...], int], ...]
+# mine count -> number of solutions, and mine count -> weight of each canonical point
+CachedSolution = Tuple[Dict[int, int], Dict[int, List[float]]]
+
+# the 8 rotations and reflections of a (row, column) point
+SYMMETRIES: Tuple[Callable[[int, int], Point], ...] = (
+    lambda row, column: (row, column),
+    lambda row, column: (column, -row),
+    lambda row, column: (-row, -column),
+    lambda row, column: (-column, row),
+    lambda row, column: (row, -column),
+    lambda row, column: (-column, -row),
+    lambda row, column: (-row, column),
+    lambda row, column: (column, row),
+)
+
+
+def canonical_shape(
+    constraints: Sequence[Constraint], width: int
+) -> Tuple[ShapeKey, Dict[int, Point]]:
+    """
+    The canonical key of a component on a board of the given width, the smallest among its
+    symmetric images, and the canonical point of each of its cells.
+    """
+    cells = {cell for constraint_cells, _ in constraints for cell in constraint_cells}
+    points = {cell: divmod(cell, width) for cell in cells}
+    best_key: Optional[ShapeKey] = None
+    best_points: Dict[int, Point] = {}
+    for symmetry in SYMMETRIES:
+        moved = {cell: symmetry(*point) for cell, point in points.items()}
+        top = min(row for row, _ in moved.values())
+        left = min(column for _, column in moved.values())
+        moved = {cell: (row - top, column - left) for cell, (row, column) in moved.items()}
+        key = tuple(
+            sorted(
+                (tuple(sorted(moved[cell] for cell in constraint_cells)), mines)
+                for constraint_cells, mines in constraints
+            )
+        )
+        if best_key is None or key < best_key:
+            best_key, best_points = key, moved
+    assert best_key is not None
+    return best_key, best_points
+
+
+class SolutionCache:
+    """
+    LRU cache of component solutions keyed by canonical shape, holding at most max_size shapes.
+    With a path, the cache starts from the shapes saved there and save writes them back.
+    """
+
+    def __init__(self, max_size: int = 4096, path: Optional[str] = None) -> None:
+        self.__max_size = max_size
+        self.__path = path
+        self.__solutions: "OrderedDict[ShapeKey, CachedSolution]" = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        if path is not None:
+            self.load(path)
+
+    def __repr__(self) -> str:
+        return (
+            f"SolutionCache(shapes={len(self.__solutions)}, max_size={self.__max_size}, "
+            f"hits={self.__hits}, misses={self.__misses})"
+        )
+
+    def __len__(self) -> int:
+        return len(self.__solutions)
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    def solve(
+        self,
+        constraints: Sequence[Constraint],
+        width: int,
+        enumerate_solutions: Callable[[], ComponentSolution],
+    ) -> ComponentSolution:
+        """
+        The solution of the component, looked up by its shape on a board of the given width.
+        An unknown shape is solved with enumerate_solutions and kept, unless it raises.
+        """
+        key, points = canonical_shape(constraints, width)
+        cached = self.__solutions.get(key)
+        if cached is None:
+            self.__misses += 1
+            solution = enumerate_solutions()
+            self.__put(key, points, solution)
+            return solution
+        self.__hits += 1
+        self.__solutions.move_to_end(key)
+        totals, point_counts = cached
+        cell_at = {point: cell for cell, point in points.items()}
+        cells = [cell_at[point] for point in sorted(cell_at)]
+        return ComponentSolution(
+            cells, dict(totals), {mines: list(counts) for mines, counts in point_counts.items()}
+        )
+
+    def __put(self, key: ShapeKey, points: Dict[int, Point], solution: ComponentSolution) -> None:
+        """Remember a solution with its counts in canonical order, evicting the least used."""
+        order = sorted(range(len(solution.cells)), key=lambda i: points[solution.cells[i]])
+        point_counts = {
+            mines: [counts[i] for i in order] for mines, counts in solution.cell_counts.items()
+        }
+        self.__solutions[key] = (dict(solution.totals), point_counts)
+        while len(self.__solutions) > self.__max_size:
+            self.__solutions.popitem(last=False)
+
+    def clear(self) -> None:
+        self.__solutions.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Write the shapes to path, by default the one the cache was created with, as JSON."""
+        path = path if path is not None else self.__path
+        if path is None:
+            raise ValueError("No path to save the solution cache to.")
+        entries = [
+            [
+                [[[list(point) for point in cells], mines] for cells, mines in key],
+                list(totals.items()),
+                list(point_counts.items()),
+            ]
+            for key, (totals, point_counts) in self.__solutions.items()
+        ]
+        with open(path, "w", encoding="utf-8") as stream:
+            json.dump(entries, stream)
+
+    def load(self, path: str) -> None:
+        """Add the shapes saved at path, a missing file is an empty cache."""
+        try:
+            with open(path, encoding="utf-8") as stream:
+                entries = json.load(stream)
+        except FileNotFoundError:
+            return
+        for key, totals, point_counts in entries:
+            shape: ShapeKey = tuple(
+                (tuple((row, column) for row, column in cells), mines) for cells, mines in key
+            )
+            self.__solutions[shape] = (dict(totals), dict(point_counts))
+        while len(self.__solutions) > self.__max_size:
+            self.__solutions.popitem(last=False)
+
+
+@lru_cache(maxsize=None)
+def shared_cache() -> SolutionCache:
+    """The cache shared by every solver player of the process that is not given its own."""
+    return SolutionCache()
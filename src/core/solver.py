@@ -0,0 +1,507 @@
+"""
+Exact mine probabilities from the constraint frontier.
+The frontier is split into independent components, each component is enumerated with a pruned
+backtracking search, and the components are combined with the unconstrained squares through the
+global mine count.
+"""
+
+from collections import deque
+from math import comb, exp, inf, isqrt, log
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+import numpy as np
+
+from src.core.frontier import Frontier
+
+if TYPE_CHECKING:
+    from src.core.solution_cache import SolutionCache
+
+# unknown squares around a revealed number, and how many mines they still hold
+Constraint = Tuple[Tuple[int, ...], int]
+
+
+class ComponentSolution(NamedTuple):
+    """Solutions of one component, grouped by the number of mines they place."""
+
+    cells: List[int]
+    totals: Dict[int, int]
+    # mine count -> for each cell, the number (or weight) of solutions where it holds a mine
+    cell_counts: Dict[int, List[float]]
+
+
+class BudgetExceededError(Exception):
+    """Raised when enumerating a component goes over its search budget."""
+
+
+def build_constraints(frontier: Frontier) -> List[Constraint]:
+    """Collect the constraints of every revealed number on the frontier, without duplicates."""
+    constraints = {
+        (tuple(sorted(frontier.unknown_neighbours(number))), frontier.remaining_mines(number))
+        for number in frontier.numbers
+    }
+    return sorted(constraints)
+
+
+def deduce(constraints: Sequence[Constraint]) -> Tuple[Set[int], Set[int]]:
+    """
+    Find the cells that are certainly safe and certainly mined without any enumeration.
+    A number with no mine left clears its cells, a number with as many mines as cells mines them
+    all, and when one of two overlapping numbers needs as many more mines than the other as it
+    has cells of its own, those cells are mines and the other's own cells are safe (this covers
+    the subset rule). Known cells are removed from the constraints until nothing new is found.
+    Returns the safe and the mined cells.
+    """
+    safe: Set[int] = set()
+    mines: Set[int] = set()
+    pending = list(constraints)
+    while pending:
+        reduced: List[Tuple[FrozenSet[int], int]] = []
+        for cells, count in pending:
+            unknown = frozenset(cell for cell in cells if cell not in safe and cell not in mines)
+            if unknown:
+                reduced.append((unknown, count - sum(1 for cell in cells if cell in mines)))
+
+        found = False
+        for unknown, count in reduced:
+            if count == 0:
+                safe |= unknown
+                found = True
+            elif count == len(unknown):
+                mines |= unknown
+                found = True
+        if not found:
+            found = _deduce_pairs(reduced, safe, mines)
+        if not found:
+            break
+        pending = [(tuple(unknown), count) for unknown, count in reduced]
+    return safe, mines
+
+
+def _deduce_pairs(
+    constraints: Sequence[Tuple[FrozenSet[int], int]], safe: Set[int], mines: Set[int]
+) -> bool:
+    """Apply the overlapping pair rule to every pair of constraints sharing a cell."""
+    by_cell: Dict[int, List[int]] = {}
+    for constraint_id, (cells, _) in enumerate(constraints):
+        for cell in cells:
+            by_cell.setdefault(cell, []).append(constraint_id)
+
+    found = False
+    compared: Set[Tuple[int, int]] = set()
+    for constraint_ids in by_cell.values():
+        for first in constraint_ids:
+            for second in constraint_ids:
+                if first == second or (first, second) in compared:
+                    continue
+                compared.add((first, second))
+                first_cells, first_mines = constraints[first]
+                second_cells, second_mines = constraints[second]
+                only_first = first_cells - second_cells
+                if first_mines - second_mines == len(only_first):
+                    only_second = second_cells - first_cells
+                    if not only_first <= mines or not only_second <= safe:
+                        mines |= only_first
+                        safe |= only_second
+                        found = True
+    return found
+
+
+def split_components(constraints: Sequence[Constraint]) -> List[List[Constraint]]:
+    """Group constraints that share unknown squares, directly or through other constraints."""
+    parent: Dict[int, int] = {}
+
+    def find(cell: int) -> int:
+        root = cell
+        while parent[root] != root:
+            root = parent[root]
+        while parent[cell] != root:
+            parent[cell], cell = root, parent[cell]
+        return root
+
+    for cells, _ in constraints:
+        for cell in cells:
+            parent.setdefault(cell, cell)
+        for cell in cells[1:]:
+            parent[find(cell)] = find(cells[0])
+
+    components: Dict[int, List[Constraint]] = {}
+    for constraint in constraints:
+        if constraint[0]:
+            components.setdefault(find(constraint[0][0]), []).append(constraint)
+    return list(components.values())
+
+
+def enumerate_component(
+    constraints: Sequence[Constraint], max_nodes: int, deadline: float
+) -> ComponentSolution:
+    """
+    Count every mine layout of a component that satisfies all its constraints.
+    Cells covered by exactly the same constraints are interchangeable, so they are searched
+    together as one group by number of mines, each count weighted by its binomial coefficient.
+    Raises BudgetExceededError when the search visits more than max_nodes nodes or runs past the
+    deadline (a perf_counter timestamp).
+    """
+    constraints = _walk_order(constraints)
+    groups = _group_cells(constraints)
+    group_constraints = list(groups)
+    group_cells = list(groups.values())
+    group_sizes = [len(cells) for cells in group_cells]
+
+    targets = [mines for _, mines in constraints]
+    assigned = [0] * len(constraints)
+    unassigned = [len(constraint_cells) for constraint_cells, _ in constraints]
+
+    totals: Dict[int, int] = {}
+    group_counts: Dict[int, List[float]] = {}
+    layout = [0] * len(group_cells)
+    nodes = 0
+
+    def search(position: int, mines: int, weight: int) -> None:
+        nonlocal nodes
+        nodes += 1
+        if nodes > max_nodes or (nodes & 1023 == 0 and perf_counter() > deadline):
+            raise BudgetExceededError
+        if position == len(group_cells):
+            totals[mines] = totals.get(mines, 0) + weight
+            counts = group_counts.setdefault(mines, [0.0] * len(group_cells))
+            for group_id, group_mines in enumerate(layout):
+                counts[group_id] += weight * group_mines
+            return
+
+        size = group_sizes[position]
+        constraint_ids = group_constraints[position]
+        for constraint_id in constraint_ids:
+            unassigned[constraint_id] -= size
+        for group_mines in range(size + 1):
+            if all(
+                assigned[constraint_id] + group_mines <= targets[constraint_id]
+                and assigned[constraint_id] + group_mines + unassigned[constraint_id]
+                >= targets[constraint_id]
+                for constraint_id in constraint_ids
+            ):
+                for constraint_id in constraint_ids:
+                    assigned[constraint_id] += group_mines
+                layout[position] = group_mines
+                search(position + 1, mines + group_mines, weight * comb(size, group_mines))
+                for constraint_id in constraint_ids:
+                    assigned[constraint_id] -= group_mines
+        for constraint_id in constraint_ids:
+            unassigned[constraint_id] += size
+        layout[position] = 0
+
+    search(0, 0, 1)
+
+    # spread each group count evenly over its interchangeable cells
+    cells = [cell for group in group_cells for cell in group]
+    cell_counts = {
+        mines: [
+            counts[group_id] / group_sizes[group_id]
+            for group_id, group in enumerate(group_cells)
+            for _ in group
+        ]
+        for mines, counts in group_counts.items()
+    }
+    return ComponentSolution(cells, totals, cell_counts)
+
+
+def _group_cells(constraints: Sequence[Constraint]) -> Dict[Tuple[int, ...], List[int]]:
+    """Group the cells by the constraints covering them, in the order the cells first appear."""
+    memberships: Dict[int, List[int]] = {}
+    for constraint_id, (constraint_cells, _) in enumerate(constraints):
+        for cell in constraint_cells:
+            memberships.setdefault(cell, []).append(constraint_id)
+    groups: Dict[Tuple[int, ...], List[int]] = {}
+    for cell, constraint_ids in memberships.items():
+        groups.setdefault(tuple(constraint_ids), []).append(cell)
+    return groups
+
+
+def _walk_order(constraints: Sequence[Constraint]) -> List[Constraint]:
+    """Order constraints breadth first through shared cells, so neighbours stay close."""
+    by_cell: Dict[int, List[int]] = {}
+    for constraint_id, (cells, _) in enumerate(constraints):
+        for cell in cells:
+            by_cell.setdefault(cell, []).append(constraint_id)
+
+    ordered: List[Constraint] = []
+    visited = [False] * len(constraints)
+    for start in range(len(constraints)):
+        if visited[start]:
+            continue
+        visited[start] = True
+        queue = deque([start])
+        while queue:
+            constraint_id = queue.popleft()
+            ordered.append(constraints[constraint_id])
+            for cell in constraints[constraint_id][0]:
+                for other in by_cell[cell]:
+                    if not visited[other]:
+                        visited[other] = True
+                        queue.append(other)
+    return ordered
+
+
+def approximate_component(constraints: Sequence[Constraint]) -> ComponentSolution:
+    """Estimate a component too large to enumerate by averaging the local mine densities."""
+    densities: Dict[int, List[float]] = {}
+    for constraint_cells, mines in constraints:
+        density = min(max(mines / len(constraint_cells), 0.0), 1.0)
+        for cell in constraint_cells:
+            densities.setdefault(cell, []).append(density)
+    cells = list(densities)
+    probabilities = [sum(densities[cell]) / len(densities[cell]) for cell in cells]
+    expected = round(sum(probabilities))
+    return ComponentSolution(cells, {expected: 1}, {expected: probabilities})
+
+
+class ConstraintSolver:
+    """
+    Computes the probability of every frontier square being a mine.
+    Components larger than max_component_size, or whose enumeration goes over max_nodes or over
+    the time_limit (in seconds) shared by a whole solve, are approximated instead. Combining the
+    components gets what is left of the time_limit, at least a tenth of it, before falling back
+    to the local estimates.
+    With a cache, the exact solutions are memoized by component shape, see solution_cache.
+    """
+
+    def __init__(
+        self,
+        max_component_size: int = 128,
+        max_nodes: int = 200_000,
+        time_limit: float = 0.5,
+        cache: Optional["SolutionCache"] = None,
+    ) -> None:
+        self.__max_component_size = max_component_size
+        self.__max_nodes = max_nodes
+        self.__time_limit = time_limit
+        self.__cache = cache
+
+    def __repr__(self) -> str:
+        return (
+            f"ConstraintSolver(max_component_size={self.__max_component_size}, "
+            f"max_nodes={self.__max_nodes}, time_limit={self.__time_limit})"
+        )
+
+    @property
+    def cache(self) -> Optional["SolutionCache"]:
+        return self.__cache
+
+    def solve_component(
+        self, constraints: Sequence[Constraint], deadline: float, width: Optional[int] = None
+    ) -> ComponentSolution:
+        """
+        Enumerate a component when it fits the budget, approximate it otherwise.
+        The cache is only used with the width of the board, to know the shape of the component.
+        """
+        cell_count = len({cell for cells, _ in constraints for cell in cells})
+        if cell_count <= self.__max_component_size:
+            try:
+                if self.__cache is not None and width is not None:
+                    return self.__cache.solve(
+                        constraints,
+                        width,
+                        lambda: enumerate_component(constraints, self.__max_nodes, deadline),
+                    )
+                return enumerate_component(constraints, self.__max_nodes, deadline)
+            except BudgetExceededError:
+                pass
+        return approximate_component(constraints)
+
+    def solve(
+        self,
+        constraints: Sequence[Constraint],
+        mines_left: int,
+        interior_size: int,
+        width: Optional[int] = None,
+    ) -> Tuple[Dict[int, float], Optional[float]]:
+        """
+        Return the mine probability of every constrained square, and of any of the interior_size
+        unconstrained squares (None when there is none), given mines_left mines on unknown squares.
+        width is the width of the board, needed by the cache.
+        """
+        deadline = perf_counter() + self.__time_limit
+        solutions = [
+            self.solve_component(component, deadline, width)
+            for component in split_components(constraints)
+        ]
+        deadline = max(deadline, perf_counter() + self.__time_limit / 10)
+        return combine(solutions, mines_left, interior_size, deadline)
+
+
+def combine(
+    solutions: Sequence[ComponentSolution],
+    mines_left: int,
+    interior_size: int,
+    deadline: Optional[float] = None,
+) -> Tuple[Dict[int, float], Optional[float]]:
+    """
+    Weight the component solutions with the number of ways to fill the interior squares.
+    Every weight is carried as a logarithm, so no huge binomial is ever built or converted. A
+    forward pass over the components and a backward pass carrying the interior weights keep the
+    cost linear in the number of components.
+    Past the deadline (a perf_counter timestamp) the local estimates are returned instead.
+    """
+    distributions = [_log_distribution(solution.totals) for solution in solutions]
+    forward = _forward_pass(distributions, deadline)
+    if forward is None:
+        return _unweighted(solutions, mines_left, interior_size)
+    checkpoints, everything = forward
+
+    interior = _interior_log_ways(mines_left, interior_size, len(everything) - 1)
+    weighted = everything + interior
+    log_total = _log_sum(weighted)
+    if log_total == -inf:
+        # inconsistent information (e.g. wrong flags), keep the local estimates
+        return _unweighted(solutions, mines_left, interior_size)
+
+    probabilities = _backward_pass(
+        solutions, distributions, checkpoints, interior - log_total, deadline
+    )
+    if probabilities is None:
+        return _unweighted(solutions, mines_left, interior_size)
+
+    interior_probability = None
+    if interior_size > 0:
+        interior_mines = mines_left - np.arange(len(weighted))
+        expected_interior = float((np.exp(weighted - log_total) * interior_mines).sum())
+        interior_probability = expected_interior / interior_size
+    return probabilities, interior_probability
+
+
+def _forward_pass(
+    distributions: Sequence[np.ndarray], deadline: Optional[float]
+) -> Optional[Tuple[List[np.ndarray], np.ndarray]]:
+    """
+    The distribution of the mines of all the components, and checkpoints of the distribution
+    of the mines before every sqrt(components) components. None past the deadline.
+    """
+    block = max(1, isqrt(len(distributions)))
+    checkpoints: List[np.ndarray] = []
+    everything = np.zeros(1)
+    for position, distribution in enumerate(distributions):
+        if position % block == 0:
+            checkpoints.append(everything)
+        everything = _log_convolve(everything, distribution)
+        if deadline is not None and perf_counter() > deadline:
+            return None
+    return checkpoints, everything
+
+
+def _backward_pass(
+    solutions: Sequence[ComponentSolution],
+    distributions: Sequence[np.ndarray],
+    checkpoints: Sequence[np.ndarray],
+    interior: np.ndarray,
+    deadline: Optional[float],
+) -> Optional[Dict[int, float]]:
+    """
+    The mine probability of every frontier cell, given the normalized interior weights.
+    The components are visited last to first, suffix[x] weighing the components after the
+    current one and the interior when x mines are placed before them, and the distributions of
+    the mines before each component are recomputed from the checkpoints one block at a time.
+    None past the deadline.
+    """
+    block = max(1, isqrt(len(solutions)))
+    probabilities: Dict[int, float] = {}
+    suffix = interior
+    for start in reversed(range(0, len(solutions), block)):
+        prefixes = [checkpoints[start // block]]
+        stop = min(start + block, len(solutions))
+        for position in range(start, stop - 1):
+            prefixes.append(_log_convolve(prefixes[-1], distributions[position]))
+        for position in reversed(range(start, stop)):
+            prefix = prefixes[position - start]
+            solution = solutions[position]
+            for mines, counts in solution.cell_counts.items():
+                share = exp(_log_sum(prefix + suffix[mines : mines + len(prefix)]))
+                for cell, count in zip(solution.cells, counts):
+                    probabilities[cell] = probabilities.get(cell, 0.0) + count * share
+            for cell in solution.cells:
+                probabilities.setdefault(cell, 0.0)
+            # only the mine counts of the components before this one are looked up from now on
+            suffix = _log_correlate(suffix, distributions[position], len(prefix))
+        if deadline is not None and perf_counter() > deadline:
+            return None
+    return probabilities
+
+
+def _log_distribution(totals: Dict[int, int]) -> np.ndarray:
+    """Logarithm of the number of solutions by mine count, indexed by the mine count."""
+    distribution = np.full(max(totals) + 1, -inf)
+    for mines, ways in totals.items():
+        if ways > 0:
+            distribution[mines] = log(ways)
+    return distribution
+
+
+def _log_sum(logs: np.ndarray) -> float:
+    """Logarithm of the sum of the numbers whose logarithms are given."""
+    top = float(logs.max())
+    if top == -inf:
+        return top
+    return top + log(float(np.exp(logs - top).sum()))
+
+
+def _log_convolve(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Distribution of the sum of two independent mine counts, in logarithms."""
+    result = np.full(len(left) + len(right) - 1, -inf)
+    for shift, weight in enumerate(right):
+        if weight != -inf:
+            window = result[shift : shift + len(left)]
+            np.logaddexp(window, left + weight, out=window)
+    return result
+
+
+def _log_correlate(suffix: np.ndarray, distribution: np.ndarray, length: int) -> np.ndarray:
+    """result[x] sums distribution[c] * suffix[x + c] for x below length, in logarithms."""
+    result = np.full(length, -inf)
+    for shift, weight in enumerate(distribution):
+        size = min(length, len(suffix) - shift)
+        if weight != -inf and size > 0:
+            window = result[:size]
+            np.logaddexp(window, suffix[shift : shift + size] + weight, out=window)
+    return result
+
+
+def _interior_log_ways(mines_left: int, interior_size: int, highest: int) -> np.ndarray:
+    """
+    Logarithm of the number of ways to put the mines left by each frontier mine count up to
+    highest on the interior squares, up to a common constant, -inf when impossible.
+    Consecutive binomials differ by the ratio comb(n, k) / comb(n, k + 1) = (k + 1) / (n - k),
+    so they are summed as logarithms instead of being built.
+    """
+    interior_mines = mines_left - np.arange(highest + 1)
+    valid = (interior_mines >= 0) & (interior_mines <= interior_size)
+    logs = np.full(highest + 1, -inf)
+    if valid.any():
+        # decreasing as the frontier holds more mines
+        counts = interior_mines[valid]
+        steps = np.log(counts[1:] + 1) - np.log(interior_size - counts[1:])
+        logs[valid] = np.concatenate(([0.0], np.cumsum(steps)))
+    return logs
+
+
+def _unweighted(
+    solutions: Sequence[ComponentSolution], mines_left: int, interior_size: int
+) -> Tuple[Dict[int, float], Optional[float]]:
+    probabilities: Dict[int, float] = {}
+    for solution in solutions:
+        layouts = sum(solution.totals.values())
+        for position, cell in enumerate(solution.cells):
+            mined = sum(counts[position] for counts in solution.cell_counts.values())
+            probabilities[cell] = mined / layouts if layouts else 0.5
+    interior_probability = None
+    if interior_size > 0:
+        interior_probability = min(max(mines_left / interior_size, 0.0), 1.0)
+    return probabilities, interior_probability
@@ -0,0 +1,231 @@
+"""
+Headless benchmark of the bot players.
+Every player plays the same seeded boards across a process pool, and the tournament reports the
+win rate, the number of moves per game and the per-move latency percentiles of the player. A
+turn's time is shared evenly by the moves it applied, so batching players and single-move players
+compare on the same scale.
+
+Usage: python -m src.core.tournament --width 30 --height 16 --mines 99 --games 1000
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+import numpy as np
+
+from src.core.game_logic import FIRST_CLICK_MODES, GameLogic
+from src.core.player import HumanPlayer, Player
+
+
+class GameResult(NamedTuple):
+    player: str
+    won: bool
+    moves: int
+    move_times: List[float]
+
+
+class PlayerReport(NamedTuple):
+    player: str
+    games: int
+    win_rate: float
+    moves_per_game: float
+    latency_percentiles: Dict[int, float]
+    games_per_second: float
+
+
+PERCENTILES = (50, 90, 99, 100)
+
+
+def available_players() -> Dict[str, Type[Player]]:
+    """
+    Every concrete bot player, found among the subclasses of Player.
+    They must accept the name and seed keyword arguments.
+    """
+    players: Dict[str, Type[Player]] = {}
+    pending: List[Type[Player]] = Player.__subclasses__()
+    while pending:
+        player_class = pending.pop()
+        pending.extend(player_class.__subclasses__())
+        if player_class is not HumanPlayer and not getattr(
+            player_class, "__abstractmethods__", None
+        ):
+            players[player_class.__name__] = player_class
+    return players
+
+
+def game_seeds(seed: int, games: int) -> List[Tuple[int, int]]:
+    """Independent (board, player) seed pairs for each game, all derived from one seed."""
+    return [
+        (int(board_seed), int(player_seed))
+        for board_seed, player_seed in (
+            sequence.generate_state(2, dtype=np.uint64)
+            for sequence in np.random.SeedSequence(seed).spawn(games)
+        )
+    ]
+
+
+def play_game(
+    player_name: str,
+    width: int,
+    height: int,
+    mine_count: int,
+    seeds: Tuple[int, int],
+    first_click: str = "none",
+) -> GameResult:
+    """
+    Play one game without any interface, the board and the player seeded from seeds.
+    first_click is the safe first click mode of the board, see GameLogic.
+    """
+    board_seed, player_seed = seeds
+    player = available_players()[player_name](name=player_name, seed=player_seed)
+    game_logic = GameLogic(
+        width=width,
+        height=height,
+        mine_count=mine_count,
+        player=player,
+        seed=board_seed,
+        first_click=first_click,
+    )
+
+    move_times: List[float] = []
+    moves = 0
+    turns = 0
+    # a bot that stops making progress loses instead of hanging the tournament
+    max_turns = 4 * width * height
+    while not game_logic.is_game_over() and turns < max_turns:
+        start = perf_counter()
+        batch = player.make_moves(game_logic.observation)
+        elapsed = perf_counter() - start
+        turns += 1
+        applied = game_logic.make_moves(batch).applied_moves
+        moves += applied
+        # one sample per applied move, a turn that applied none still counts once
+        samples = max(applied, 1)
+        move_times.extend([elapsed / samples] * samples)
+    return GameResult(player_name, game_logic.is_game_won(), moves, move_times)
+
+
+def percentile(values: Sequence[float], percent: int) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not values:
+        return 0.0
+    rank = max(0, min(len(values) - 1, -(-percent * len(values) // 100) - 1))
+    return values[rank]
+
+
+def summarize(player: str, results: Iterable[GameResult], elapsed: float) -> PlayerReport:
+    games = 0
+    wins = 0
+    moves = 0
+    move_times: List[float] = []
+    for result in results:
+        games += 1
+        wins += result.won
+        moves += result.moves
+        move_times.extend(result.move_times)
+    move_times.sort()
+    return PlayerReport(
+        player=player,
+        games=games,
+        win_rate=wins / games if games else 0.0,
+        moves_per_game=moves / games if games else 0.0,
+        latency_percentiles={percent: percentile(move_times, percent) for percent in PERCENTILES},
+        games_per_second=games / elapsed if elapsed > 0 else 0.0,
+    )
+
+
+def run_tournament(
+    player_names: Sequence[str],
+    width: int,
+    height: int,
+    mine_count: int,
+    games: int,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    first_click: str = "none",
+) -> List[PlayerReport]:
+    """
+    Play games games per player on a process pool. Each game gets its own independent random
+    streams derived from seed, and game i is played on the same board by every player, so the
+    results are reproducible and comparable between players. With a safe first click mode,
+    game i is the same board for every player who opens on the same square.
+    """
+    seeds = game_seeds(seed, games)
+    reports = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for player_name in player_names:
+            start = perf_counter()
+            results = list(
+                executor.map(
+                    play_game,
+                    [player_name] * games,
+                    [width] * games,
+                    [height] * games,
+                    [mine_count] * games,
+                    seeds,
+                    [first_click] * games,
+                    chunksize=max(1, games // (4 * (workers or 8))),
+                )
+            )
+            reports.append(summarize(player_name, results, perf_counter() - start))
+    return reports
+
+
+def format_reports(reports: Sequence[PlayerReport]) -> str:
+    header = f"{'player':<16}{'games':>8}{'win rate':>10}{'moves':>9}"
+    header += "".join(f"{'p' + str(percent) + ' ms/move':>13}" for percent in PERCENTILES)
+    header += f"{'games/s':>10}"
+    lines = [header, "-" * len(header)]
+    for report in reports:
+        line = f"{report.player:<16}{report.games:>8}{report.win_rate:>10.1%}"
+        line += f"{report.moves_per_game:>9.1f}"
+        line += "".join(
+            f"{report.latency_percentiles[percent] * 1000:>13.3f}" for percent in PERCENTILES
+        )
+        line += f"{report.games_per_second:>10.1f}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    players = available_players()
+    parser = argparse.ArgumentParser(description="Benchmark the Minesweeper bot players.")
+    parser.add_argument("--width", type=int, default=30)
+    parser.add_argument("--height", type=int, default=16)
+    parser.add_argument("--mines", type=int, default=99)
+    parser.add_argument("--games", type=int, default=100, help="games per player")
+    parser.add_argument(
+        "--players", nargs="+", choices=sorted(players), default=sorted(players), metavar="PLAYER"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed of the whole tournament")
+    parser.add_argument("--workers", type=int, default=None, help="defaults to the CPU count")
+    parser.add_argument(
+        "--first-click",
+        choices=FIRST_CLICK_MODES,
+        default="none",
+        help="keep the first reveal safe: only its square, or its 3x3 area for an opening",
+    )
+    args = parser.parse_args(argv)
+
+    reports = run_tournament(
+        args.players,
+        args.width,
+        args.height,
+        args.mines,
+        args.games,
+        args.seed,
+        args.workers,
+        args.first_click,
+    )
+    print(
+        f"{args.games} games per player on {args.width}x{args.height} boards "
+        f"with {args.mines} mines, seed {args.seed}"
+    )
+    print(format_reports(reports))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,186 @@
+"""
+Many games of the same size played in lockstep, for batch self-play and evaluation.
+The boards live in shared (games, height, width) arrays and every call advances all of them with
+whole-array NumPy operations, cascades included, instead of one Python call per game and move.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src.core.encoding import one_hot_states
+from src.core.observation import STATE_FLAGGED, STATE_MINE, STATE_UNKNOWN
+
+PLAYING = 0
+WON = 1
+LOST = -1
+
+
+def dilate(mask: np.ndarray) -> np.ndarray:
+    """Grow boolean (games, height, width) masks by one square in the 8 directions."""
+    height, width = mask.shape[1:]
+    padded = np.pad(mask, ((0, 0), (1, 1), (1, 1)))
+    grown = np.zeros_like(mask)
+    for dy in range(3):
+        for dx in range(3):
+            grown |= padded[:, dy : dy + height, dx : dx + width]
+    return grown
+
+
+class VectorEnv:
+    """
+    A batch of Minesweeper games stepped together.
+    An action is a flat square index: below width * height it reveals the square, above it flags
+    the square at action - width * height. A step returns the state of every board, as the
+    compact states of Observation.state, the rewards (1 for a win, -1 for a loss, 0 otherwise)
+    and which games ended. With auto_reset the ended games start over on a new layout at once,
+    so the returned states are already those of the new games.
+    """
+
+    def __init__(
+        self,
+        games: int,
+        width: int,
+        height: int,
+        mine_count: int,
+        seed: Optional[int] = None,
+        auto_reset: bool = True,
+    ) -> None:
+        if mine_count > width * height:
+            raise ValueError("Mine count exceeds the number of cells on the board.")
+        self.__width = width
+        self.__height = height
+        self.__mine_count = mine_count
+        self.__rng = np.random.default_rng(seed)
+        self.__auto_reset = auto_reset
+        shape = (games, height, width)
+        self.__mines = np.zeros(shape, dtype=bool)
+        self.__adjacent = np.zeros(shape, dtype=np.uint8)
+        self.__revealed = np.zeros(shape, dtype=bool)
+        self.__flagged = np.zeros(shape, dtype=bool)
+        self.__outcome = np.zeros(games, dtype=np.int8)
+        self.reset()
+
+    def __repr__(self) -> str:
+        return (
+            f"VectorEnv(games={self.games}, width={self.__width}, height={self.__height}, "
+            f"mine_count={self.__mine_count})"
+        )
+
+    @property
+    def games(self) -> int:
+        return len(self.__outcome)
+
+    @property
+    def size(self) -> int:
+        """Number of squares of each board, the flag actions start there."""
+        return self.__width * self.__height
+
+    @property
+    def mines(self) -> np.ndarray:
+        """The mine layouts, (games, height, width) booleans. Not for the players' eyes."""
+        return self.__mines
+
+    @property
+    def revealed(self) -> np.ndarray:
+        return self.__revealed
+
+    @property
+    def flagged(self) -> np.ndarray:
+        return self.__flagged
+
+    @property
+    def outcome(self) -> np.ndarray:
+        """PLAYING, WON or LOST for each game, ended games stay so until they are reset."""
+        return self.__outcome
+
+    def reset(self, games: Optional[np.ndarray] = None) -> np.ndarray:
+        """Start new games, all of them or those selected by a boolean mask, return the states."""
+        selected = np.arange(self.games) if games is None else np.flatnonzero(games)
+        count = len(selected)
+        if count:
+            flat_mines = np.zeros((count, self.size), dtype=bool)
+            if self.__mine_count:
+                # the smallest random keys pick distinct squares for every game at once
+                keys = self.__rng.random((count, self.size))
+                squares = np.argpartition(keys, self.__mine_count - 1, axis=1)
+                flat_mines[np.arange(count)[:, None], squares[:, : self.__mine_count]] = True
+            mines = flat_mines.reshape((count, self.__height, self.__width))
+            padded = np.pad(mines, ((0, 0), (1, 1), (1, 1))).astype(np.uint8)
+            adjacent = np.zeros(mines.shape, dtype=np.uint8)
+            for dy in range(3):
+                for dx in range(3):
+                    adjacent += padded[:, dy : dy + self.__height, dx : dx + self.__width]
+            adjacent[mines] = 0
+            self.__mines[selected] = mines
+            self.__adjacent[selected] = adjacent
+            self.__revealed[selected] = False
+            self.__flagged[selected] = False
+            self.__outcome[selected] = PLAYING
+        return self.states()
+
+    def states(self) -> np.ndarray:
+        """Every board as the player sees it, (games, height, width) Observation states."""
+        hidden = np.where(self.__flagged, STATE_FLAGGED, STATE_UNKNOWN)
+        shown = np.where(self.__mines, STATE_MINE, self.__adjacent)
+        return np.where(self.__revealed, shown, hidden).astype(np.uint8)
+
+    def encode(self, out: Optional[np.ndarray] = None, dtype: type = np.float32) -> np.ndarray:
+        """Every board one-hot encoded, see encoding.one_hot_batch."""
+        return one_hot_states(self.states(), out, dtype)
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Play one action in every game. Actions on ended games (without auto_reset), reveals of
+        revealed squares and flags on revealed squares change nothing.
+        Returns the states, the rewards and the games that ended with this step.
+        """
+        actions = np.asarray(actions, dtype=np.intp)
+        if actions.shape != (self.games,):
+            raise ValueError(f"Expected {self.games} actions, got shape {actions.shape}.")
+        if actions.size and (actions.min() < 0 or actions.max() >= 2 * self.size):
+            raise ValueError(f"Actions must be between 0 and {2 * self.size - 1}.")
+        playing = self.__outcome == PLAYING
+        flag = actions >= self.size
+        games = np.arange(self.games)
+        y, x = np.divmod(np.where(flag, actions - self.size, actions), self.__width)
+
+        flagging = playing & flag & ~self.__revealed[games, y, x]
+        self.__flagged[games[flagging], y[flagging], x[flagging]] ^= True
+
+        revealing = playing & ~flag & ~self.__revealed[games, y, x]
+        self.__reveal(games[revealing], y[revealing], x[revealing])
+
+        rewards = np.zeros(self.games, dtype=np.float32)
+        lost = revealing & self.__mines[games, y, x]
+        won = revealing & ~lost & (self.__mines | self.__revealed).all(axis=(1, 2))
+        self.__outcome[lost] = LOST
+        self.__outcome[won] = WON
+        rewards[lost] = -1.0
+        rewards[won] = 1.0
+        done = lost | won
+        if self.__auto_reset and done.any():
+            self.reset(done)
+        return self.states(), rewards, done
+
+    def __reveal(self, games: np.ndarray, y: np.ndarray, x: np.ndarray) -> None:
+        """
+        Reveal one square in each of the games, then flood the empty regions by repeated
+        dilation of the empty squares revealed by the previous round, stopped by flags and
+        squares already revealed, exactly like Board.reveal.
+        """
+        self.__revealed[games, y, x] = True
+        cascading = self.__adjacent[games, y, x] == 0
+        cascading &= ~self.__mines[games, y, x]
+        games = games[cascading]
+        front = np.zeros((games.size, self.__height, self.__width), dtype=bool)
+        front[np.arange(games.size), y[cascading], x[cascading]] = True
+        while games.size:
+            grown = dilate(front)
+            grown &= ~self.__revealed[games]
+            grown &= ~self.__flagged[games]
+            self.__revealed[games] |= grown
+            # only the newly revealed empty squares carry the cascade on
+            front = grown & (self.__adjacent[games] == 0)
+            still = front.any(axis=(1, 2))
+            games, front = games[still], front[still]
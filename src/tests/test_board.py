@@ -32,8 +32,60 @@ class TestBoard(unittest.TestCase):
         self.assertIsNotNone(cell)
         self.assertEqual(cell.adjacent_mines, 0)
 
-        out_of_bounds_cell = self.board.get_cell(10, 10)
-        self.assertIsNone(out_of_bounds_cell)
+        with self.assertRaises(ValueError):
+            self.board.get_cell(10, 10)
+
+    def test_cell_is_a_view(self) -> None:
+        self.board.get_cell(1, 2).adjacent_mines = -1
+        self.assertTrue(self.board.get_cell(1, 2).is_mine())
+        self.assertEqual(self.board.grid.mines[self.board.index(1, 2)], 1)
+
+        self.board.get_cell(3, 0).toggle_flag()
+        self.assertTrue(self.board.cells[0][3].is_flagged())
+        self.assertEqual(self.board.get_flagged_count(), 1)
+
+    def test_index_and_position(self) -> None:
+        self.assertEqual(self.board.index(3, 2), 13)
+        self.assertEqual(self.board.position(13), (3, 2))
+        self.assertEqual(self.board.size, 25)
+
+    def test_place_mines(self) -> None:
+        self.board.place_mines([0, 6, 24])
+        self.assertTrue(self.board.get_cell(0, 0).is_mine())
+        self.assertTrue(self.board.get_cell(1, 1).is_mine())
+        self.assertTrue(self.board.get_cell(4, 4).is_mine())
+        self.assertEqual(self.board.get_cell(1, 0).adjacent_mines, 2)
+        self.assertEqual(self.board.get_cell(2, 2).adjacent_mines, 1)
+        self.assertEqual(self.board.get_cell(3, 3).adjacent_mines, 1)
+        self.assertEqual(self.board.get_cell(4, 0).adjacent_mines, 0)
+
+        # placing again replaces the previous layout
+        self.board.place_mines([12])
+        self.assertFalse(self.board.get_cell(0, 0).is_mine())
+        self.assertEqual(self.board.get_cell(1, 0).adjacent_mines, 0)
+        self.assertEqual(self.board.get_cell(1, 1).adjacent_mines, 1)
+
+    def test_reveal_cascade(self) -> None:
+        self.board.place_mines([4, 9])
+        self.board.get_cell(0, 4).toggle_flag()
+        revealed = self.board.reveal(0, 0)
+        # the whole empty region opens up to its numbered border, the flag stops the cascade
+        self.assertIn((2, 4), revealed)
+        self.assertIn((3, 1), revealed)
+        self.assertNotIn((0, 4), revealed)
+        self.assertNotIn((4, 0), revealed)
+        self.assertNotIn((4, 1), revealed)
+        self.assertEqual(len(revealed), 22)
+        self.assertEqual(self.board.get_revealed_count(), 22)
+        self.assertEqual(self.board.reveal(1, 1), set())
+
+    def test_reveal_numbered_cell(self) -> None:
+        self.board.place_mines([12])
+        self.assertEqual(self.board.reveal(2, 1), {(2, 1)})
+
+    def test_reveal_large_region(self) -> None:
+        board = Board(200, 200)
+        self.assertEqual(len(board.reveal(100, 100)), 200 * 200)
 
     def test_get_random_cell(self) -> None:
         cell = self.board.get_random_cell()
@@ -41,6 +93,24 @@ class TestBoard(unittest.TestCase):
         self.assertIn(cell, [c for row in self.board.cells for c in row])
         self.assertEqual(cell.adjacent_mines, 0)
 
+    def test_get_random_cell_seed(self) -> None:
+        first = Board(20, 20, seed=1)
+        second = Board(20, 20, seed=1)
+        for _ in range(5):
+            first_cell = first.get_random_cell()
+            self.assertEqual(first_cell.index, second.get_random_cell().index)
+
+    def test_copy(self) -> None:
+        board = Board(width=10, height=10, seed=3)
+        board.place_mines([5, 50])
+        board.reveal(9, 9)
+        copy = board.copy()
+        self.assertEqual(copy, board)
+        self.assertEqual(copy.get_revealed_count(), board.get_revealed_count())
+        copy.reveal(5, 0)
+        self.assertNotEqual(copy.get_revealed_count(), board.get_revealed_count())
+        self.assertEqual(copy.get_random_cell().index, board.get_random_cell().index)
+
     def test_get_revealed_count(self) -> None:
         # Initially, no cells are revealed
         self.assertEqual(self.board.get_revealed_count(), 0)
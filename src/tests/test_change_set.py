@@ -0,0 +1,39 @@
+import unittest
+
+from src.core.change_set import ChangeSet
+
+
+class TestChangeSet(unittest.TestCase):
+    def setUp(self) -> None:
+        self.changes = ChangeSet()
+
+    def test_initial_state(self) -> None:
+        self.assertFalse(self.changes)
+        self.assertEqual(self.changes.revealed, set())
+        self.assertEqual(self.changes.applied_moves, 0)
+        self.assertFalse(self.changes.game_over)
+
+    def test_accumulate(self) -> None:
+        self.changes.add_revealed({(0, 0), (1, 0)})
+        self.changes.add_revealed({(1, 0), (2, 0)})
+        self.changes.count_move()
+        self.changes.count_move()
+        self.assertEqual(self.changes.revealed, {(0, 0), (1, 0), (2, 0)})
+        self.assertEqual(self.changes.applied_moves, 2)
+        self.assertTrue(self.changes)
+
+    def test_toggle_flag(self) -> None:
+        self.changes.toggle_flag((3, 3))
+        self.changes.toggle_flag((4, 4))
+        self.changes.toggle_flag((3, 3))
+        self.assertEqual(self.changes.flagged, {(4, 4)})
+
+    def test_end_game(self) -> None:
+        self.changes.end_game(won=True)
+        self.assertTrue(self.changes)
+        self.assertTrue(self.changes.game_over)
+        self.assertTrue(self.changes.game_won)
+
+
+if __name__ == "__main__":
+    unittest.main()
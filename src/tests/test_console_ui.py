@@ -1,7 +1,8 @@
+import io
 import unittest
 
 from src.core.game_logic import GameLogic
-from src.core.player import RandomPlayer
+from src.core.player import RandomPlayer, SolverPlayer
 from src.ui.console_ui import ConsoleUI
 
 
@@ -29,6 +30,46 @@ class TestConsoleUI(unittest.TestCase):
                 self.game_logic.board.get_cell(x, y).reveal()
         self.console_ui.display_board()
 
+    def test_single_write_frame(self) -> None:
+        output = io.StringIO()
+        console_ui = ConsoleUI(self.game_logic, output=output)
+        self.assertFalse(console_ui.incremental)
+        console_ui.display_board()
+        lines = output.getvalue().split("\n")
+        self.assertEqual(lines[1], "Current Board:")
+        self.assertEqual(len(lines), 1 + 1 + 1 + 5 + 1 + 1)
+        self.assertEqual(lines[3].count("?"), 9)
+
+    def test_incremental_display(self) -> None:
+        output = io.StringIO()
+        console_ui = ConsoleUI(self.game_logic, output=output, incremental=True)
+        console_ui.display_board()
+        frame_size = len(output.getvalue())
+
+        # the UI follows the changes published by the game
+        self.game_logic.make_move(3, 2, "flag")
+        console_ui.display_board()
+        update = output.getvalue()[frame_size:]
+        # the cursor goes up from below the bottom border to the row of the cell, then column 9
+        self.assertIn("\033[4A\033[9G", update)
+        self.assertIn("F", update)
+        self.assertLess(len(update), frame_size)
+
+        # nothing changed, nothing written
+        console_ui.display_board()
+        self.assertEqual(len(output.getvalue()), frame_size + len(update))
+
+    def test_quiet(self) -> None:
+        output = io.StringIO()
+        game_logic = GameLogic(
+            width=9, height=9, mine_count=10, player=SolverPlayer(name="Bot", seed=2), seed=2
+        )
+        console_ui = ConsoleUI(game_logic, output=output, quiet=True)
+        console_ui.start_game()
+        self.assertTrue(game_logic.is_game_over())
+        self.assertNotIn("Current Board", output.getvalue())
+        self.assertIn("Bot", output.getvalue())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+
+from src.core.board import Board
+from src.core.encoding import CHANNELS, one_hot, one_hot_batch
+from src.core.game_logic import GameLogic
+from src.core.player import HumanPlayer
+
+
+class TestEncoding(unittest.TestCase):
+    def setUp(self) -> None:
+        self.board = Board(4, 3)
+        self.board.place_mines([3, 11])
+        self.board.reveal(0, 0)
+        self.board.get_cell(3, 2).toggle_flag()
+
+    def test_one_hot(self) -> None:
+        encoded = one_hot(self.board.observation)
+        self.assertEqual(encoded.shape, (CHANNELS, 3, 4))
+        self.assertEqual(encoded.dtype, np.float32)
+        # unknown, flag, then the numbers 0 to 8
+        self.assertEqual(list(encoded[:, 0, 0]), [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0])
+        self.assertEqual(list(encoded[:, 0, 2]), [0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0])
+        self.assertEqual(list(encoded[:, 0, 3]), [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0])
+        self.assertEqual(list(encoded[:, 2, 3]), [0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0])
+        self.assertTrue(np.all(encoded.sum(axis=0) == 1))
+
+    def test_revealed_mine(self) -> None:
+        self.board.reveal(3, 0)
+        encoded = one_hot(self.board.observation, dtype=np.uint8)
+        self.assertEqual(encoded.dtype, np.uint8)
+        self.assertEqual(encoded[:, 0, 3].sum(), 0)
+
+    def test_out(self) -> None:
+        out = np.ones((CHANNELS, 3, 4), dtype=np.float32)
+        self.assertIs(one_hot(self.board.observation, out=out), out)
+        self.assertEqual(out.sum(), 12)
+        with self.assertRaises(ValueError):
+            one_hot(self.board.observation, out=np.empty((CHANNELS, 4, 3)))
+
+    def test_batch(self) -> None:
+        games = [
+            GameLogic(width=8, height=6, mine_count=5, player=HumanPlayer(name="P"), seed=seed)
+            for seed in range(3)
+        ]
+        games[1].make_move(0, 0)
+        batch = one_hot_batch([game.observation for game in games])
+        self.assertEqual(batch.shape, (3, CHANNELS, 6, 8))
+        for game, encoded in zip(games, batch):
+            np.testing.assert_array_equal(encoded, game.encode())
+        with self.assertRaises(ValueError):
+            one_hot_batch([games[0].observation, self.board.observation])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from src.core.board import Board
+from src.core.frontier import Frontier
+
+
+class TestFrontier(unittest.TestCase):
+    def setUp(self) -> None:
+        self.board = Board(5, 5)
+        self.board.place_mines([4, 9])
+        self.frontier = Frontier()
+
+    def test_initial_sync(self) -> None:
+        self.assertEqual(self.frontier.sync(self.board.observation), set())
+        self.assertEqual(self.frontier.numbers, set())
+        self.assertTrue(self.frontier.is_unknown(0))
+
+    def test_sync_from_hints(self) -> None:
+        self.frontier.sync(self.board.observation)
+        revealed = self.board.reveal(0, 0)
+        changed = self.frontier.sync(self.board.observation, hints=[0])
+        self.assertEqual(changed, {self.board.index(x, y) for x, y in revealed})
+        # the numbers next to the two mines form the frontier
+        self.assertEqual(self.frontier.numbers, {3, 8, 13, 14})
+        self.assertEqual(sorted(self.frontier.unknown_neighbours(14)), [9])
+        self.assertEqual(self.frontier.remaining_mines(8), 2)
+
+    def test_sync_detects_missed_changes(self) -> None:
+        self.frontier.sync(self.board.observation)
+        self.board.reveal(0, 0)
+        self.board.get_cell(4, 0).toggle_flag()
+        # no hint given, the counters reveal the missing changes
+        changed = self.frontier.sync(self.board.observation)
+        self.assertIn(4, changed)
+        self.assertTrue(self.frontier.is_flagged(4))
+        self.assertEqual(self.frontier.remaining_mines(3), 1)
+        self.assertEqual(self.frontier.sync(self.board.observation), set())
+
+    def test_neighbours(self) -> None:
+        self.frontier.sync(self.board.observation)
+        self.assertEqual(sorted(self.frontier.neighbours(0)), [1, 5, 6])
+        self.assertEqual(len(self.frontier.neighbours(12)), 8)
+        self.assertEqual(self.frontier.position(13), (3, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
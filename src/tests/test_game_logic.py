@@ -1,5 +1,7 @@
 import unittest
+from typing import List
 
+from src.core.change_set import ChangeSet
 from src.core.game_logic import GameLogic
 from src.core.player import HumanPlayer
 
@@ -18,11 +20,29 @@ class TestGameLogic(unittest.TestCase):
         self.assertFalse(self.game_logic_no_mines.is_game_over())
         self.assertFalse(self.game_logic_no_mines.is_game_won())
 
+    def test_mine_placement(self) -> None:
+        game_logic = GameLogic(width=30, height=20, mine_count=599, player=HumanPlayer(name="P"))
+        self.assertEqual(sum(game_logic.board.grid.mines), 599)
+        self.assertEqual(sum(self.game_logic_only_mines.board.grid.mines), 25)
+        with self.assertRaises(ValueError):
+            GameLogic(width=2, height=2, mine_count=5, player=HumanPlayer(name="P"))
+
+    def test_seed(self) -> None:
+        first = GameLogic(width=16, height=16, mine_count=40, player=HumanPlayer("P"), seed=42)
+        second = GameLogic(width=16, height=16, mine_count=40, player=HumanPlayer("P"), seed=42)
+        other = GameLogic(width=16, height=16, mine_count=40, player=HumanPlayer("P"), seed=43)
+        self.assertEqual(first.seed, 42)
+        self.assertEqual(first.board, second.board)
+        self.assertNotEqual(first.board, other.board)
+        self.assertIsInstance(self.game_logic_no_mines.seed, int)
+
     def test_make_move_reveal(self) -> None:
         # Test revealing a cell
-        result = self.game_logic_no_mines.make_move(0, 0, "reveal")
+        result = self.game_logic_no_mines.make_move(0, 0, "flag")
+        result = self.game_logic_no_mines.make_move(1, 1, "reveal")
         self.assertTrue(result)
         self.assertFalse(self.game_logic_no_mines.is_game_over())
+        self.assertEqual(len(self.game_logic_no_mines.last_revealed), 24)
 
         # Test revealing a mine
         # Assuming the mine is placed at (1, 1) for this test
@@ -30,6 +50,42 @@ class TestGameLogic(unittest.TestCase):
         self.assertFalse(self.game_logic_only_mines.is_game_won())
         self.assertTrue(self.game_logic_only_mines.is_game_over())
 
+    def test_win_condition(self) -> None:
+        game_logic = GameLogic(width=3, height=1, mine_count=0, player=HumanPlayer(name="P"))
+        game_logic.board.place_mines([1])
+        game_logic.make_move(0, 0, "reveal")
+        self.assertFalse(game_logic.is_game_over())
+        game_logic.make_move(2, 0, "reveal")
+        self.assertTrue(game_logic.is_game_over())
+        self.assertTrue(game_logic.is_game_won())
+
+    def test_make_moves(self) -> None:
+        game_logic = GameLogic(width=4, height=1, mine_count=0, player=HumanPlayer(name="P"))
+        game_logic.board.place_mines([3])
+        changes = game_logic.make_moves(
+            [(3, 0, "flag"), (0, 0, "reveal"), (3, 0, "reveal"), (1, 0, "invalid_action")]
+        )
+        # the cascade from (0, 0) already wins, the last moves are ignored
+        self.assertEqual(changes.revealed, {(0, 0), (1, 0), (2, 0)})
+        self.assertEqual(changes.flagged, {(3, 0)})
+        self.assertEqual(changes.applied_moves, 2)
+        self.assertTrue(changes.game_won)
+        self.assertIs(game_logic.last_changes, changes)
+        self.assertTrue(game_logic.is_game_won())
+
+    def test_make_moves_out_of_range(self) -> None:
+        published: List[ChangeSet] = []
+        self.game_logic_no_mines.subscribe(published.append)
+        changes = self.game_logic_no_mines.make_moves(
+            [(0, 0, "flag"), (9, 9, "reveal"), (-1, 0, "flag"), (1, 1, "flag")]
+        )
+        # the moves out of the board are skipped, the others are applied and published
+        self.assertEqual(changes.flagged, {(0, 0), (1, 1)})
+        self.assertEqual(changes.applied_moves, 2)
+        self.assertIs(self.game_logic_no_mines.last_changes, changes)
+        self.assertEqual(published, [changes])
+        self.assertFalse(self.game_logic_no_mines.make_move(5, 0, "reveal"))
+
     def test_make_move_flag(self) -> None:
         # Test flagging a cell
         result = self.game_logic_no_mines.make_move(0, 0, "flag")
@@ -42,6 +98,107 @@ class TestGameLogic(unittest.TestCase):
         self.assertFalse(result)
         self.assertFalse(self.game_logic_no_mines.is_game_over())
 
+    def test_checkpoint_and_rollback(self) -> None:
+        game_logic = GameLogic(
+            width=5, height=5, mine_count=1, player=HumanPlayer(name="P"), mines=[24]
+        )
+        game_logic.make_move(4, 3, "reveal")
+        token = game_logic.checkpoint()
+        game_logic.make_move(0, 0, "reveal")
+        self.assertTrue(game_logic.is_game_won())
+        game_logic.rollback(token)
+        self.assertFalse(game_logic.is_game_over())
+        self.assertEqual(game_logic.board.get_revealed_count(), 1)
+
+        game_logic.make_move(4, 4, "reveal")
+        self.assertTrue(game_logic.is_game_over())
+        game_logic.rollback(token)
+        self.assertFalse(game_logic.is_game_over())
+        self.assertTrue(game_logic.make_move(3, 4, "flag"))
+        game_logic.release_checkpoints()
+
+    def test_mine_layout(self) -> None:
+        game_logic = GameLogic(
+            width=5, height=5, mine_count=2, player=HumanPlayer(name="P"), mines=[0, 7]
+        )
+        self.assertEqual(game_logic.board.get_cell(1, 1).adjacent_mines, 2)
+        with self.assertRaises(ValueError):
+            GameLogic(width=5, height=5, mine_count=2, player=HumanPlayer(name="P"), mines=[1, 1])
+
+    def test_subscribe(self) -> None:
+        game_logic = GameLogic(
+            width=5, height=5, mine_count=1, player=HumanPlayer(name="P"), mines=[24]
+        )
+        published: List[ChangeSet] = []
+        game_logic.subscribe(published.append)
+        game_logic.make_move(0, 0, "flag")
+        game_logic.make_move(0, 0, "reveal_all")
+        changes = game_logic.make_moves([(0, 0, "flag"), (4, 0, "reveal")])
+        self.assertEqual(len(published), 2)
+        self.assertEqual(published[0].flagged, {(0, 0)})
+        self.assertIs(published[1], changes)
+        self.assertTrue(changes.game_won)
+
+        game_logic.unsubscribe(published.append)
+        game_logic.make_move(4, 4, "flag")
+        self.assertEqual(len(published), 2)
+
+    def test_safe_first_click(self) -> None:
+        for seed in range(20):
+            game_logic = GameLogic(
+                width=9,
+                height=9,
+                mine_count=70,
+                player=HumanPlayer("P"),
+                seed=seed,
+                first_click="cell",
+            )
+            self.assertFalse(game_logic.mines_placed)
+            self.assertEqual(game_logic.board.get_mine_count(), 0)
+            game_logic.make_move(4, 4, "reveal")
+            self.assertTrue(game_logic.mines_placed)
+            self.assertEqual(game_logic.board.get_mine_count(), 70)
+            self.assertFalse(game_logic.board.get_cell(4, 4).is_mine())
+            self.assertFalse(game_logic.is_game_over())
+
+    def test_first_click_opening(self) -> None:
+        for seed in range(20):
+            game_logic = GameLogic(
+                width=9,
+                height=9,
+                mine_count=30,
+                player=HumanPlayer("P"),
+                seed=seed,
+                first_click="opening",
+            )
+            game_logic.make_move(0, 8, "reveal")
+            self.assertEqual(game_logic.board.get_cell(0, 8).adjacent_mines, 0)
+            self.assertGreaterEqual(len(game_logic.last_revealed), 4)
+        # without room for a whole opening only the revealed square is kept free
+        game_logic = GameLogic(
+            width=3, height=3, mine_count=8, player=HumanPlayer("P"), first_click="opening"
+        )
+        game_logic.make_move(1, 1, "reveal")
+        self.assertTrue(game_logic.is_game_won())
+
+    def test_first_click_layout_is_reproducible(self) -> None:
+        boards = [
+            GameLogic(
+                width=16,
+                height=16,
+                mine_count=40,
+                player=HumanPlayer("P"),
+                seed=7,
+                first_click="opening",
+            )
+            for _ in range(2)
+        ]
+        for game_logic in boards:
+            game_logic.make_move(3, 5, "reveal")
+        self.assertEqual(boards[0].board, boards[1].board)
+        with self.assertRaises(ValueError):
+            GameLogic(width=5, height=5, mine_count=2, player=HumanPlayer("P"), first_click="x")
+
 
 if __name__ == "__main__":
     unittest.main()
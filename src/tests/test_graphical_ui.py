@@ -0,0 +1,140 @@
+import os
+import unittest
+from typing import List
+
+import pygame
+
+from src.core.game_logic import GameLogic
+from src.core.player import HumanPlayer, SolverPlayer
+from src.ui.graphical_ui import MAX_VIEW_SIZE, GraphicalUI, PygameBoard, Viewport
+
+# the display is only read when pygame initializes it, run the tests without a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+class TestPygameBoard(unittest.TestCase):
+    def setUp(self) -> None:
+        pygame.init()
+        self.game_logic = GameLogic(
+            width=6, height=4, mine_count=3, player=HumanPlayer(name="TestPlayer"), seed=1
+        )
+        self.board = PygameBoard(name="test", dimension=(6, 4), pixels_per_unit=20)
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_render_only_dirty_cells(self) -> None:
+        updates: List[List[pygame.Rect]] = []
+        original_update = pygame.display.update
+        pygame.display.update = updates.append  # type: ignore[assignment]
+        try:
+            # nothing changed, nothing is pushed to the display
+            self.board.render(self.game_logic.board)
+            self.assertEqual(updates, [])
+
+            self.game_logic.make_move(2, 1, "flag")
+            self.board.mark_dirty(self.game_logic.last_changes.flagged)
+            self.board.render(self.game_logic.board)
+        finally:
+            pygame.display.update = original_update
+        # the flagged cell and the progress bar
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(len(updates[0]), 2)
+        self.assertEqual(updates[0][0], pygame.Rect((40, 20), (20, 20)))
+
+    def test_draw_cell(self) -> None:
+        self.game_logic.board.get_cell(0, 0).reveal()
+        rect = self.board.draw_cell(self.game_logic.board, (0, 0))
+        self.assertEqual(rect, pygame.Rect((0, 0), (20, 20)))
+        self.board.display(self.game_logic.board)
+
+    def test_tiles_are_cached(self) -> None:
+        tiles = self.board.tiles
+        self.assertEqual(len(tiles), 12)
+        self.assertIs(self.board.tiles, tiles)
+        self.assertEqual(tiles["hidden"].get_size(), (20, 20))
+
+        self.board.pixels_per_unit = 30
+        self.assertEqual(self.board.tiles["mine"].get_size(), (30, 30))
+
+    def test_large_board_window(self) -> None:
+        game_logic = GameLogic(
+            width=500, height=400, mine_count=1000, player=HumanPlayer(name="TestPlayer"), seed=1
+        )
+        board = PygameBoard(name="large", dimension=(500, 400), pixels_per_unit=20)
+        self.assertEqual(board.viewport.size, MAX_VIEW_SIZE)
+        self.assertEqual(board.screen.get_size(), (MAX_VIEW_SIZE[0], MAX_VIEW_SIZE[1] + 50))
+        self.assertEqual(board.cell_at((MAX_VIEW_SIZE[0] // 2, MAX_VIEW_SIZE[1] + 10)), None)
+
+        board.viewport.scroll(1000, 500)
+        self.assertEqual(board.cell_at((10, 10)), (50, 25))
+        # off-screen cells are not drawn
+        board.mark_dirty([(0, 0), (50, 25)])
+        updates: List[List[pygame.Rect]] = []
+        original_update = pygame.display.update
+        pygame.display.update = updates.append  # type: ignore[assignment]
+        try:
+            board.render(game_logic.board)
+            board.pixels_per_unit = 2
+            self.assertTrue(board.minimap)
+            board.mark_dirty([(0, 0)])
+            board.render(game_logic.board)
+        finally:
+            pygame.display.update = original_update
+        self.assertEqual(len(updates[0]), 2)
+        self.assertEqual(updates[1][0], board.viewport.rect)
+        board.display(game_logic.board)
+
+
+class TestViewport(unittest.TestCase):
+    def test_scroll_is_clamped(self) -> None:
+        viewport = Viewport((100, 50), (200, 100), 10)
+        viewport.scroll(-50, 10_000)
+        self.assertEqual(viewport.offset, (0, 400))
+        self.assertEqual(viewport.visible_cells(), (0, 40, 20, 50))
+        self.assertTrue(viewport.is_visible((19, 45)))
+        self.assertFalse(viewport.is_visible((20, 45)))
+
+    def test_zoom_keeps_anchor(self) -> None:
+        viewport = Viewport((100, 50), (200, 100), 10)
+        viewport.scroll(300, 200)
+        anchor = (100, 50)
+        cell = viewport.pixel2pos(anchor)
+        viewport.zoom(2, anchor)
+        self.assertEqual(viewport.pixels_per_unit, 15)
+        self.assertEqual(viewport.pixel2pos(anchor), cell)
+        viewport.zoom(-10, anchor)
+        self.assertEqual(viewport.pixels_per_unit, 1)
+        self.assertEqual(viewport.offset, (0, 0))
+        self.assertEqual(viewport.visible_cells(), (0, 0, 100, 50))
+
+
+class TestGraphicalUI(unittest.TestCase):
+    def test_events(self) -> None:
+        game_logic = GameLogic(
+            width=6, height=4, mine_count=3, player=HumanPlayer(name="TestPlayer"), seed=1
+        )
+        ui = GraphicalUI(game_logic)
+        fast_forward = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_f)
+        self.assertTrue(ui.handle_events([fast_forward], True))
+        self.assertTrue(ui.fast_forward)
+
+        click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(45, 25), button=3)
+        ui.handle_events([click], False)
+        self.assertFalse(game_logic.board.get_cell(2, 1).is_flagged())
+        ui.handle_events([click], True)
+        self.assertTrue(game_logic.board.get_cell(2, 1).is_flagged())
+
+        self.assertFalse(ui.handle_events([pygame.event.Event(pygame.QUIT)], True))
+
+    def test_bot_game_in_fast_forward(self) -> None:
+        game_logic = GameLogic(
+            width=9, height=9, mine_count=10, player=SolverPlayer(name="Bot", seed=3), seed=3
+        )
+        ui = GraphicalUI(game_logic, fast_forward=True)
+        ui.start_game()
+        self.assertTrue(game_logic.is_game_over())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+
+import numpy as np
+
+from src.core.grid import Grid
+
+
+class TestGrid(unittest.TestCase):
+    def setUp(self) -> None:
+        self.grid = Grid(6)
+
+    def test_initial_state(self) -> None:
+        self.assertEqual(self.grid.size, 6)
+        self.assertEqual(self.grid.get_revealed_count(), 0)
+        self.assertEqual(self.grid.get_flagged_count(), 0)
+        for index in range(6):
+            self.assertEqual(self.grid.get_adjacent_mines(index), 0)
+            self.assertFalse(self.grid.is_mine(index))
+
+    def test_set_adjacent_mines(self) -> None:
+        self.grid.set_adjacent_mines(2, 4)
+        self.assertEqual(self.grid.get_adjacent_mines(2), 4)
+        self.grid.set_adjacent_mines(2, -1)
+        self.assertTrue(self.grid.is_mine(2))
+        self.assertEqual(self.grid.get_adjacent_mines(2), -1)
+        self.grid.set_adjacent_mines(2, 1)
+        self.assertFalse(self.grid.is_mine(2))
+
+    def test_reveal_and_flag(self) -> None:
+        self.grid.reveal(0)
+        self.grid.reveal(3)
+        self.grid.toggle_flag(5)
+        self.assertTrue(self.grid.is_revealed(3))
+        self.assertTrue(self.grid.is_flagged(5))
+        self.assertEqual(self.grid.get_revealed_count(), 2)
+        self.assertEqual(self.grid.get_flagged_count(), 1)
+        self.grid.toggle_flag(5)
+        self.assertFalse(self.grid.is_flagged(5))
+
+    def test_live_counters(self) -> None:
+        self.grid.set_adjacent_mines(1, -1)
+        self.grid.set_adjacent_mines(4, -1)
+        self.assertEqual(self.grid.get_mine_count(), 2)
+
+        self.grid.reveal(0)
+        self.grid.reveal(0)
+        self.grid.reveal(1)
+        self.assertEqual(self.grid.get_revealed_count(), 2)
+        self.assertEqual(self.grid.get_revealed_safe_count(), 1)
+
+        # turning a revealed mine back into a safe square updates the safe count
+        self.grid.set_adjacent_mines(1, 2)
+        self.assertEqual(self.grid.get_mine_count(), 1)
+        self.assertEqual(self.grid.get_revealed_safe_count(), 2)
+
+        self.grid.toggle_flag(3)
+        self.grid.toggle_flag(3)
+        self.grid.toggle_flag(2)
+        self.assertEqual(self.grid.get_flagged_count(), 1)
+
+    def test_recount(self) -> None:
+        self.grid.mines[0:3] = b"\x01\x01\x00"
+        self.grid.revealed[1:4] = b"\x01\x01\x01"
+        self.grid.flagged[5] = 1
+        self.grid.recount()
+        self.assertEqual(self.grid.get_mine_count(), 2)
+        self.assertEqual(self.grid.get_revealed_count(), 3)
+        self.assertEqual(self.grid.get_revealed_safe_count(), 2)
+        self.assertEqual(self.grid.get_flagged_count(), 1)
+
+    def test_checkpoint_and_rollback(self) -> None:
+        self.grid.set_adjacent_mines(4, -1)
+        self.grid.reveal(0)
+        first = self.grid.checkpoint()
+        self.grid.reveal(1)
+        self.grid.toggle_flag(2)
+        second = self.grid.checkpoint()
+        self.grid.reveal(4)
+        self.grid.toggle_flag(2)
+        self.grid.rollback(second)
+        self.assertFalse(self.grid.is_revealed(4))
+        self.assertTrue(self.grid.is_flagged(2))
+        self.assertEqual(self.grid.get_revealed_count(), 2)
+        self.assertEqual(self.grid.get_revealed_safe_count(), 2)
+        self.grid.rollback(first)
+        self.assertEqual(list(self.grid.revealed), [1, 0, 0, 0, 0, 0])
+        self.assertEqual(self.grid.get_flagged_count(), 0)
+        self.grid.release()
+        with self.assertRaises(ValueError):
+            self.grid.rollback(first)
+
+    def test_reveal_many(self) -> None:
+        self.grid.set_adjacent_mines(4, -1)
+        token = self.grid.checkpoint()
+        self.grid.reveal_many(np.array([1, 2, 4]))
+        self.assertEqual(list(self.grid.revealed), [0, 1, 1, 0, 1, 0])
+        self.assertEqual(self.grid.get_revealed_count(), 3)
+        self.assertEqual(self.grid.get_revealed_safe_count(), 2)
+        self.grid.rollback(token)
+        self.assertEqual(self.grid.get_revealed_count(), 0)
+        self.assertEqual(self.grid.get_revealed_safe_count(), 0)
+
+    def test_copy(self) -> None:
+        self.grid.set_adjacent_mines(4, -1)
+        self.grid.reveal(0)
+        self.grid.toggle_flag(3)
+        copy = self.grid.copy()
+        self.assertEqual(copy, self.grid)
+        self.assertEqual(copy.revealed, self.grid.revealed)
+        self.assertEqual(copy.get_flagged_count(), 1)
+        copy.reveal(1)
+        self.assertFalse(self.grid.is_revealed(1))
+        with self.assertRaises(ValueError):
+            Grid(5).restore(self.grid)
+
+    def test_equality(self) -> None:
+        other = Grid(6)
+        self.assertEqual(self.grid, other)
+        other.set_adjacent_mines(1, -1)
+        self.assertNotEqual(self.grid, other)
+        self.assertNotEqual(self.grid, Grid(5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+
+from src.core.board import Board
+from src.core.frontier import Frontier
+from src.core.neighbours import CACHED_SQUARES, NeighbourTable, neighbour_table
+
+
+class TestNeighbourTable(unittest.TestCase):
+    def setUp(self) -> None:
+        self.table = NeighbourTable(4, 3)
+
+    def test_corner_edge_and_inner_squares(self) -> None:
+        self.assertEqual(self.table[0], (1, 4, 5))
+        self.assertEqual(self.table[1], (0, 2, 4, 5, 6))
+        self.assertEqual(self.table[5], (0, 1, 2, 4, 6, 8, 9, 10))
+        self.assertEqual(self.table[11], (6, 7, 10))
+
+    def test_packed_rows(self) -> None:
+        rows = self.table.rows
+        self.assertEqual(rows.shape, (12, 8))
+        self.assertEqual(rows.dtype, np.int32)
+        self.assertEqual(rows[0].tolist(), [1, 4, 5, -1, -1, -1, -1, -1])
+        self.assertEqual(len(self.table), 12)
+        self.assertFalse(rows.flags.writeable)
+
+    def test_out_of_range(self) -> None:
+        with self.assertRaises(IndexError):
+            _ = self.table[12]
+        with self.assertRaises(IndexError):
+            _ = self.table[-1]
+
+    def test_single_square(self) -> None:
+        self.assertEqual(NeighbourTable(1, 1)[0], ())
+        self.assertEqual(len(NeighbourTable(0, 0)), 0)
+
+    def test_shared_by_size(self) -> None:
+        board = Board(4, 3)
+        self.assertIs(board.neighbours, neighbour_table(4, 3))
+        self.assertIs(Board(4, 3).neighbours, board.neighbours)
+        self.assertIs(board.observation.neighbours, board.neighbours)
+        self.assertIsNot(Board(3, 4).neighbours, board.neighbours)
+
+    def test_large_boards_are_not_cached(self) -> None:
+        width = CACHED_SQUARES // 2 + 1
+        self.assertIsNot(neighbour_table(width, 2), neighbour_table(width, 2))
+        board = Board(width, 2)
+        self.assertIs(board.neighbours, board.observation.neighbours)
+
+    def test_frontier_uses_the_table(self) -> None:
+        board = Board(4, 3)
+        frontier = Frontier()
+        frontier.sync(board.observation)
+        self.assertEqual(frontier.neighbours(5), board.neighbours[5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+
+from numpy.random import SeedSequence
+
+from src.core.no_guess import (
+    LayoutPool,
+    find_layout,
+    generate_layouts,
+    is_solvable,
+    load_pool,
+    opening_squares,
+)
+from src.core.player import SolverPlayer
+
+
+class TestSolvable(unittest.TestCase):
+    def test_solvable(self) -> None:
+        self.assertTrue(is_solvable(3, 3, [], 4))
+        self.assertTrue(is_solvable(4, 1, [3], 0))
+        self.assertTrue(is_solvable(2, 1, [1], 0))
+        # the last square touches no number, it is only known safe from the mine count
+        self.assertTrue(is_solvable(3, 1, [1], 0))
+
+    def test_guess_needed(self) -> None:
+        # one mine among three squares around the start
+        self.assertFalse(is_solvable(2, 2, [3], 0))
+        self.assertFalse(is_solvable(3, 3, [4], 4))
+
+    def test_find_layout(self) -> None:
+        mines = find_layout(9, 9, 10, 40, SeedSequence(3), attempts=50)
+        assert mines is not None
+        self.assertEqual(len(mines), 10)
+        self.assertFalse(set(mines) & set(opening_squares(9, 9, 40)))
+        self.assertTrue(is_solvable(9, 9, mines, 40))
+
+
+class TestLayoutPool(unittest.TestCase):
+    def test_generate_layouts(self) -> None:
+        layouts = generate_layouts(9, 9, 10, count=3, seed=5, workers=2)
+        self.assertEqual(len(layouts), 3)
+        again = generate_layouts(9, 9, 10, count=3, seed=5, workers=1)
+        self.assertEqual([list(mines) for _, mines in layouts], [list(m) for _, m in again])
+        with self.assertRaises(ValueError):
+            generate_layouts(3, 3, 1, count=1)
+
+    def test_pool_round_trip(self) -> None:
+        pool = LayoutPool(9, 9, 10)
+        pool.fill(2, seed=1, workers=2)
+        self.assertEqual(len(pool), 2)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "pool.dmnr")
+            pool.save(path)
+            loaded = load_pool(path)
+        self.assertEqual((loaded.width, loaded.height, loaded.mine_count), (9, 9, 10))
+        self.assertEqual(len(loaded), 2)
+        start, mines = pool.pop()
+        loaded_start, loaded_mines = loaded.pop()
+        self.assertEqual((start, list(mines)), (loaded_start, list(loaded_mines)))
+
+    def test_new_game_needs_no_guess(self) -> None:
+        pool = LayoutPool(16, 16, 40, generate_layouts(16, 16, 40, count=1, seed=2, workers=1))
+        player = SolverPlayer(name="Bot", seed=1)
+        game_logic = pool.new_game(player)
+        self.assertEqual(len(pool), 0)
+        self.assertGreater(game_logic.board.get_revealed_count(), 1)
+        while not game_logic.is_game_over():
+            game_logic.make_moves(player.make_moves(game_logic.observation))
+        self.assertTrue(game_logic.is_game_won())
+        with self.assertRaises(IndexError):
+            pool.pop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from src.core.board import Board
+from src.core.observation import STATE_FLAGGED, STATE_MINE, STATE_UNKNOWN
+
+
+class TestObservation(unittest.TestCase):
+    def setUp(self) -> None:
+        self.board = Board(4, 3)
+        self.board.place_mines([3, 11])
+        self.observation = self.board.observation
+
+    def test_same_live_view(self) -> None:
+        self.assertIs(self.board.observation, self.observation)
+        self.assertEqual((self.observation.width, self.observation.height), (4, 3))
+        self.assertTrue(self.observation.is_unknown(0))
+        self.board.reveal(0, 0)
+        self.assertTrue(self.observation.is_revealed(0))
+        self.assertEqual(self.observation.get_revealed_count(), self.board.get_revealed_count())
+        self.assertEqual(self.observation.get_mine_count(), 2)
+
+    def test_mines_are_hidden(self) -> None:
+        self.assertFalse(hasattr(self.observation, "grid"))
+        with self.assertRaises(ValueError):
+            self.observation.number(3)
+        with self.assertRaises(ValueError):
+            self.observation.number(2)
+        self.board.reveal(2, 0)
+        self.assertEqual(self.observation.number(2), 1)
+
+    def test_read_only_arrays(self) -> None:
+        self.board.get_cell(1, 2).toggle_flag()
+        self.assertEqual(self.observation.flagged[9], 1)
+        with self.assertRaises(TypeError):
+            self.observation.flagged[9] = 0
+        with self.assertRaises(TypeError):
+            self.observation.revealed[0] = 1
+
+    def test_state(self) -> None:
+        self.board.reveal(0, 0)
+        self.board.get_cell(3, 2).toggle_flag()
+        state = self.observation.state()
+        self.assertEqual(state.shape, (3, 4))
+        self.assertEqual(list(state[0]), [0, 0, 1, STATE_UNKNOWN])
+        self.assertEqual(state[2, 3], STATE_FLAGGED)
+        self.board.reveal(3, 0)
+        self.assertEqual(self.observation.state()[0, 3], STATE_MINE)
+
+
+if __name__ == "__main__":
+    unittest.main()
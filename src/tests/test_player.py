@@ -1,7 +1,7 @@
 import unittest
 
 from src.core.board import Board
-from src.core.player import HumanPlayer, RandomPlayer
+from src.core.player import HumanPlayer, ProbaPlayer, RandomPlayer, SolverPlayer
 
 
 class TestPlayer(unittest.TestCase):
@@ -23,10 +23,11 @@ class TestPlayer(unittest.TestCase):
         board = Board(5, 5)
 
         self.assertIsNone(
-            self.human_player.make_move(board), "Human player should return None for make_move."
+            self.human_player.make_move(board.observation),
+            "Human player should return None for make_move.",
         )
 
-        random_move = self.random_player.make_move(board)
+        random_move = self.random_player.make_move(board.observation)
         self.assertIsInstance(
             random_move, tuple, "Random player should return a tuple for make_move."
         )
@@ -47,6 +48,94 @@ class TestPlayer(unittest.TestCase):
             "Random player y coordinate should be within board height.",
         )
 
+    def test_seed(self) -> None:
+        """Players with the same seed make the same random moves."""
+        board = Board(30, 30)
+        first = RandomPlayer("First", seed=5)
+        second = RandomPlayer("Second", seed=5)
+        moves = [first.make_move(board.observation) for _ in range(10)]
+        self.assertEqual(moves, [second.make_move(board.observation) for _ in range(10)])
+        self.assertNotEqual(
+            moves, [RandomPlayer("Third", seed=6).make_move(board.observation) for _ in range(10)]
+        )
+
+    def test_proba_player(self) -> None:
+        """The probability player plays the obvious moves around the frontier."""
+        board = Board(5, 5)
+        board.place_mines([4, 9])
+        proba_player = ProbaPlayer("ProbaPlayer")
+        board.reveal(0, 0)
+
+        # (3, 0) is a 2 whose only unknown neighbours are the mines at (4, 0) and (4, 1)
+        move = proba_player.make_move(board.observation)
+        self.assertEqual(move, (4, 0, "flag"))
+        board.get_cell(4, 0).toggle_flag()
+
+        move = proba_player.make_move(board.observation)
+        self.assertEqual(move, (4, 1, "flag"))
+
+    def test_solver_player(self) -> None:
+        """The solver player weighs the frontier against the unconstrained cells."""
+        board = Board(4, 1)
+        board.place_mines([3])
+        solver_player = SolverPlayer("SolverPlayer")
+        board.reveal(2, 0)
+
+        # the single mine is next to the 1, so the far cell is certainly safe
+        move = solver_player.make_move(board.observation)
+        self.assertEqual(move, (0, 0, "reveal"))
+        board.reveal(0, 0)
+
+        move = solver_player.make_move(board.observation)
+        self.assertEqual(move, (3, 0, "flag"))
+
+    def test_solver_player_last_interior_cell(self) -> None:
+        """The random guess away from the frontier finds the only unknown cell of a large board."""
+        board = Board(200, 200)
+        ring = [board.index(x, y) for x, y in ((1, 0), (2, 0), (0, 1), (1, 1), (2, 1))]
+        ring += [board.index(x, 2) for x in range(3)]
+        board.place_mines(ring)
+        for index in ring:
+            board.grid.toggle_flag(index)
+        # every square but the flagged ring and the corner it encloses opens up
+        board.reveal(199, 199)
+        self.assertEqual(board.get_revealed_count(), 200 * 200 - 9)
+
+        move = SolverPlayer("SolverPlayer", seed=1).make_move(board.observation)
+        self.assertEqual(move, (0, 0, "reveal"))
+
+    def test_make_moves(self) -> None:
+        """Frontier players return every certain move at once, the others a single move."""
+        board = Board(5, 5)
+        board.place_mines([4, 9])
+        board.reveal(0, 0)
+
+        self.assertEqual(self.human_player.make_moves(board.observation), [])
+        self.assertEqual(len(self.random_player.make_moves(board.observation)), 1)
+        for player in (ProbaPlayer("ProbaPlayer"), SolverPlayer("SolverPlayer")):
+            self.assertEqual(player.make_moves(board.observation), [(4, 0, "flag"), (4, 1, "flag")])
+
+    def test_player_reused_across_games(self) -> None:
+        """Moves queued on one board are never played on the next one."""
+        for player in (ProbaPlayer("ProbaPlayer"), SolverPlayer("SolverPlayer")):
+            first = Board(5, 5)
+            first.place_mines([4, 9])
+            first.reveal(0, 0)
+            # the second flag stays queued
+            self.assertEqual(player.make_move(first.observation), (4, 0, "flag"))
+
+            # nothing is known on a fresh board, the only move is a guess
+            second = Board(5, 5)
+            second.place_mines([4, 9])
+            move = player.make_move(second.observation)
+            self.assertIsNotNone(move)
+            self.assertEqual(move[2] if move else None, "reveal")
+
+            third = Board(5, 5)
+            third.place_mines([0])
+            third.reveal(4, 4)
+            self.assertEqual(player.make_moves(third.observation), [(0, 0, "flag")])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,131 @@
+import io
+import unittest
+
+import numpy as np
+
+from src.core.game_logic import GameLogic
+from src.core.player import HumanPlayer, SolverPlayer
+from src.core.record import (
+    GameRecord,
+    decode_move,
+    encode_move,
+    read_record,
+    read_records,
+    read_varint,
+    write_record,
+    write_varint,
+)
+
+
+class TestRecord(unittest.TestCase):
+    def test_varint(self) -> None:
+        stream = io.BytesIO()
+        for value in (0, 1, 127, 128, 300, 2**64 - 1):
+            write_varint(stream, value)
+        self.assertEqual(len(stream.getvalue()), 1 + 1 + 1 + 2 + 2 + 10)
+        stream.seek(0)
+        for value in (0, 1, 127, 128, 300, 2**64 - 1):
+            self.assertEqual(read_varint(stream), value)
+        with self.assertRaises(ValueError):
+            read_varint(stream)
+
+    def test_moves(self) -> None:
+        self.assertEqual(decode_move(encode_move(0, "reveal")), (0, "reveal"))
+        self.assertEqual(decode_move(encode_move(479, "flag")), (479, "flag"))
+        self.assertNotEqual(encode_move(0, "reveal"), 0)
+
+    def test_round_trip(self) -> None:
+        record = GameRecord(5, 3, 2, bytes([0b10000000, 0b00000010]), None, [1, 4, 7])
+        stream = io.BytesIO()
+        write_record(stream, record)
+        write_record(stream, record._replace(mines=None, seed=2**63))
+        stream.seek(0)
+        records = list(read_records(stream))
+        self.assertEqual(records[0], record)
+        self.assertEqual(records[1].seed, 2**63)
+        self.assertEqual(list(records[0].mine_indices()), [0, 14])
+
+    def test_invalid(self) -> None:
+        self.assertIsNone(read_record(io.BytesIO()))
+        with self.assertRaises(ValueError):
+            read_record(io.BytesIO(b"NOPE"))
+        with self.assertRaises(ValueError):
+            read_record(io.BytesIO(b"DMNR\x09\x00"))
+
+
+class TestRecording(unittest.TestCase):
+    def test_record_game(self) -> None:
+        stream = io.BytesIO()
+        game_logic = GameLogic(
+            width=30, height=16, mine_count=99, player=SolverPlayer(name="Bot", seed=4), seed=4
+        )
+        game_logic.start_recording(stream)
+        moves = 0
+        while not game_logic.is_game_over():
+            moves += game_logic.make_moves(
+                game_logic.player.make_moves(game_logic.observation)
+            ).applied_moves
+        record = read_record(io.BytesIO(stream.getvalue()))
+        assert record is not None
+        self.assertEqual(len(record.moves), moves)
+        self.assertEqual((record.width, record.height, record.mine_count), (30, 16, 99))
+        # header, bitmap and about two bytes per move
+        self.assertLess(len(stream.getvalue()), 6 + 4 + 60 + 2 * moves + 1)
+
+    def test_invalid_moves_are_not_recorded(self) -> None:
+        stream = io.BytesIO()
+        game_logic = GameLogic(
+            width=4, height=4, mine_count=0, player=HumanPlayer(name="Player"), seed=1
+        )
+        game_logic.start_recording(stream, store_seed=True)
+        game_logic.make_move(1, 1, "jump")
+        game_logic.make_move(1, 1, "flag")
+        game_logic.stop_recording()
+        record = read_record(io.BytesIO(stream.getvalue()))
+        assert record is not None
+        self.assertEqual(record.seed, 1)
+        self.assertEqual(record.decoded_moves(), [(5, "flag")])
+
+    def test_seed_layout_requires_generated_board(self) -> None:
+        game_logic = GameLogic(
+            width=4, height=4, mine_count=1, player=HumanPlayer(name="Player"), mines=[3]
+        )
+        with self.assertRaises(ValueError):
+            game_logic.start_recording(io.BytesIO(), store_seed=True)
+
+    def test_record_lazy_layout(self) -> None:
+        stream = io.BytesIO()
+        game_logic = GameLogic(
+            width=8,
+            height=8,
+            mine_count=10,
+            player=HumanPlayer(name="Player"),
+            seed=3,
+            first_click="opening",
+        )
+        with self.assertRaises(ValueError):
+            game_logic.start_recording(io.BytesIO(), store_seed=True)
+        game_logic.start_recording(stream)
+        self.assertEqual(stream.getvalue(), b"")
+        game_logic.make_move(0, 0, "flag")
+        game_logic.make_move(4, 4, "reveal")
+        game_logic.stop_recording()
+        record = read_record(io.BytesIO(stream.getvalue()))
+        assert record is not None
+        self.assertEqual(record.decoded_moves(), [(0, "flag"), (36, "reveal")])
+        self.assertEqual(
+            list(record.mine_indices()), list(np.flatnonzero(game_logic.board.grid.mines))
+        )
+
+    def test_lazy_record_closed_before_layout(self) -> None:
+        stream = io.BytesIO()
+        game_logic = GameLogic(
+            width=8, height=8, mine_count=10, player=HumanPlayer(name="Player"), first_click="cell"
+        )
+        game_logic.start_recording(stream)
+        game_logic.stop_recording()
+        self.assertIsNone(read_record(io.BytesIO(stream.getvalue())))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import io
+import unittest
+
+from src.core.game_logic import GameLogic
+from src.core.player import SolverPlayer
+from src.core.record import read_record
+from src.core.replay import Replay
+
+
+class TestReplay(unittest.TestCase):
+    def setUp(self) -> None:
+        stream = io.BytesIO()
+        self.game_logic = GameLogic(
+            width=16, height=16, mine_count=40, player=SolverPlayer(name="Bot", seed=7), seed=7
+        )
+        self.game_logic.start_recording(stream)
+        self.states = [bytes(self.game_logic.board.grid.revealed)]
+        while not self.game_logic.is_game_over():
+            move = self.game_logic.player.make_move(self.game_logic.observation)
+            assert move is not None
+            if self.game_logic.make_move(*move):
+                self.states.append(bytes(self.game_logic.board.grid.revealed))
+        record = read_record(io.BytesIO(stream.getvalue()))
+        assert record is not None
+        self.replay = Replay(record)
+
+    def test_replay_to_the_end(self) -> None:
+        self.assertEqual(len(self.replay), len(self.states) - 1)
+        game_logic = self.replay.seek(len(self.replay))
+        self.assertEqual(game_logic.board.grid, self.game_logic.board.grid)
+        self.assertTrue(game_logic.is_game_over())
+        self.assertEqual(game_logic.is_game_won(), self.game_logic.is_game_won())
+        self.assertIsNone(self.replay.step())
+
+    def test_seek(self) -> None:
+        middle = len(self.replay) // 2
+        self.assertEqual(bytes(self.replay.seek(middle).board.grid.revealed), self.states[middle])
+        self.assertEqual(bytes(self.replay.seek(3).board.grid.revealed), self.states[3])
+        self.replay.step()
+        self.assertEqual(self.replay.position, 4)
+        self.assertEqual(bytes(self.replay.game_logic.board.grid.revealed), self.states[4])
+
+    def test_seed_layout(self) -> None:
+        stream = io.BytesIO()
+        game_logic = GameLogic(
+            width=9, height=9, mine_count=10, player=SolverPlayer(name="Bot", seed=1), seed=1
+        )
+        game_logic.start_recording(stream, store_seed=True)
+        game_logic.make_moves(game_logic.player.make_moves(game_logic.observation))
+        game_logic.stop_recording()
+        record = read_record(io.BytesIO(stream.getvalue()))
+        assert record is not None
+        replay = Replay(record)
+        self.assertEqual(replay.game_logic.board.grid, game_logic.board.grid)
+        self.assertEqual(
+            bytes(replay.seek(len(replay)).board.grid.revealed),
+            bytes(game_logic.board.grid.revealed),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
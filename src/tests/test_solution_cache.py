@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+from functools import partial
+from time import perf_counter
+
+from src.core.solution_cache import SolutionCache, canonical_shape
+from src.core.solver import ConstraintSolver, enumerate_component
+
+# a 1 and a 2 side by side over three cells in a row, at (1, 1) on a board 10 wide
+ROW = [((0, 1, 2), 1), ((1, 2, 3), 2)]
+# the same pattern moved, mirrored and turned to a column on a board 7 wide
+COLUMN = [((38, 45, 52), 2), ((45, 52, 59), 1)]
+
+
+class TestSolutionCache(unittest.TestCase):
+    def test_canonical_shape(self) -> None:
+        self.assertEqual(canonical_shape(ROW, 10)[0], canonical_shape(COLUMN, 7)[0])
+        other = [((0, 1, 2), 2), ((1, 2, 3), 2)]
+        self.assertNotEqual(canonical_shape(ROW, 10)[0], canonical_shape(other, 10)[0])
+
+    def test_symmetric_hit(self) -> None:
+        cache = SolutionCache()
+        first = cache.solve(ROW, 10, lambda: enumerate_component(ROW, 1000, perf_counter() + 1))
+        second = cache.solve(COLUMN, 7, lambda: self.fail("the shape should be cached"))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        expected = enumerate_component(COLUMN, 1000, perf_counter() + 1)
+        self.assertEqual(second.totals, expected.totals)
+        for mines, counts in expected.cell_counts.items():
+            by_cell = dict(zip(second.cells, second.cell_counts[mines]))
+            self.assertEqual([by_cell[cell] for cell in expected.cells], counts)
+        self.assertEqual(first.totals, second.totals)
+
+    def test_least_recently_used_eviction(self) -> None:
+        cache = SolutionCache(max_size=2)
+        shapes = [[((0, 1), mines)] for mines in range(3)]
+        for shape in (shapes[0], shapes[1], shapes[0], shapes[2]):
+            cache.solve(shape, 5, partial(enumerate_component, shape, 100, 1e18))
+        self.assertEqual(len(cache), 2)
+        misses = cache.misses
+        cache.solve(shapes[0], 5, partial(enumerate_component, shapes[0], 100, 1e18))
+        self.assertEqual(cache.misses, misses)
+        cache.solve(shapes[1], 5, partial(enumerate_component, shapes[1], 100, 1e18))
+        self.assertEqual(cache.misses, misses + 1)
+
+    def test_persistence(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "solutions.json")
+            cache = SolutionCache(path=path)
+            self.assertEqual(len(cache), 0)
+            cache.solve(ROW, 10, lambda: enumerate_component(ROW, 1000, perf_counter() + 1))
+            cache.save()
+            loaded = SolutionCache(path=path)
+        self.assertEqual(len(loaded), 1)
+        solution = loaded.solve(COLUMN, 7, lambda: self.fail("the shape should be loaded"))
+        self.assertEqual(solution.totals, {2: 2})
+        with self.assertRaises(ValueError):
+            SolutionCache().save()
+
+    def test_solver_with_cache(self) -> None:
+        constraints = [*ROW, ((20, 21), 1)]
+        plain = ConstraintSolver().solve(constraints, 5, 30)
+        cache = SolutionCache()
+        solver = ConstraintSolver(cache=cache)
+        self.assertEqual(solver.solve(constraints, 5, 30, width=10), plain)
+        self.assertEqual(solver.solve(constraints, 5, 30, width=10), plain)
+        self.assertEqual((len(cache), cache.hits), (2, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+from time import perf_counter
+
+from src.core.solver import (
+    BudgetExceededError,
+    ComponentSolution,
+    ConstraintSolver,
+    approximate_component,
+    combine,
+    deduce,
+    enumerate_component,
+    split_components,
+)
+
+
+class TestSolver(unittest.TestCase):
+    def test_deduce_single_point(self) -> None:
+        safe, mines = deduce([((0, 1), 0), ((2, 3), 2)])
+        self.assertEqual(safe, {0, 1})
+        self.assertEqual(mines, {2, 3})
+
+    def test_deduce_subset(self) -> None:
+        # the 1 covers two of the 2's cells, so the 2's own cell is a mine
+        safe, mines = deduce([((0, 1), 1), ((0, 1, 2), 2)])
+        self.assertEqual(safe, set())
+        self.assertEqual(mines, {2})
+
+    def test_deduce_overlap(self) -> None:
+        # a 1-2 pattern along a wall: the 2's own cell is a mine and the 1's own cell is safe
+        safe, mines = deduce([((0, 1, 2), 1), ((1, 2, 3), 2)])
+        self.assertEqual(safe, {0})
+        self.assertEqual(mines, {3})
+
+    def test_deduce_chain(self) -> None:
+        # each deduction reduces the next constraint until the whole line is solved
+        safe, mines = deduce([((0,), 1), ((0, 1), 1), ((1, 2), 1), ((2, 3), 1)])
+        self.assertEqual(safe, {1, 3})
+        self.assertEqual(mines, {0, 2})
+
+    def test_deduce_needs_guess(self) -> None:
+        self.assertEqual(deduce([((0, 1), 1)]), (set(), set()))
+
+    def test_split_components(self) -> None:
+        constraints = [((1, 2), 1), ((2, 3), 1), ((7, 8), 1), ((), 0)]
+        components = split_components(constraints)
+        self.assertEqual(len(components), 2)
+        self.assertIn([((1, 2), 1), ((2, 3), 1)], components)
+        self.assertIn([((7, 8), 1)], components)
+
+    def test_enumerate_component(self) -> None:
+        # a 1-2-2-1 pattern along a wall: the mines are under the two 2s
+        constraints = [((0, 1), 1), ((0, 1, 2), 2), ((1, 2, 3), 2), ((2, 3), 1)]
+        solution = enumerate_component(constraints, 1000, perf_counter() + 1.0)
+        self.assertEqual(solution.totals, {2: 1})
+        counts = dict(zip(solution.cells, solution.cell_counts[2]))
+        self.assertEqual(counts, {0: 0, 1: 1, 2: 1, 3: 0})
+
+    def test_enumerate_component_budget(self) -> None:
+        with self.assertRaises(BudgetExceededError):
+            enumerate_component([((0, 1), 1), ((1, 2), 1)], 1, perf_counter() + 1.0)
+        # twenty interchangeable cells are counted as a single group
+        solution = enumerate_component([(tuple(range(20)), 10)], 100, perf_counter() + 1.0)
+        self.assertEqual(solution.totals, {10: 184756})
+
+    def test_approximate_component(self) -> None:
+        solution = approximate_component([((0, 1), 1), ((1, 2, 3), 3)])
+        probabilities = dict(zip(solution.cells, solution.cell_counts[3]))
+        self.assertEqual(probabilities[0], 0.5)
+        self.assertEqual(probabilities[1], 0.75)
+        self.assertEqual(probabilities[3], 1.0)
+
+    def test_solve_with_interior(self) -> None:
+        solver = ConstraintSolver()
+        # one mine among two cells, one mine left among two interior cells
+        probabilities, interior = solver.solve([((0, 1), 1)], 2, 2)
+        self.assertAlmostEqual(probabilities[0], 0.5)
+        self.assertAlmostEqual(interior or 0.0, 0.5)
+
+        # the global mine count decides between a one or two mine layout
+        probabilities, interior = solver.solve([((0, 1, 2), 1), ((2, 3, 4), 1)], 1, 0)
+        self.assertAlmostEqual(probabilities[2], 1.0)
+        self.assertAlmostEqual(probabilities[0], 0.0)
+        self.assertIsNone(interior)
+
+    def test_solve_inconsistent(self) -> None:
+        probabilities, interior = ConstraintSolver().solve([((0, 1), 1)], 0, 4)
+        self.assertAlmostEqual(probabilities[0], 0.5)
+        self.assertEqual(interior, 0.0)
+
+    def test_combine_large_interior(self) -> None:
+        # binomials of the interior far beyond the float range
+        solution = ComponentSolution([0, 1], {1: 2}, {1: [1.0, 1.0]})
+        probabilities, interior = combine([solution], 150_000, 990_000)
+        self.assertAlmostEqual(probabilities[0], 0.5)
+        self.assertAlmostEqual(interior or 0.0, 149_999 / 990_000)
+
+        # many components, where the interior weights vary by thousands of orders of magnitude
+        constraints = [((3 * i, 3 * i + 1, 3 * i + 2), 1) for i in range(300)]
+        probabilities, interior = ConstraintSolver().solve(constraints, 150_000, 990_000)
+        self.assertAlmostEqual(probabilities[0], 1 / 3)
+        self.assertAlmostEqual(interior or 0.0, 149_700 / 990_000)
+
+    def test_combine_matches_exact_weights(self) -> None:
+        first = ComponentSolution([0, 1], {0: 1, 1: 2, 2: 1}, {1: [1.0, 1.0], 2: [1.0, 1.0]})
+        second = ComponentSolution([2], {0: 1, 1: 1}, {1: [1.0]})
+        probabilities, interior = combine([first, second], 3, 4)
+        # weights by frontier mines m: ways(m) * comb(4, 3 - m)
+        weights = {0: 1 * 4, 1: 3 * 6, 2: 3 * 4, 3: 1 * 1}
+        total = sum(weights.values())
+        # the single cell holds a mine in one way for each count of the pair
+        self.assertAlmostEqual(probabilities[2], (6 + 2 * 4 + 1) / total)
+        expected = sum(weight * (3 - mines) for mines, weight in weights.items()) / total
+        self.assertAlmostEqual(interior or 0.0, expected / 4)
+
+    def test_combine_past_deadline(self) -> None:
+        solution = ComponentSolution([0, 1], {0: 1, 1: 2}, {1: [1.0, 1.0]})
+        probabilities, interior = combine([solution], 1, 10, deadline=perf_counter() - 1)
+        # the local estimate ignores the interior
+        self.assertAlmostEqual(probabilities[0], 1 / 3)
+        self.assertAlmostEqual(interior or 0.0, 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from src.core.tournament import (
+    available_players,
+    format_reports,
+    game_seeds,
+    percentile,
+    play_game,
+    run_tournament,
+)
+
+
+class TestTournament(unittest.TestCase):
+    def test_available_players(self) -> None:
+        players = available_players()
+        self.assertIn("RandomPlayer", players)
+        self.assertIn("ProbaPlayer", players)
+        self.assertIn("SolverPlayer", players)
+        self.assertNotIn("HumanPlayer", players)
+        self.assertNotIn("FrontierPlayer", players)
+
+    def test_play_game_is_reproducible(self) -> None:
+        first = play_game("SolverPlayer", 9, 9, 10, seeds=(7, 8))
+        second = play_game("SolverPlayer", 9, 9, 10, seeds=(7, 8))
+        self.assertEqual(first.won, second.won)
+        self.assertEqual(first.moves, second.moves)
+        self.assertGreater(first.moves, 0)
+        self.assertEqual(len(first.move_times), len(second.move_times))
+        # one latency sample per applied move, whatever the size of the batches
+        self.assertEqual(len(first.move_times), first.moves)
+
+    def test_play_game_safe_first_click(self) -> None:
+        # the first reveal of a full 3x3 board with room for one safe square wins at once
+        result = play_game("RandomPlayer", 3, 3, 8, seeds=(1, 2), first_click="cell")
+        self.assertTrue(result.won)
+        self.assertEqual(result.moves, 1)
+        self.assertEqual(len(result.move_times), 1)
+
+    def test_game_seeds(self) -> None:
+        seeds = game_seeds(3, 5)
+        self.assertEqual(seeds, game_seeds(3, 5))
+        self.assertEqual(len(set(seeds)), 5)
+        self.assertNotEqual(seeds, game_seeds(4, 5))
+
+    def test_percentile(self) -> None:
+        values = [float(value) for value in range(1, 101)]
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertEqual(percentile(values, 100), 100.0)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_run_tournament(self) -> None:
+        reports = run_tournament(["RandomPlayer", "ProbaPlayer"], 5, 5, 3, games=4, workers=1)
+        self.assertEqual([report.player for report in reports], ["RandomPlayer", "ProbaPlayer"])
+        for report in reports:
+            self.assertEqual(report.games, 4)
+            self.assertTrue(0.0 <= report.win_rate <= 1.0)
+        self.assertIn("ProbaPlayer", format_reports(reports))
+
+
+if __name__ == "__main__":
+    unittest.main()
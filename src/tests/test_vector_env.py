@@ -0,0 +1,82 @@
+import unittest
+
+import numpy as np
+
+from src.core.game_logic import GameLogic
+from src.core.observation import STATE_UNKNOWN
+from src.core.player import HumanPlayer
+from src.core.vector_env import LOST, PLAYING, WON, VectorEnv, dilate
+
+
+class TestVectorEnv(unittest.TestCase):
+    def test_layouts(self) -> None:
+        env = VectorEnv(50, 9, 7, 12, seed=1)
+        self.assertEqual(env.mines.shape, (50, 7, 9))
+        self.assertTrue(np.all(env.mines.sum(axis=(1, 2)) == 12))
+        self.assertTrue(np.all(env.states() == STATE_UNKNOWN))
+        self.assertTrue(np.all(env.outcome == PLAYING))
+
+    def test_dilate(self) -> None:
+        mask = np.zeros((1, 4, 4), dtype=bool)
+        mask[0, 0, 0] = True
+        self.assertEqual(dilate(mask).sum(), 4)
+
+    def test_matches_game_logic(self) -> None:
+        """Every game of the batch plays exactly like GameLogic on the same layout."""
+        env = VectorEnv(40, 10, 8, 10, seed=3, auto_reset=False)
+        games = [
+            GameLogic(
+                width=10,
+                height=8,
+                mine_count=10,
+                player=HumanPlayer(name="P"),
+                mines=np.flatnonzero(env.mines[game]),
+            )
+            for game in range(env.games)
+        ]
+        rng = np.random.default_rng(4)
+        for _ in range(30):
+            actions = rng.integers(0, 2 * env.size, env.games)
+            states, rewards, done = env.step(actions)
+            for game, game_logic in enumerate(games):
+                if not game_logic.is_game_over():
+                    index = actions[game] % env.size
+                    action = "flag" if actions[game] >= env.size else "reveal"
+                    game_logic.make_move(*game_logic.board.position(index), action)
+                    self.assertEqual(done[game], game_logic.is_game_over())
+                    if done[game]:
+                        self.assertEqual(rewards[game], 1.0 if game_logic.is_game_won() else -1.0)
+                np.testing.assert_array_equal(states[game], game_logic.observation.state())
+                outcome = PLAYING
+                if game_logic.is_game_over():
+                    outcome = WON if game_logic.is_game_won() else LOST
+                self.assertEqual(env.outcome[game], outcome)
+
+    def test_auto_reset(self) -> None:
+        env = VectorEnv(5, 4, 4, 15, seed=2)
+        # the only safe square of each game wins it
+        safe = np.argmin(env.mines.reshape(5, -1), axis=1)
+        states, rewards, done = env.step(safe)
+        self.assertTrue(np.all(done))
+        self.assertTrue(np.all(rewards == 1.0))
+        self.assertTrue(np.all(states == STATE_UNKNOWN))
+        self.assertTrue(np.all(env.outcome == PLAYING))
+
+    def test_encode(self) -> None:
+        env = VectorEnv(3, 6, 5, 4, seed=0)
+        self.assertEqual(env.encode().shape, (3, 11, 5, 6))
+        with self.assertRaises(ValueError):
+            env.step(np.zeros(2, dtype=int))
+
+    def test_actions_out_of_range(self) -> None:
+        env = VectorEnv(2, 5, 5, 3, seed=0)
+        for actions in ([0, -1], [0, 2 * env.size]):
+            with self.assertRaises(ValueError):
+                env.step(np.array(actions))
+        self.assertFalse(env.revealed.any() or env.flagged.any())
+        env.step(np.array([0, 2 * env.size - 1]))
+        self.assertTrue(env.flagged[1, 4, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,29 @@
+import shutil
+import sys
+from typing import Iterable, Optional, Set, TextIO, Tuple
+
+from src.core.change_set import ChangeSet
 from src.core.game_logic import GameLogic
 from src.ui.colors import bg, fg
 
 
 class ConsoleUI:
-    def __init__(self, in_game_logic: GameLogic) -> None:
-        """Initialize the console UI with the game logic."""
+    """
+    Console user interface for the Minesweeper game.
+    Every frame is built in memory and written in one call. In an interactive terminal, once the
+    board has been drawn, only the cells changed since are rewritten in place with cursor
+    movements. Quiet mode draws no board at all, for bot runs.
+    """
+
+    def __init__(
+        self,
+        in_game_logic: GameLogic,
+        output: Optional[TextIO] = None,
+        quiet: bool = False,
+        incremental: Optional[bool] = None,
+    ) -> None:
+        """Initialize the console UI with the game logic.
+        incremental defaults to whether the output is an interactive terminal."""
         self.game_logic = in_game_logic
         self.__color_per_char = {
             "0": fg.green,
@@ -17,63 +36,126 @@ class ConsoleUI:
             "7": fg.pink,
             "8": fg.lightgrey,
         }
+        self.__output = output if output is not None else sys.stdout
+        self.quiet = quiet
+        self.incremental = self.__output.isatty() if incremental is None else incremental
+        self.__dirty: Set[Tuple[int, int]] = set()
+        self.__drawn = False
+        # lines written below the board since it was drawn
+        self.__lines_below = 0
+        self.game_logic.subscribe(self.on_changes)
 
     def start_game(self) -> None:
         """Start the game and handle user input."""
-        print(f"Welcome to Minesweeper, {self.game_logic.player.name}!")
+        self.write_line(f"Welcome to Minesweeper, {self.game_logic.player.name}!")
         while not self.game_logic.is_game_over():
             self.display_board()
-            action = self.game_logic.player.make_move(self.game_logic.board)
-            if action is None:
-                action_input = input("Enter your move (x y action): ").strip().split()
-                action = (int(action_input[0]), int(action_input[1]), action_input[2])
+            moves = self.game_logic.player.make_moves(self.game_logic.observation)
+            if moves:
+                self.game_logic.make_moves(moves)
+                continue
+
+            action_input = input("Enter your move (x y action): ").strip().split()
+            # the prompt and the echoed input
+            self.__lines_below += 1
+            action = tuple(action_input)
             if len(action) == 2:
                 action = (action[0], action[1], "reveal")
             if len(action) != 3:
-                print("Invalid input. Please enter in the format: x y action")
+                self.write_line("Invalid input. Please enter in the format: x y action")
                 continue
 
             try:
                 x, y = int(action[0]), int(action[1])
                 action_type = action[2].lower()
                 if not self.game_logic.make_move(x, y, action_type):
-                    print("Invalid move. Try again.")
+                    self.write_line("Invalid move. Try again.")
             except ValueError:
-                print("Invalid coordinates. Please enter integers for x and y.")
+                self.write_line("Invalid coordinates. Please enter integers for x and y.")
 
         self.display_board()
         self.display_result()
 
-    def display_board(self) -> None:
-        """Display the current state of the board."""
+    def write_line(self, text: str) -> None:
+        self.__output.write(text + "\n")
+        self.__output.flush()
+        self.__lines_below += text.count("\n") + 1
+
+    def on_changes(self, changes: ChangeSet) -> None:
+        """Follow the game from the changes it publishes."""
+        self.mark_dirty(changes.revealed | changes.flagged)
+
+    def mark_dirty(self, cells: Iterable[Tuple[int, int]]) -> None:
+        """Remember cells that changed, to be rewritten by the next incremental display."""
+        self.__dirty.update(cells)
+
+    def cell_text(self, x: int, y: int) -> str:
+        """The colored character showing the cell at (x, y)."""
+        cell = self.game_logic.board.get_cell(x, y)
+        if cell.is_revealed():
+            if cell.is_mine():
+                return bg.red + "M" + bg.res
+            return (
+                self.__color_per_char.get(str(cell.adjacent_mines), "")
+                + str(cell.adjacent_mines)
+                + fg.res
+            )
+        if cell.is_flagged():
+            return bg.orange + fg.bold + "F" + bg.res + fg.res
+        return bg.blue + "?" + bg.res
+
+    def render_board(self) -> str:
+        """The whole board as one string."""
         board = self.game_logic.board
-        print("\nCurrent Board:\n" + "-" * (board.width * 2 + 3))
-        for row in board.cells:
-            print("| ", end="")
-            for cell in row:
-                if cell.is_revealed():
-                    if cell.is_mine():
-                        print(bg.red + "M" + bg.res, end=" ")
-                    else:
-                        print(
-                            self.__color_per_char.get(str(cell.adjacent_mines), "")
-                            + str(cell.adjacent_mines)
-                            + fg.res,
-                            end=" ",
-                        )
-                elif cell.is_flagged():
-                    print(bg.orange + fg.bold + "F" + bg.res + fg.res, end=" ")
-                else:
-                    print(bg.blue + "?" + bg.res, end=" ")
-            print("|")
-        print("-" * (board.width * 2 + 3))
+        border = "-" * (board.width * 2 + 3)
+        lines = ["", "Current Board:", border]
+        for y in range(board.height):
+            cells = " ".join(self.cell_text(x, y) for x in range(board.width))
+            lines.append(f"| {cells} |")
+        lines.append(border)
+        return "\n".join(lines) + "\n"
+
+    def render_changes(self) -> str:
+        """
+        Cursor movements rewriting the dirty cells in place, the cursor is saved and restored
+        around them so the output goes on below the board.
+        """
+        height = self.game_logic.board.height
+        updates = ["\0337"]
+        for x, y in sorted(self.__dirty):
+            # the bottom border is one line above the lines written below the board
+            up = self.__lines_below + height - y + 1
+            updates.append(f"\0338\033[{up}A\033[{2 * x + 3}G{self.cell_text(x, y)}")
+        updates.append("\0338")
+        return "".join(updates)
+
+    def display_board(self) -> None:
+        """Display the current state of the board, only its changes when possible."""
+        if self.quiet:
+            self.__dirty.clear()
+            return
+        board_lines = self.game_logic.board.height + 2
+        in_place = (
+            self.incremental
+            and self.__drawn
+            and self.__lines_below + board_lines < shutil.get_terminal_size().lines
+        )
+        if in_place:
+            frame = self.render_changes() if self.__dirty else ""
+        else:
+            frame = self.render_board()
+            self.__drawn = True
+            self.__lines_below = 0
+        self.__dirty.clear()
+        self.__output.write(frame)
+        self.__output.flush()
 
     def display_result(self) -> None:
         """Display the result of the game."""
         if self.game_logic.is_game_won():
-            print(f"Congratulations {self.game_logic.player.name}, you won!")
+            self.write_line(f"Congratulations {self.game_logic.player.name}, you won!")
         else:
-            print(f"Game over! Better luck next time, {self.game_logic.player.name}.")
+            self.write_line(f"Game over! Better luck next time, {self.game_logic.player.name}.")
 
 
 # Example usage:
@@ -4,11 +4,204 @@ It includes a PygameBoard class for rendering the game board and a GraphicalUI c
 """
 
 from math import floor
+from typing import Any, Dict, Iterable, Optional, Set
 
+import numpy as np
 import pygame
 
 from src.core.board import Board
+from src.core.change_set import ChangeSet
 from src.core.game_logic import GameLogic
+from src.core.observation import STATE_FLAGGED, STATE_MINE, STATE_UNKNOWN
+
+# the window never grows past this size, larger boards are scrolled
+MAX_VIEW_SIZE = (1280, 720)
+# zoom bounds and step, in pixels per cell
+MIN_PIXELS_PER_UNIT = 1
+MAX_PIXELS_PER_UNIT = 64
+ZOOM_FACTOR = 1.25
+# below this size the text of the tiles is unreadable and the board is drawn as a minimap
+MIN_TILE_PIXELS = 8
+SCROLL_KEYS = {
+    pygame.K_LEFT: (-100, 0),
+    pygame.K_RIGHT: (100, 0),
+    pygame.K_UP: (0, -100),
+    pygame.K_DOWN: (0, 100),
+}
+
+
+class TileAtlas:
+    """
+    Pre-rendered cell tiles, one surface per state: hidden, flagged, mine and 0 to 8 adjacent
+    mines. The tiles of a size are rendered once, the first time they are needed, so drawing a
+    cell is a single blit instead of a font lookup and a text rendering.
+    """
+
+    def __init__(self, case_percentage: int, colors: dict) -> None:
+        self.__case_percentage = case_percentage
+        self.__colors = colors
+        self.__tiles: Dict[int, Dict[str, pygame.Surface]] = {}
+        self.__palette: Optional[np.ndarray] = None
+
+    @property
+    def case_percentage(self) -> int:
+        return self.__case_percentage
+
+    @property
+    def palette(self) -> np.ndarray:
+        """
+        One RGB color per minimap state: 0 to 8 adjacent mines, then hidden, flagged and mine.
+        Flags are shown as a darker hidden color.
+        """
+        if self.__palette is None:
+            hidden = self.__colors["hidden"]
+            self.__palette = np.array(
+                [
+                    *self.__colors["empty"],
+                    hidden,
+                    tuple(channel // 2 for channel in hidden),
+                    self.__colors["mine"],
+                ],
+                dtype=np.uint8,
+            )
+        return self.__palette
+
+    def tiles(self, pixels_per_unit: int) -> Dict[str, pygame.Surface]:
+        """The tiles of pixels_per_unit pixels wide cells, by name."""
+        if pixels_per_unit not in self.__tiles:
+            self.__tiles[pixels_per_unit] = self.build_tiles(pixels_per_unit)
+        return self.__tiles[pixels_per_unit]
+
+    def build_tiles(self, pixels_per_unit: int) -> Dict[str, pygame.Surface]:
+        # one font per size, shared by every tile
+        font = pygame.font.SysFont("didot.ttc", pixels_per_unit)
+        tiles = {
+            "hidden": self.render_tile(pixels_per_unit, font, self.__colors["hidden"], ""),
+            "flagged": self.render_tile(pixels_per_unit, font, self.__colors["hidden"], "+"),
+            "mine": self.render_tile(pixels_per_unit, font, self.__colors["mine"], "X"),
+        }
+        for adjacent_mines, color in enumerate(self.__colors["empty"]):
+            tiles[str(adjacent_mines)] = self.render_tile(
+                pixels_per_unit, font, color, str(adjacent_mines)
+            )
+        return tiles
+
+    def render_tile(
+        self,
+        pixels_per_unit: int,
+        font: pygame.font.Font,
+        color: tuple[int, int, int],
+        text: str,
+    ) -> pygame.Surface:
+        """Draw a cell square of the given color with its centered text on a new surface."""
+        tile = pygame.Surface((pixels_per_unit, pixels_per_unit))
+        tile.fill(self.__colors["bg"])
+        pixel_margin = round((100 - self.__case_percentage) * pixels_per_unit / 100)
+        pygame.draw.rect(
+            surface=tile,
+            rect=(
+                (pixel_margin // 2, pixel_margin // 2),
+                (pixels_per_unit - pixel_margin, pixels_per_unit - pixel_margin),
+            ),
+            color=color,
+        )
+        if text:
+            text_surface = font.render(text, True, (0, 0, 0))
+            text_rect = text_surface.get_rect()
+            text_rect.center = (pixels_per_unit // 2, pixels_per_unit // 2)
+            tile.blit(text_surface, text_rect)
+        return tile
+
+
+class Viewport:
+    """
+    The part of the board shown in the window: a fixed size in pixels, the zoom as the number
+    of pixels per cell and the scroll offset, in pixels, of the view over the whole board.
+    """
+
+    def __init__(
+        self, dimension: tuple[int, int], size: tuple[int, int], pixels_per_unit: int
+    ) -> None:
+        self.__dimension = dimension
+        self.__size = size
+        self.__pixels_per_unit = pixels_per_unit
+        self.__offset = (0, 0)
+
+    def __repr__(self) -> str:
+        return (
+            f"Viewport(size={self.__size}, pixels_per_unit={self.__pixels_per_unit}, "
+            f"offset={self.__offset})"
+        )
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.__size
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """The rectangle of the window the board is drawn in."""
+        return pygame.Rect((0, 0), self.__size)
+
+    @property
+    def pixels_per_unit(self) -> int:
+        return self.__pixels_per_unit
+
+    @pixels_per_unit.setter
+    def pixels_per_unit(self, pixels_per_unit: int) -> None:
+        self.__pixels_per_unit = max(MIN_PIXELS_PER_UNIT, min(MAX_PIXELS_PER_UNIT, pixels_per_unit))
+        self.scroll(0, 0)
+
+    @property
+    def offset(self) -> tuple[int, int]:
+        return self.__offset
+
+    def pixel2pos(self, pix_pos: tuple[int, int]) -> tuple[int, int]:
+        return (
+            floor((pix_pos[0] + self.__offset[0]) / self.__pixels_per_unit),
+            floor((pix_pos[1] + self.__offset[1]) / self.__pixels_per_unit),
+        )
+
+    def pos2pixel(self, pos: tuple[int, int]) -> tuple[int, int]:
+        return (
+            pos[0] * self.__pixels_per_unit - self.__offset[0],
+            pos[1] * self.__pixels_per_unit - self.__offset[1],
+        )
+
+    def visible_cells(self) -> tuple[int, int, int, int]:
+        """Bounds x0, y0, x1, y1 (excluded) of the cells at least partly in view."""
+        x0, y0 = self.pixel2pos((0, 0))
+        x1, y1 = self.pixel2pos((self.__size[0] - 1, self.__size[1] - 1))
+        return x0, y0, min(self.__dimension[0], x1 + 1), min(self.__dimension[1], y1 + 1)
+
+    def is_visible(self, pos: tuple[int, int]) -> bool:
+        x0, y0, x1, y1 = self.visible_cells()
+        return x0 <= pos[0] < x1 and y0 <= pos[1] < y1
+
+    def scroll(self, pixels_x: int, pixels_y: int) -> None:
+        """Move the view by some pixels, without leaving the board."""
+        max_x = max(0, self.__dimension[0] * self.__pixels_per_unit - self.__size[0])
+        max_y = max(0, self.__dimension[1] * self.__pixels_per_unit - self.__size[1])
+        self.__offset = (
+            max(0, min(max_x, self.__offset[0] + pixels_x)),
+            max(0, min(max_y, self.__offset[1] + pixels_y)),
+        )
+
+    def zoom(self, steps: int, anchor: tuple[int, int]) -> None:
+        """Zoom in, or out for negative steps, keeping the board point under anchor in place."""
+        pixels_per_unit = self.__pixels_per_unit
+        for _ in range(abs(steps)):
+            if steps > 0:
+                pixels_per_unit = max(pixels_per_unit + 1, round(pixels_per_unit * ZOOM_FACTOR))
+            else:
+                pixels_per_unit = min(pixels_per_unit - 1, round(pixels_per_unit / ZOOM_FACTOR))
+        board_x = (anchor[0] + self.__offset[0]) / self.__pixels_per_unit
+        board_y = (anchor[1] + self.__offset[1]) / self.__pixels_per_unit
+        self.__pixels_per_unit = max(MIN_PIXELS_PER_UNIT, min(MAX_PIXELS_PER_UNIT, pixels_per_unit))
+        self.__offset = (
+            round(board_x * self.__pixels_per_unit) - anchor[0],
+            round(board_y * self.__pixels_per_unit) - anchor[1],
+        )
+        self.scroll(0, 0)
 
 
 class PygameBoard:
@@ -36,60 +229,83 @@ class PygameBoard:
     ) -> None:
         self.progress = 0.0
         self.drop_down = 50
-        self.case_percentage = case_percentage
         self.dimension = dimension
-        self.pixel_dimension = (
-            dimension[0] * pixels_per_unit,
-            dimension[1] * pixels_per_unit + self.drop_down,
+        # the window fits the board up to MAX_VIEW_SIZE, larger boards are scrolled
+        self.__viewport = Viewport(
+            dimension,
+            (
+                min(MAX_VIEW_SIZE[0], dimension[0] * pixels_per_unit),
+                min(MAX_VIEW_SIZE[1], dimension[1] * pixels_per_unit),
+            ),
+            pixels_per_unit,
         )
-        self.pixels_per_unit = pixels_per_unit
-        self.screen = pygame.display.set_mode(self.pixel_dimension)
-        self.progress = 0.0
-        self.drop_down = 50
-        self.case_percentage = case_percentage
-        self.dimension = dimension
         self.pixel_dimension = (
-            dimension[0] * pixels_per_unit,
-            dimension[1] * pixels_per_unit + self.drop_down,
+            self.__viewport.size[0],
+            self.__viewport.size[1] + self.drop_down,
         )
-        self.pixels_per_unit = pixels_per_unit
         self.screen = pygame.display.set_mode(self.pixel_dimension)
-        self.colors = {
+        self.colors: Dict[str, Any] = {
             "bg": bg_color,
             "hidden": hidden_color,
             "empty": empty_color,
             "mine": mine_color,
             "progress": progress_color,
         }
+        self.__atlas = TileAtlas(case_percentage, self.colors)
+        self.__dirty: Set[tuple[int, int]] = set()
+        self.__drawn_progress = self.progress
         pygame.display.set_caption(name)
         self.display(Board(width=dimension[0], height=dimension[1]))
 
+    @property
+    def viewport(self) -> Viewport:
+        return self.__viewport
+
+    @property
+    def pixels_per_unit(self) -> int:
+        return self.__viewport.pixels_per_unit
+
+    @pixels_per_unit.setter
+    def pixels_per_unit(self, pixels_per_unit: int) -> None:
+        self.__viewport.pixels_per_unit = pixels_per_unit
+
+    @property
+    def minimap(self) -> bool:
+        """Whether the cells are too small for tiles and the board is drawn as a minimap."""
+        return self.pixels_per_unit < MIN_TILE_PIXELS
+
     def pixel2pos(self, pix_pos: tuple[int, int]) -> tuple[int, int]:
         """Return the position from a pixel position"""
-        return (floor(pix_pos[0] / self.pixels_per_unit), floor(pix_pos[1] / self.pixels_per_unit))
+        return self.__viewport.pixel2pos(pix_pos)
 
     def pos2pixel(self, pos: tuple[int, int]) -> tuple[int, int]:
         """Return the pixel position of a position"""
-        return (pos[0] * self.pixels_per_unit, pos[1] * self.pixels_per_unit)
-
-    def draw_rectangle(self, pos: tuple[int, int], color=tuple[int, int, int]) -> None:
-        pixel_margin = round((100 - self.case_percentage) * self.pixels_per_unit / 100)
-        pixx, pixy = self.pos2pixel(pos)
-        pixx, pixy = pixx + pixel_margin // 2, pixy + pixel_margin // 2
-        pygame.draw.rect(
-            surface=self.screen,
-            rect=(
-                (pixx, pixy),
-                (self.pixels_per_unit - pixel_margin, self.pixels_per_unit - pixel_margin),
-            ),
-            color=color,
-        )
-
-    def draw_progress_bar(self, margin_x: float = 0.1, pixel_width: int = 3) -> None:
+        return self.__viewport.pos2pixel(pos)
+
+    def cell_at(self, pix_pos: tuple[int, int]) -> Optional[tuple[int, int]]:
+        """The position of the cell under a pixel of the window, None outside the board."""
+        if not self.__viewport.rect.collidepoint(pix_pos):
+            return None
+        pos = self.pixel2pos(pix_pos)
+        if not (0 <= pos[0] < self.dimension[0] and 0 <= pos[1] < self.dimension[1]):
+            return None
+        return pos
+
+    @property
+    def case_percentage(self) -> int:
+        return self.__atlas.case_percentage
+
+    @property
+    def tiles(self) -> Dict[str, pygame.Surface]:
+        """Pre-rendered cell tiles for the current pixels_per_unit."""
+        return self.__atlas.tiles(self.pixels_per_unit)
+
+    def draw_progress_bar(self, margin_x: float = 0.1, pixel_width: int = 3) -> pygame.Rect:
+        """Draw the progress bar and return the rectangle it covers."""
         pixel_margin_x = margin_x * self.pixel_dimension[0]
         top_left = (pixel_margin_x, self.pixel_dimension[1] - 2 * self.drop_down // 3)
         length = (self.pixel_dimension[0] - (2 * pixel_margin_x), self.drop_down // 3)
-        pygame.draw.rect(
+        frame = pygame.draw.rect(
             surface=self.screen,
             rect=(
                 (top_left[0] - pixel_width, top_left[1] - pixel_width),
@@ -103,46 +319,122 @@ class PygameBoard:
             rect=(top_left, (round(length[0] * self.progress), length[1])),
             color=self.colors["progress"],
         )
-
-    def write_text(self, text: str, pos: tuple[int, int], color: tuple[int, int, int]) -> None:
-        pixx, pixy = self.pos2pixel(pos)
-        pixx, pixy = pixx + self.pixels_per_unit // 2, pixy + self.pixels_per_unit // 2
-        font = pygame.font.SysFont("didot.ttc", self.pixels_per_unit)
-        surface = font.render(text, True, color)
-        rect = surface.get_rect()
-        rect.center = (pixx, pixy)
-        self.screen.blit(surface, rect)
+        return frame
+
+    @staticmethod
+    def tile_key(board: Board, pos: tuple[int, int]) -> str:
+        """Name of the tile showing the cell at pos."""
+        c_case = board.get_cell(*pos)
+        if not c_case.is_revealed():
+            return "flagged" if c_case.is_flagged() else "hidden"
+        if c_case.is_mine():
+            return "mine"
+        return str(c_case.adjacent_mines)
+
+    def draw_cell(self, board: Board, pos: tuple[int, int]) -> pygame.Rect:
+        """Blit the cached tile of one cell and return the rectangle it covers."""
+        rect = pygame.Rect(self.pos2pixel(pos), (self.pixels_per_unit, self.pixels_per_unit))
+        # cells cut by the edge of the view must not spill over the progress bar
+        self.screen.set_clip(self.__viewport.rect)
+        self.screen.blit(self.tiles[self.tile_key(board, pos)], rect)
+        self.screen.set_clip(None)
+        return rect.clip(self.__viewport.rect)
+
+    def draw_minimap(self, board: Board) -> pygame.Rect:
+        """
+        Draw the visible cells as one pixel each, colored through the palette straight from the
+        board storage, scaled up to the zoom. Return the rectangle of the view.
+        """
+        x0, y0, x1, y1 = self.__viewport.visible_cells()
+        shape = (board.height, board.width)
+        grid = board.grid
+        revealed = np.frombuffer(grid.revealed, dtype=np.uint8).reshape(shape)[y0:y1, x0:x1]
+        flagged = np.frombuffer(grid.flagged, dtype=np.uint8).reshape(shape)[y0:y1, x0:x1]
+        mines = np.frombuffer(grid.mines, dtype=np.uint8).reshape(shape)[y0:y1, x0:x1]
+        adjacent = np.frombuffer(grid.adjacent, dtype=np.uint8).reshape(shape)[y0:y1, x0:x1]
+        states = np.where(flagged, STATE_FLAGGED, STATE_UNKNOWN)
+        states = np.where(revealed, np.where(mines, STATE_MINE, adjacent), states)
+        # surfarray is indexed by x first
+        pixels = self.__atlas.palette[states].transpose(1, 0, 2)
+        surface = pygame.transform.scale(
+            pygame.surfarray.make_surface(pixels),
+            ((x1 - x0) * self.pixels_per_unit, (y1 - y0) * self.pixels_per_unit),
+        )
+        view = self.__viewport.rect
+        self.screen.fill(self.colors["bg"], view)
+        self.screen.set_clip(view)
+        self.screen.blit(surface, self.pos2pixel((x0, y0)))
+        self.screen.set_clip(None)
+        return view
+
+    def draw_view(self, board: Board) -> pygame.Rect:
+        """Draw every visible cell and return the rectangle of the view."""
+        if self.minimap:
+            return self.draw_minimap(board)
+        view = self.__viewport.rect
+        self.screen.fill(self.colors["bg"], view)
+        x0, y0, x1, y1 = self.__viewport.visible_cells()
+        for x in range(x0, x1):
+            for y in range(y0, y1):
+                self.draw_cell(board, (x, y))
+        return view
+
+    def mark_dirty(self, cells: Iterable[tuple[int, int]]) -> None:
+        """Remember cells that changed, to be redrawn by the next render."""
+        self.__dirty.update(cells)
+
+    def render(self, board: Board) -> None:
+        """
+        Redraw only the visible cells marked dirty since the last frame, plus the progress bar,
+        and push just those rectangles to the display. Zoomed out to a minimap, the whole view is
+        redrawn at once.
+        """
+        if not self.__dirty and self.progress == self.__drawn_progress:
+            return
+        if self.minimap:
+            rects = [self.draw_minimap(board)] if self.__dirty else []
+        else:
+            rects = [
+                self.draw_cell(board, pos)
+                for pos in self.__dirty
+                if self.__viewport.is_visible(pos)
+            ]
+        rects.append(self.draw_progress_bar())
+        self.__dirty.clear()
+        self.__drawn_progress = self.progress
+        pygame.display.update(rects)
 
     def display(self, board: Board) -> None:
+        """Redraw the whole window, only the visible part of the board."""
         self.screen.fill(self.colors["bg"])
 
         self.draw_progress_bar()
+        self.draw_view(board)
 
-        for x in range(self.dimension[0]):
-            for y in range(self.dimension[1]):
-                c_case = board.get_cell(x, y)
-                if not c_case.is_revealed():
-                    color = self.colors["hidden"]
-                    if c_case.is_flagged():
-                        text = "+"
-                    else:
-                        text = ""
-                elif c_case.is_mine():
-                    color = self.colors["mine"]
-                    text = "X"
-                else:
-                    color = self.colors["empty"][c_case.adjacent_mines]
-                    text = str(c_case.adjacent_mines)
-                self.draw_rectangle(pos=(x, y), color=color)
-                self.write_text(text=text, pos=(x, y), color=(0, 0, 0))
-
+        self.__dirty.clear()
+        self.__drawn_progress = self.progress
         pygame.display.flip()
 
 
 class GraphicalUI:
-    """Graphical user interface for the Minesweeper game using Pygame."""
+    """
+    Graphical user interface for the Minesweeper game using Pygame.
+    Bots are not slowed down by the display: by default a frame is drawn every render_every moves
+    and the bot is held to max_fps frames per second so its game can be followed, while in fast
+    forward, toggled with the F key, the bot plays at full speed and a frame is drawn at most
+    every render_interval milliseconds. Human turns block on the next event instead of polling.
+    Boards larger than the window are scrolled with the arrow keys and zoomed with the mouse wheel
+    or the +/- keys.
+    """
 
-    def __init__(self, in_game_logic: GameLogic) -> None:
+    def __init__(
+        self,
+        in_game_logic: GameLogic,
+        max_fps: int = 30,
+        render_every: int = 1,
+        render_interval: int = 100,
+        fast_forward: bool = False,
+    ) -> None:
         """Initialize the graphical UI with the game logic."""
         pygame.init()
         self.game_logic = in_game_logic
@@ -151,45 +443,93 @@ class GraphicalUI:
             dimension=(in_game_logic.board.width, in_game_logic.board.height),
             pixels_per_unit=20,
         )
+        self.max_fps = max_fps
+        self.render_every = render_every
+        self.render_interval = render_interval
+        self.fast_forward = fast_forward
+        self.__clock = pygame.time.Clock()
+        self.__moves_since_frame = 0
+        self.__last_frame = 0
+        self.game_logic.subscribe(self.on_changes)
 
     def start_game(self) -> None:
         """Start the game and handle user input."""
         print(f"Welcome to Minesweeper, {self.game_logic.player.name}!")
         self.board.display(self.game_logic.board)
+        self.__last_frame = pygame.time.get_ticks()
 
         running = True
         while running:
-            action = self.game_logic.player.make_move(self.game_logic.board)
-            if action is None:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        running = False
-                    elif event.type == pygame.MOUSEBUTTONDOWN:
-                        pixel_pos = event.pos
-                        pos = self.board.pixel2pos(pix_pos=pixel_pos)
-                        if (
-                            pos[0] < self.game_logic.board.width
-                            and pos[1] < self.game_logic.board.height
-                        ):
-                            action = (pos[0], pos[1], "reveal")
-                            if event.button == 3:  # Right click
-                                action = (pos[0], pos[1], "flag")
-                            self.game_logic.make_move(*action)
+            moves = self.game_logic.player.make_moves(self.game_logic.observation)
+            if not moves:
+                # sleep until the player does something
+                running = self.handle_events([pygame.event.wait(), *pygame.event.get()], True)
             else:
-                self.game_logic.make_move(*action)
+                self.game_logic.make_moves(moves)
+                # keep the window responsive while the bot plays
+                running = self.handle_events(pygame.event.get(), False)
 
             if self.game_logic.is_game_over():
                 running = False
 
-            self.board.progress = (
-                self.game_logic.board.get_revealed_count()
-                + self.game_logic.board.get_flagged_count()
-            ) / (self.game_logic.board.width * self.game_logic.board.height)
-            self.board.display(self.game_logic.board)
-            self.board.draw_progress_bar()
+            if not moves or not running or self.frame_due():
+                self.draw_frame()
+                if moves and not self.fast_forward:
+                    self.__clock.tick(self.max_fps)
         # delay for a moment to show the final board state
         pygame.time.delay(1000)
 
+    def on_changes(self, changes: ChangeSet) -> None:
+        """Follow the game from the changes it publishes."""
+        self.board.mark_dirty(changes.revealed | changes.flagged)
+        self.__moves_since_frame += changes.applied_moves
+
+    def handle_events(self, events: Iterable[pygame.event.Event], human_turn: bool) -> bool:
+        """Apply the events, clicks only on a human turn. False once the window is closed."""
+        for event in events:
+            if event.type == pygame.QUIT:
+                return False
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_f:
+                self.fast_forward = not self.fast_forward
+            elif self.move_view(event):
+                self.board.display(self.game_logic.board)
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button in (1, 3) and human_turn:
+                pos = self.board.cell_at(event.pos)
+                if pos is not None:
+                    action = (pos[0], pos[1], "reveal")
+                    if event.button == 3:  # Right click
+                        action = (pos[0], pos[1], "flag")
+                    self.game_logic.make_move(*action)
+        return True
+
+    def move_view(self, event: pygame.event.Event) -> bool:
+        """Scroll with the arrow keys, zoom with the mouse wheel or +/-. True if the view moved."""
+        viewport = self.board.viewport
+        before = (viewport.offset, viewport.pixels_per_unit)
+        if event.type == pygame.MOUSEWHEEL:
+            viewport.zoom(event.y, pygame.mouse.get_pos())
+        elif event.type == pygame.KEYDOWN and event.key in SCROLL_KEYS:
+            viewport.scroll(*SCROLL_KEYS[event.key])
+        elif event.type == pygame.KEYDOWN and event.key in (pygame.K_PLUS, pygame.K_KP_PLUS):
+            viewport.zoom(1, viewport.rect.center)
+        elif event.type == pygame.KEYDOWN and event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            viewport.zoom(-1, viewport.rect.center)
+        return (viewport.offset, viewport.pixels_per_unit) != before
+
+    def frame_due(self) -> bool:
+        """Whether the moves played by the bot since the last frame should be drawn now."""
+        if self.fast_forward:
+            return pygame.time.get_ticks() - self.__last_frame >= self.render_interval
+        return self.__moves_since_frame >= self.render_every
+
+    def draw_frame(self) -> None:
+        self.board.progress = (
+            self.game_logic.board.get_revealed_count() + self.game_logic.board.get_flagged_count()
+        ) / (self.game_logic.board.width * self.game_logic.board.height)
+        self.board.render(self.game_logic.board)
+        self.__moves_since_frame = 0
+        self.__last_frame = pygame.time.get_ticks()
+
     def __del__(self) -> None:
         """Clean up resources when the UI is closed."""
         pygame.quit()